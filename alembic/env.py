@@ -75,6 +75,20 @@ for table in Base.metadata.tables.values():
     if table.name not in target_metadata.tables:
         table.tometadata(target_metadata)
 
+# Search columns and indexes created by the add_catalog_search migration are not
+# mapped on the models; keep autogenerate from dropping them
+SEARCH_SCHEMA_OBJECTS = {"search_vector"} | {
+    f"ix_{table}_{suffix}"
+    for table in ("dishes", "restaurants", "cuisines")
+    for suffix in ("search_vector", "name_trgm")
+}
+
+
+def include_object(_obj, name, _type, reflected, compare_to):
+    """Skip database objects that are managed outside the models."""
+    return not (reflected and compare_to is None and name in SEARCH_SCHEMA_OBJECTS)
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -109,6 +123,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -135,7 +150,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
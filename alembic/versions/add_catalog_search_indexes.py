@@ -0,0 +1,52 @@
+"""Add full-text and trigram search indexes to the catalog
+
+Revision ID: add_catalog_search
+Revises: add_recommendation_engine
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_catalog_search'
+down_revision: Union[str, None] = 'add_recommendation_engine'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables searched by app/services/search_service.py
+SEARCH_TABLES = ('dishes', 'restaurants', 'cuisines')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table in SEARCH_TABLES:
+        # Generated column: kept in sync by Postgres, never written by the app
+        op.execute(
+            f"""
+            ALTER TABLE {table} ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(description, '')), 'B')
+            ) STORED
+            """
+        )
+        op.execute(f'CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)')
+        # Serves substring (LIKE '%term%') and typo-tolerant (<%) name matches
+        op.execute(f'CREATE INDEX ix_{table}_name_trgm ON {table} USING gin (lower(name) gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in SEARCH_TABLES:
+        op.execute(f'DROP INDEX IF EXISTS ix_{table}_name_trgm')
+        op.execute(f'DROP INDEX IF EXISTS ix_{table}_search_vector')
+        op.execute(f'ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector')
@@ -0,0 +1,500 @@
+"""
+Offline evaluation and latency benchmark for the recommendation backends.
+
+Generates a synthetic catalog, users and interactions, holds out each user's
+most recent positive interactions, and runs the `/recommendations/dishes`
+scoring path (RecommendationService.recommend) for the rule-based and ML
+backends. Reports per-request latency percentiles, DB round-trips, peak
+allocations and ranking metrics (precision@k, recall@k, NDCG@k) against the
+held-out interactions.
+
+Run against a throwaway SQLite database (default):
+    python -m app.ai.benchmark --dishes 1000 10000 100000
+
+Or against a local Postgres seeded by seed_database.py, reusing its catalog
+(synthetic users and interactions are deleted afterwards):
+    python -m app.ai.benchmark --database-url postgresql://localhost/kyakhao --reuse-catalog
+
+Save results and fail (exit code 1) on regressions against a previous run:
+    python -m app.ai.benchmark --output results.json --baseline baseline.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.ai.ml_pipeline import MLModelTrainer, MLRecommendationEngine, POSITIVE_INTERACTIONS
+from app.ai.recommendation_engine import SPICE_LEVELS
+from app.core.database import merge_metadata
+from app.models.food import Cuisine, Dish, Restaurant, UserCuisineAssociation
+from app.models.recommendation import (
+    DietaryTag,
+    DishDietaryTagAssociation,
+    UserInteraction,
+    UserPreference,
+)
+from app.models.user import User
+from app.services.recommendation_service import ML_BACKEND, RULES_BACKEND, RecommendationService
+from sqlmodel import SQLModel
+
+BENCHMARK_EMAIL_DOMAIN = "benchmark.invalid"
+NEGATIVE_INTERACTIONS = ("click", "view")
+INSERT_BATCH_SIZE = 5_000
+
+# Metrics compared against --baseline: (name, higher_is_better)
+REGRESSION_METRICS = (
+    ("ndcg_at_k", True),
+    ("precision_at_k", True),
+    ("latency_p90_ms", False),
+    ("queries_per_request", False),
+)
+
+
+@dataclass
+class SyntheticData:
+    """Ids of generated rows plus the held-out ground truth."""
+    user_ids: List[uuid.UUID] = field(default_factory=list)
+    cuisine_ids: List[uuid.UUID] = field(default_factory=list)
+    restaurant_ids: List[uuid.UUID] = field(default_factory=list)
+    dish_ids: List[uuid.UUID] = field(default_factory=list)
+    tag_ids: List[uuid.UUID] = field(default_factory=list)
+    held_out: Dict[uuid.UUID, Set[uuid.UUID]] = field(default_factory=dict)
+    train_interactions: int = 0
+
+
+class QueryCounter:
+    """Counts statements sent to the database."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the recommendation backends.")
+    parser.add_argument(
+        "--dishes", type=int, nargs="+", default=[1_000], help="Catalog sizes to benchmark (e.g. 1000 10000 100000)"
+    )
+    parser.add_argument("--users", type=int, default=200, help="Synthetic users")
+    parser.add_argument("--interactions-per-user", type=int, default=40, help="Interactions per synthetic user")
+    parser.add_argument("--days", type=int, default=60, help="Days of simulated history")
+    parser.add_argument("--holdout-days", type=int, default=10, help="Most recent days held out for evaluation")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per backend")
+    parser.add_argument("-k", type=int, default=10, help="Recommendations per request / ranking cutoff")
+    parser.add_argument(
+        "--backends", nargs="+", choices=[RULES_BACKEND, ML_BACKEND], default=[RULES_BACKEND, ML_BACKEND]
+    )
+    parser.add_argument("--database-url", help="Database to run against (default: a temporary SQLite file)")
+    parser.add_argument(
+        "--reuse-catalog",
+        action="store_true",
+        help="Use the dishes already in the database instead of generating a catalog",
+    )
+    parser.add_argument("--keep-data", action="store_true", help="Do not delete the generated rows")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Results JSON of a previous run to compare against")
+    parser.add_argument(
+        "--max-regression", type=float, default=0.05, help="Allowed relative regression against the baseline"
+    )
+    return parser.parse_args()
+
+
+def async_database_url(url: str) -> str:
+    return url.replace("postgresql://", "postgresql+asyncpg://")
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+def precision_at_k(ranked: Sequence[uuid.UUID], relevant: Set[uuid.UUID], k: int) -> float:
+    return sum(1 for dish_id in ranked[:k] if dish_id in relevant) / k
+
+
+def recall_at_k(ranked: Sequence[uuid.UUID], relevant: Set[uuid.UUID], k: int) -> float:
+    return sum(1 for dish_id in ranked[:k] if dish_id in relevant) / len(relevant)
+
+
+def ndcg_at_k(ranked: Sequence[uuid.UUID], relevant: Set[uuid.UUID], k: int) -> float:
+    """Binary-relevance NDCG."""
+    dcg = sum(1.0 / math.log2(i + 2) for i, dish_id in enumerate(ranked[:k]) if dish_id in relevant)
+    ideal = sum(1.0 / math.log2(i + 2) for i in range(min(len(relevant), k)))
+    return dcg / ideal
+
+
+async def insert_rows(session: AsyncSession, table, rows: List[Dict]) -> None:
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        await session.execute(insert(table), rows[start:start + INSERT_BATCH_SIZE])
+
+
+def timestamps(now: datetime) -> Dict:
+    """Columns SQLModel tables only fill in through the ORM constructor."""
+    return {"created_at": now, "updated_at": now, "is_deleted": False}
+
+
+async def generate_catalog(session: AsyncSession, data: SyntheticData, n_dishes: int, rng, run_tag: str) -> None:
+    """Cuisines, restaurants, dietary tags and dishes with random attributes."""
+    data.cuisine_ids = [uuid.uuid4() for _ in range(20)]
+    data.tag_ids = [uuid.uuid4() for _ in range(8)]
+    data.restaurant_ids = [uuid.uuid4() for _ in range(max(1, n_dishes // 25))]
+    data.dish_ids = [uuid.uuid4() for _ in range(n_dishes)]
+
+    await insert_rows(session, Cuisine, [
+        {"id": cuisine_id, "name": f"Benchmark cuisine {i} {run_tag}"} for i, cuisine_id in enumerate(data.cuisine_ids)
+    ])
+    await insert_rows(session, DietaryTag, [
+        {"id": tag_id, "name": f"Benchmark tag {i} {run_tag}"} for i, tag_id in enumerate(data.tag_ids)
+    ])
+    await insert_rows(session, Restaurant, [
+        {"id": restaurant_id, "name": f"Benchmark restaurant {i}"}
+        for i, restaurant_id in enumerate(data.restaurant_ids)
+    ])
+
+    spice_choices = SPICE_LEVELS + [None]
+    await insert_rows(session, Dish, [
+        {
+            "id": dish_id,
+            "name": f"Benchmark dish {i}",
+            "restaurant_id": data.restaurant_ids[rng.integers(len(data.restaurant_ids))],
+            "cuisine_id": data.cuisine_ids[rng.integers(len(data.cuisine_ids))],
+            "price": round(float(rng.lognormal(2.5, 0.5)), 2) if rng.random() < 0.95 else None,
+            "rating": round(float(rng.uniform(1, 5)), 1) if rng.random() < 0.9 else None,
+            "spice_level": spice_choices[rng.integers(len(spice_choices))],
+            "is_featured": bool(rng.random() < 0.05),
+        }
+        for i, dish_id in enumerate(data.dish_ids)
+    ])
+    await insert_rows(session, DishDietaryTagAssociation, [
+        {"dish_id": dish_id, "dietary_tag_id": tag_id}
+        for dish_id in data.dish_ids
+        for tag_id in rng.choice(data.tag_ids, size=rng.integers(0, 3), replace=False)
+    ])
+
+
+async def load_catalog(session: AsyncSession, data: SyntheticData) -> None:
+    """Use the existing (e.g. seeded) catalog."""
+    data.dish_ids = list((await session.execute(select(Dish.id).where(Dish.is_deleted.is_(False)))).scalars())
+    data.cuisine_ids = list((await session.execute(select(Cuisine.id).where(Cuisine.is_deleted.is_(False)))).scalars())
+    data.tag_ids = list((await session.execute(select(DietaryTag.id))).scalars())
+    if not data.dish_ids:
+        raise ValueError("No dishes in the database; run seed_database.py or drop --reuse-catalog.")
+
+
+async def generate_users_and_interactions(
+    session: AsyncSession,
+    data: SyntheticData,
+    args,
+    rng,
+) -> None:
+    """
+    Users with random preferences, and interactions drawn from a hidden
+    affinity model (cuisine, spice, budget, dietary tags, rating).
+
+    Positive interactions in the last `holdout_days` become the held-out
+    ground truth and are not written; everything before is.
+    """
+    # Filter by the (few) cuisines rather than the (many) dish ids to stay under bind parameter limits
+    catalog = (Dish.is_deleted.is_(False), Dish.cuisine_id.in_(data.cuisine_ids))
+    dishes = (await session.execute(
+        select(Dish.id, Dish.cuisine_id, Dish.price, Dish.rating, Dish.spice_level).where(*catalog)
+    )).all()
+    dish_ids = [row.id for row in dishes]
+    cuisine_codes = {cuisine_id: i for i, cuisine_id in enumerate(data.cuisine_ids)}
+    dish_cuisine = np.array([cuisine_codes.get(row.cuisine_id, -1) for row in dishes])
+    dish_price = np.array([float(row.price) if row.price is not None else np.nan for row in dishes])
+    dish_rating = np.array([row.rating if row.rating is not None else 3.0 for row in dishes])
+    dish_spice = np.array([row.spice_level or "" for row in dishes])
+    dish_tags: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+    for dish_id, tag_id in (await session.execute(
+        select(DishDietaryTagAssociation.c.dish_id, DishDietaryTagAssociation.c.dietary_tag_id)
+        .join(Dish, Dish.id == DishDietaryTagAssociation.c.dish_id)
+        .where(*catalog)
+    )).all():
+        dish_tags.setdefault(dish_id, set()).add(tag_id)
+
+    now = datetime.now()
+    holdout_start = now - timedelta(days=args.holdout_days)
+    users, preferences, favorites, interactions = [], [], [], []
+
+    for i in range(args.users):
+        user_id = uuid.uuid4()
+        spice = SPICE_LEVELS[rng.integers(len(SPICE_LEVELS))] if rng.random() < 0.8 else None
+        favorite_cuisines = rng.choice(len(data.cuisine_ids), size=min(2, len(data.cuisine_ids)), replace=False)
+        max_budget = float(rng.uniform(10, 30))
+        preferred_tag = data.tag_ids[rng.integers(len(data.tag_ids))] if data.tag_ids and rng.random() < 0.3 else None
+
+        users.append(User(
+            id=user_id,
+            email=f"user{i}-{user_id.hex[:8]}@{BENCHMARK_EMAIL_DOMAIN}",
+            spice_level_preference=spice,
+        ))
+        preferences.append({
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "min_budget": 5,
+            "max_budget": round(max_budget, 2),
+            "preferred_spice_level": spice,
+            "preferred_dietary_tags": json.dumps([str(preferred_tag)]) if preferred_tag else None,
+            **timestamps(now),
+        })
+        favorites.extend(
+            {"user_id": user_id, "cuisine_id": data.cuisine_ids[code]} for code in favorite_cuisines
+        )
+
+        affinity = (
+            1.5 * np.isin(dish_cuisine, favorite_cuisines)
+            + 0.8 * (dish_spice == spice)
+            + 0.7 * (np.nan_to_num(dish_price, nan=max_budget + 1) <= max_budget)
+            + 0.4 * (dish_rating - 3.0) / 2.0
+        )
+        if preferred_tag is not None:
+            affinity += 0.5 * np.array([preferred_tag in dish_tags.get(dish_id, ()) for dish_id in dish_ids])
+        weights = np.exp(2.0 * affinity)
+        picks = rng.choice(len(dish_ids), size=args.interactions_per_user, p=weights / weights.sum())
+
+        for idx in picks:
+            positive = rng.random() < 1 / (1 + math.exp(-2.0 * (affinity[idx] - 1.5)))
+            types = POSITIVE_INTERACTIONS if positive else NEGATIVE_INTERACTIONS
+            timestamp = now - timedelta(days=float(rng.uniform(0, args.days)))
+            if timestamp >= holdout_start:
+                if positive:
+                    data.held_out.setdefault(user_id, set()).add(dish_ids[idx])
+                continue
+            interactions.append({
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "dish_id": dish_ids[idx],
+                "interaction_type": types[rng.integers(len(types))],
+                "interaction_timestamp": timestamp,
+                **timestamps(now),
+            })
+
+    session.add_all(users)
+    await session.flush()
+    data.user_ids = [user.id for user in users]
+    await insert_rows(session, UserPreference, preferences)
+    await insert_rows(session, UserCuisineAssociation, favorites)
+    await insert_rows(session, UserInteraction, interactions)
+    data.train_interactions = len(interactions)
+
+
+async def cleanup(session: AsyncSession, data: SyntheticData, reuse_catalog: bool) -> None:
+    """Delete everything the benchmark generated."""
+    await session.execute(delete(UserInteraction).where(UserInteraction.user_id.in_(data.user_ids)))
+    await session.execute(delete(UserPreference).where(UserPreference.user_id.in_(data.user_ids)))
+    await session.execute(delete(UserCuisineAssociation).where(UserCuisineAssociation.c.user_id.in_(data.user_ids)))
+    await session.execute(delete(User).where(User.id.in_(data.user_ids)))
+    if not reuse_catalog:
+        # Generated dishes are exactly those in the generated cuisines
+        dishes = select(Dish.id).where(Dish.cuisine_id.in_(data.cuisine_ids))
+        await session.execute(
+            delete(DishDietaryTagAssociation).where(DishDietaryTagAssociation.c.dish_id.in_(dishes))
+        )
+        await session.execute(delete(Dish).where(Dish.cuisine_id.in_(data.cuisine_ids)))
+        await session.execute(delete(Restaurant).where(Restaurant.id.in_(data.restaurant_ids)))
+        await session.execute(delete(Cuisine).where(Cuisine.id.in_(data.cuisine_ids)))
+        await session.execute(delete(DietaryTag).where(DietaryTag.id.in_(data.tag_ids)))
+    await session.commit()
+
+
+async def run_backend(
+    backend: str,
+    session_factory,
+    counter: QueryCounter,
+    users: List[User],
+    data: SyntheticData,
+    args,
+    ml_engine: Optional[MLRecommendationEngine] = None,
+) -> Dict:
+    """Time `args.requests` recommendation requests and score the rankings."""
+    async def recommend(user: User):
+        async with session_factory() as session:
+            service = RecommendationService(session, ml_engine=ml_engine)
+            return await service.recommend(user, args.k, backend=backend)
+
+    eval_users = [user for user in users if user.id in data.held_out]
+    precision, recall, ndcg = [], [], []
+    for user in eval_users:
+        ranked = [rec.dish_id for rec in await recommend(user)]
+        relevant = data.held_out[user.id]
+        precision.append(precision_at_k(ranked, relevant, args.k))
+        recall.append(recall_at_k(ranked, relevant, args.k))
+        ndcg.append(ndcg_at_k(ranked, relevant, args.k))
+
+    latencies, queries = [], []
+    for i in range(args.requests):
+        user = users[i % len(users)]
+        before = counter.count
+        start = time.perf_counter()
+        await recommend(user)
+        latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(counter.count - before)
+
+    # Allocation tracing slows requests down, so it gets its own short pass
+    peaks = []
+    tracemalloc.start()
+    for user in users[:10]:
+        tracemalloc.reset_peak()
+        await recommend(user)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    return {
+        "eval_users": len(eval_users),
+        "precision_at_k": float(np.mean(precision)) if precision else 0.0,
+        "recall_at_k": float(np.mean(recall)) if recall else 0.0,
+        "ndcg_at_k": float(np.mean(ndcg)) if ndcg else 0.0,
+        "latency_p50_ms": percentile(latencies, 50),
+        "latency_p90_ms": percentile(latencies, 90),
+        "latency_p99_ms": percentile(latencies, 99),
+        "latency_mean_ms": float(np.mean(latencies)),
+        "queries_per_request": float(np.mean(queries)),
+        "peak_alloc_mb": max(peaks) / 2**20,
+    }
+
+
+async def run_scale(n_dishes: int, args, rng) -> Dict[str, Dict]:
+    """Generate data for one catalog size and benchmark every backend on it."""
+    tmp_dir = None
+    if args.database_url:
+        url = async_database_url(args.database_url)
+    else:
+        tmp_dir = tempfile.TemporaryDirectory()
+        url = f"sqlite+aiosqlite:///{tmp_dir.name}/benchmark.db"
+
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    data = SyntheticData()
+    run_tag = uuid.uuid4().hex[:8]
+    results = {}
+    try:
+        async with session_factory() as session:
+            if args.reuse_catalog:
+                await load_catalog(session, data)
+            else:
+                await generate_catalog(session, data, n_dishes, rng, run_tag)
+            await generate_users_and_interactions(session, data, args, rng)
+            await session.commit()
+            users = list((await session.execute(select(User).where(User.id.in_(data.user_ids)))).scalars())
+
+        print(
+            f"📦 {len(data.dish_ids)} dishes, {len(users)} users, {data.train_interactions} interactions, "
+            f"{len(data.held_out)} users with held-out positives"
+        )
+
+        counter = QueryCounter(engine)
+        for backend in args.backends:
+            ml_engine = None
+            if backend == ML_BACKEND:
+                trainer = MLModelTrainer(model_type='random_forest')
+                try:
+                    async with session_factory() as session:
+                        await trainer.train(session, days_back=args.days)
+                except ValueError as e:
+                    print(f"⏭️  Skipping ml backend: {e}")
+                    continue
+                ml_engine = MLRecommendationEngine(model=trainer.model)
+
+            results[backend] = await run_backend(backend, session_factory, counter, users, data, args, ml_engine)
+            print_results(backend, results[backend], args.k)
+    finally:
+        if not args.keep_data and tmp_dir is None and data.user_ids:
+            async with session_factory() as session:
+                await cleanup(session, data, args.reuse_catalog)
+        await engine.dispose()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    return results
+
+
+def print_results(backend: str, result: Dict, k: int) -> None:
+    print(f"   [{backend}]")
+    print(
+        f"     latency ms  p50 {result['latency_p50_ms']:.1f}  p90 {result['latency_p90_ms']:.1f}  "
+        f"p99 {result['latency_p99_ms']:.1f}  mean {result['latency_mean_ms']:.1f}"
+    )
+    print(f"     queries/request {result['queries_per_request']:.1f}  peak alloc {result['peak_alloc_mb']:.1f} MB")
+    print(
+        f"     precision@{k} {result['precision_at_k']:.3f}  recall@{k} {result['recall_at_k']:.3f}  "
+        f"NDCG@{k} {result['ndcg_at_k']:.3f}  ({result['eval_users']} users)"
+    )
+
+
+def find_regressions(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Metrics that got worse than the baseline by more than `tolerance` (relative)."""
+    regressions = []
+    for scale, backends in results.items():
+        for backend, metrics in backends.items():
+            previous = baseline.get(scale, {}).get(backend)
+            if not previous:
+                continue
+            for name, higher_is_better in REGRESSION_METRICS:
+                old, new = previous.get(name), metrics.get(name)
+                if old is None or new is None or old == 0:
+                    continue
+                change = (new - old) / abs(old)
+                if (change < -tolerance) if higher_is_better else (change > tolerance):
+                    regressions.append(f"{scale} dishes [{backend}] {name}: {old:.4f} -> {new:.4f}")
+    return regressions
+
+
+async def main():
+    args = parse_args()
+    merge_metadata()
+    rng = np.random.default_rng(args.seed)
+
+    results = {}
+    for n_dishes in ([0] if args.reuse_catalog else args.dishes):
+        label = "existing" if args.reuse_catalog else str(n_dishes)
+        print(f"🚀 Benchmarking recommendations ({label} dishes)...")
+        results[label] = await run_scale(n_dishes, args, rng)
+
+    print(f"   Max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "k": args.k,
+            "results": results,
+        }, indent=2))
+        print(f"   Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+        regressions = find_regressions(results, baseline, args.max_regression)
+        if regressions:
+            print("❌ Regressions against baseline:")
+            for line in regressions:
+                print(f"   {line}")
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,22 +10,57 @@ import pickle
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, precision_score, recall_score, roc_auc_score
 from sklearn.preprocessing import LabelEncoder
-from sqlalchemy import select, func
+from sqlalchemy import case, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.ai.model_registry import ModelRegistry
 from app.core.database import get_db
-from app.models.food import Dish, Cuisine
+from app.models.food import Dish, Cuisine, UserCuisineAssociation
 from app.models.recommendation import UserInteraction, UserPreference
 from app.models.user import User
 
 
+# Order of the columns in every feature matrix (training and inference)
+FEATURE_NAMES = [
+    'user_spice_level_encoded',
+    'user_avg_budget',
+    'user_num_favorite_cuisines',
+    'user_total_interactions',
+    'dish_price',
+    'dish_rating',
+    'dish_spice_level_encoded',
+    'dish_is_featured',
+    'spice_level_match',
+    'cuisine_match',
+    'budget_match',
+    'clicks',
+    'views',
+    'orders',
+    'favorites',
+]
+
+# Interaction types counted per (user, dish) pair, in feature order
+COUNTED_INTERACTIONS = ('click', 'view', 'order', 'favorite', 'reservation')
+
+# Interaction types that make a (user, dish) pair a positive training example
+POSITIVE_INTERACTIONS = ('order', 'favorite', 'reservation')
+
+
+def interaction_count_columns():
+    """Conditional count columns for COUNTED_INTERACTIONS, for use in a GROUP BY."""
+    return [
+        func.count(case((UserInteraction.interaction_type == interaction_type, 1))).label(interaction_type)
+        for interaction_type in COUNTED_INTERACTIONS
+    ]
+
+
 class FeatureExtractor:
     """Extract features from database for ML training."""
     
@@ -34,6 +69,182 @@ class FeatureExtractor:
         self.spice_encoder.fit(["Mild", "Medium", "Spicy", "Extra Spicy"])
         
         self.cuisine_encoder = LabelEncoder()
+        self._spice_codes = {
+            level: int(code)
+            for code, level in enumerate(self.spice_encoder.classes_)
+        }
+    
+    def encode_spice(self, spice_level: Optional[str]) -> int:
+        """Encode a spice level the same way spice_encoder does (0 when missing/unknown)."""
+        return self._spice_codes.get(spice_level, 0) if spice_level else 0
+    
+    async def extract_user_feature_table(
+        self,
+        user_ids: Sequence[uuid.UUID],
+        db: AsyncSession,
+    ) -> Tuple[np.ndarray, Set[Tuple[uuid.UUID, uuid.UUID]]]:
+        """
+        Extract user features for many users with set-based queries.
+        
+        Returns:
+            Tuple of (float64 array of shape (len(user_ids), 4) with the same
+            columns as extract_user_features, set of (user_id, favorite cuisine_id))
+        """
+        index = {user_id: i for i, user_id in enumerate(user_ids)}
+        table = np.zeros((len(user_ids), 4), dtype=np.float64)
+        if not user_ids:
+            return table, set()
+        
+        # Preferences and spice level
+        pref_stmt = (
+            select(
+                User.id,
+                User.spice_level_preference,
+                UserPreference.id,
+                UserPreference.preferred_spice_level,
+                UserPreference.min_budget,
+                UserPreference.max_budget,
+            )
+            .outerjoin(UserPreference, UserPreference.user_id == User.id)
+            .where(User.id.in_(user_ids))
+        )
+        for user_id, user_spice, pref_id, pref_spice, min_budget, max_budget in (await db.execute(pref_stmt)).all():
+            i = index[user_id]
+            table[i, 0] = self.encode_spice(pref_spice if pref_id else user_spice)
+            if pref_id and min_budget and max_budget:
+                table[i, 1] = (float(min_budget) + float(max_budget)) / 2.0
+        
+        # Favorite cuisines
+        favorite_cuisines = set()
+        cuisine_stmt = (
+            select(UserCuisineAssociation.c.user_id, UserCuisineAssociation.c.cuisine_id)
+            .where(UserCuisineAssociation.c.user_id.in_(user_ids))
+        )
+        for user_id, cuisine_id in (await db.execute(cuisine_stmt)).all():
+            table[index[user_id], 2] += 1
+            favorite_cuisines.add((user_id, cuisine_id))
+        
+        # Total interactions
+        interaction_stmt = (
+            select(UserInteraction.user_id, func.count(UserInteraction.id))
+            .where(UserInteraction.user_id.in_(user_ids))
+            .group_by(UserInteraction.user_id)
+        )
+        for user_id, total in (await db.execute(interaction_stmt)).all():
+            table[index[user_id], 3] = total
+        
+        return table, favorite_cuisines
+    
+    async def extract_dish_feature_table(
+        self,
+        dish_ids: Sequence[uuid.UUID],
+        db: AsyncSession,
+    ) -> Tuple[np.ndarray, List[Optional[uuid.UUID]], np.ndarray]:
+        """
+        Extract dish features for many dishes with one query.
+        
+        Returns:
+            Tuple of (float64 array of shape (len(dish_ids), 4) with price, rating,
+            spice_level_encoded, is_featured; cuisine ID per dish; boolean mask of
+            dishes that were found)
+        """
+        index = {dish_id: i for i, dish_id in enumerate(dish_ids)}
+        table = np.zeros((len(dish_ids), 4), dtype=np.float64)
+        cuisine_ids: List[Optional[uuid.UUID]] = [None] * len(dish_ids)
+        found = np.zeros(len(dish_ids), dtype=bool)
+        if not dish_ids:
+            return table, cuisine_ids, found
+        
+        stmt = (
+            select(Dish.id, Dish.price, Dish.rating, Dish.spice_level, Dish.is_featured, Dish.cuisine_id)
+            .where(Dish.id.in_(dish_ids))
+        )
+        for dish_id, price, rating, spice_level, is_featured, cuisine_id in (await db.execute(stmt)).all():
+            i = index[dish_id]
+            table[i] = (
+                float(price) if price else 0.0,
+                float(rating) if rating else 0.0,
+                self.encode_spice(spice_level),
+                1 if is_featured else 0,
+            )
+            cuisine_ids[i] = cuisine_id
+            found[i] = True
+        
+        return table, cuisine_ids, found
+    
+    async def extract_interaction_count_table(
+        self,
+        user_id: uuid.UUID,
+        dish_ids: Sequence[uuid.UUID],
+        db: AsyncSession,
+    ) -> np.ndarray:
+        """
+        Count one user's interactions with many dishes in one query.
+        
+        Returns:
+            float64 array of shape (len(dish_ids), len(COUNTED_INTERACTIONS))
+        """
+        index = {dish_id: i for i, dish_id in enumerate(dish_ids)}
+        table = np.zeros((len(dish_ids), len(COUNTED_INTERACTIONS)), dtype=np.float64)
+        
+        # Group over the user's own interactions instead of an IN list of
+        # every candidate dish; users touch far fewer dishes than the catalog has
+        stmt = (
+            select(UserInteraction.dish_id, *interaction_count_columns())
+            .where(UserInteraction.user_id == user_id)
+            .group_by(UserInteraction.dish_id)
+        )
+        for row in (await db.execute(stmt)).all():
+            i = index.get(row[0])
+            if i is not None:
+                table[i] = row[1:]
+        
+        return table
+    
+    def build_feature_matrix(
+        self,
+        user_table: np.ndarray,
+        dish_table: np.ndarray,
+        cuisine_match: np.ndarray,
+        interaction_counts: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Assemble the FEATURE_NAMES matrix from per-pair rows.
+        
+        Args:
+            user_table: User feature rows, one per pair
+            dish_table: Dish feature rows, one per pair
+            cuisine_match: 1.0 where the dish cuisine is a user favorite, one per pair
+            interaction_counts: Counts in COUNTED_INTERACTIONS order, one row per pair
+            
+        Returns:
+            float64 array of shape (pairs, len(FEATURE_NAMES))
+        """
+        # Spice level match (same steps as extract_match_features)
+        diff = np.abs(user_table[:, 0] - dish_table[:, 2]).astype(np.int64)
+        spice_match = np.array([1.0, 0.7, 0.4, 0.1])[np.minimum(diff, 3)]
+        
+        # Budget match
+        avg_budget = user_table[:, 1]
+        price = dish_table[:, 0]
+        budget_match = np.where(
+            (avg_budget > 0) & (price > 0),
+            np.select(
+                [price <= avg_budget * 1.2, price <= avg_budget * 1.5],
+                [1.0, 0.5],
+                default=0.0,
+            ),
+            0.5,
+        )
+        
+        return np.column_stack([
+            user_table,
+            dish_table,
+            spice_match,
+            cuisine_match,
+            budget_match,
+            interaction_counts[:, :4],
+        ])
     
     async def extract_user_features(
         self,
@@ -200,6 +411,29 @@ class FeatureExtractor:
         }
 
 
+def labels_path_for(features_path: Path) -> Path:
+    """Path of the labels file written next to a streamed feature matrix."""
+    return features_path.with_name(f"{features_path.stem}.labels.npy")
+
+
+def evaluate_model(model, X: np.ndarray, y: np.ndarray) -> Dict[str, float]:
+    """Classification metrics of a fitted model on held-out data."""
+    y_pred = model.predict(X)
+    y_pred_proba = model.predict_proba(X)[:, 1]
+    return {
+        'accuracy': accuracy_score(y, y_pred),
+        'precision': precision_score(y, y_pred, zero_division=0),
+        'recall': recall_score(y, y_pred, zero_division=0),
+        'roc_auc': roc_auc_score(y, y_pred_proba) if len(np.unique(y)) > 1 else 0.0,
+    }
+
+
+def load_training_data(features_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Memory-map a feature matrix and its labels written by prepare_training_data_streaming."""
+    X_path = Path(features_path)
+    return np.load(X_path, mmap_mode='r'), np.load(labels_path_for(X_path), mmap_mode='r')
+
+
 class MLModelTrainer:
     """Train ML models for recommendation."""
     
@@ -230,6 +464,34 @@ class MLModelTrainer:
         else:
             raise ValueError(f"Unknown model type: {self.model_type}")
     
+    @staticmethod
+    def _training_pairs_query(
+        since: datetime,
+        until: Optional[datetime] = None,
+    ):
+        """
+        All user-dish pairs with interactions in [since, until), with per-type
+        counts (up to `until`) and the label (positive interaction in the window),
+        ordered by (user_id, dish_id).
+        """
+        in_window = UserInteraction.interaction_timestamp >= since
+        stmt = (
+            select(
+                UserInteraction.user_id,
+                UserInteraction.dish_id,
+                *interaction_count_columns(),
+                func.max(
+                    case((in_window & UserInteraction.interaction_type.in_(POSITIVE_INTERACTIONS), 1), else_=0)
+                ).label('label'),
+            )
+            .group_by(UserInteraction.user_id, UserInteraction.dish_id)
+            .having(func.max(case((in_window, 1), else_=0)) == 1)
+            .order_by(UserInteraction.user_id, UserInteraction.dish_id)
+        )
+        if until is not None:
+            stmt = stmt.where(UserInteraction.interaction_timestamp < until)
+        return stmt
+    
     async def prepare_training_data(
         self,
         db: AsyncSession,
@@ -238,6 +500,10 @@ class MLModelTrainer:
         """
         Prepare training data from database.
         
+        Uses a handful of set-based queries: one GROUP BY over interactions for
+        the (user, dish) pairs, counts and labels, then one batch each for user
+        and dish features.
+        
         Args:
             db: Database session
             days_back: How many days of data to use
@@ -246,106 +512,142 @@ class MLModelTrainer:
             Tuple of (X features, y targets)
         """
         cutoff_date = datetime.now() - timedelta(days=days_back)
+        pairs = (await db.execute(self._training_pairs_query(cutoff_date))).all()
         
-        # Get all user-dish pairs with interactions
-        stmt = (
-            select(
-                UserInteraction.user_id,
-                UserInteraction.dish_id,
-                UserInteraction.interaction_type,
-                UserInteraction.interaction_timestamp,
-            )
-            .where(UserInteraction.interaction_timestamp >= cutoff_date)
-        )
-        result = await db.execute(stmt)
-        interactions = result.all()
+        if not pairs:
+            return np.empty((0, len(FEATURE_NAMES))), np.empty(0, dtype=np.int64)
         
-        # Build feature matrix
-        X = []
-        y = []
+        return await self._pair_features(pairs, db)
+    
+    async def prepare_training_data_streaming(
+        self,
+        db: AsyncSession,
+        features_path: str,
+        days_back: int = 30,
+        chunk_size: int = 10_000,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Prepare training data in fixed-size chunks, writing it to disk.
         
-        processed_pairs = set()
+        Pairs are read through a server-side cursor and each chunk's features
+        are written straight into a float32 memory-mapped .npy file, so peak
+        memory is bounded by chunk_size instead of the size of the window.
         
-        for interaction in interactions:
-            user_id = interaction.user_id
-            dish_id = interaction.dish_id
-            pair_key = (user_id, dish_id)
-            
-            if pair_key in processed_pairs:
-                continue
-            
-            processed_pairs.add(pair_key)
-            
-            # Extract features
-            user_features = await self.feature_extractor.extract_user_features(user_id, db)
-            dish_features = await self.feature_extractor.extract_dish_features(dish_id, db)
-            
-            # Get favorite cuisines
-            from app.models.food import UserCuisineAssociation
-            cuisine_stmt = (
-                select(UserCuisineAssociation.c.cuisine_id)
-                .where(UserCuisineAssociation.c.user_id == user_id)
-            )
-            cuisine_result = await db.execute(cuisine_stmt)
-            favorite_cuisines = [row[0] for row in cuisine_result.all()]
-            
-            match_features = await self.feature_extractor.extract_match_features(
-                user_features,
-                dish_features,
-                favorite_cuisines,
-                dish_features.get('cuisine_id'),
-                db,
-            )
-            
-            interaction_features = await self.feature_extractor.extract_interaction_features(
-                user_id, dish_id, db
-            )
-            
-            # Combine features
-            feature_vector = [
-                user_features['spice_level_encoded'],
-                user_features['avg_budget'],
-                user_features['num_favorite_cuisines'],
-                user_features['total_interactions'],
-                dish_features['price'],
-                dish_features['rating'],
-                dish_features['spice_level_encoded'],
-                dish_features['is_featured'],
-                match_features['spice_level_match'],
-                match_features['cuisine_match'],
-                match_features['budget_match'],
-                interaction_features['clicks'],
-                interaction_features['views'],
-                interaction_features['orders'],
-                interaction_features['favorites'],
-            ]
-            
-            X.append(feature_vector)
+        Args:
+            db: Database session
+            features_path: Where to write the feature matrix (.npy); labels are
+                written next to it (see labels_path_for)
+            days_back: How many days of data to use
+            chunk_size: Pairs per chunk
             
-            # Target: Did user interact positively? (order, favorite, reservation)
-            positive_interactions = ['order', 'favorite', 'reservation']
-            has_positive = any(
-                i.interaction_type in positive_interactions
-                for i in interactions
-                if i.user_id == user_id and i.dish_id == dish_id
-            )
-            y.append(1 if has_positive else 0)
+        Returns:
+            Tuple of (X, y) memory-mapped read-only from the written files
+        """
+        until = datetime.now()
+        stmt = self._training_pairs_query(until - timedelta(days=days_back), until)
+        
+        total = (await db.execute(select(func.count()).select_from(stmt.subquery()))).scalar_one()
+        
+        X_path = Path(features_path)
+        y_path = labels_path_for(X_path)
+        X_path.parent.mkdir(parents=True, exist_ok=True)
+        X_out = np.lib.format.open_memmap(X_path, mode='w+', dtype=np.float32, shape=(total, len(FEATURE_NAMES)))
+        y_out = np.lib.format.open_memmap(y_path, mode='w+', dtype=np.int8, shape=(total,))
+        
+        written = 0
+        result = await db.stream(stmt.execution_options(yield_per=chunk_size))
+        async for chunk in result.partitions(chunk_size):
+            X_chunk, y_chunk = await self._pair_features(chunk, db)
+            # Rows may have disappeared since counting; never write past the end
+            n = min(len(X_chunk), total - written)
+            X_out[written:written + n] = X_chunk[:n]
+            y_out[written:written + n] = y_chunk[:n]
+            written += n
+            if written >= total:
+                break
+        
+        X_out.flush()
+        y_out.flush()
+        del X_out, y_out
+        
+        if written < total:
+            # Dishes were deleted while streaming; rewrite the files at the real size
+            for path in (X_path, y_path):
+                data = np.load(path, mmap_mode='r')[:written]
+                np.save(f"{path}.tmp.npy", data)
+                del data
+                Path(f"{path}.tmp.npy").replace(path)
+        
+        return load_training_data(str(X_path))
+    
+    async def _pair_features(
+        self,
+        pairs: Sequence,
+        db: AsyncSession,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Build (X, y) for rows of (user_id, dish_id, *counts, label)."""
+        user_ids = list(dict.fromkeys(row[0] for row in pairs))
+        dish_ids = list(dict.fromkeys(row[1] for row in pairs))
+        user_index = {user_id: i for i, user_id in enumerate(user_ids)}
+        dish_index = {dish_id: i for i, dish_id in enumerate(dish_ids)}
+        
+        user_table, favorite_cuisines = await self.feature_extractor.extract_user_feature_table(user_ids, db)
+        dish_table, dish_cuisines, dish_found = await self.feature_extractor.extract_dish_feature_table(dish_ids, db)
+        
+        pair_users = np.fromiter((user_index[row[0]] for row in pairs), dtype=np.int64, count=len(pairs))
+        pair_dishes = np.fromiter((dish_index[row[1]] for row in pairs), dtype=np.int64, count=len(pairs))
+        cuisine_match = np.fromiter(
+            ((row[0], dish_cuisines[dish_index[row[1]]]) in favorite_cuisines for row in pairs),
+            dtype=np.float64,
+            count=len(pairs),
+        )
+        counts = np.array([row[2:2 + len(COUNTED_INTERACTIONS)] for row in pairs], dtype=np.float64)
+        y = np.fromiter((row[-1] for row in pairs), dtype=np.int64, count=len(pairs))
+        
+        X = self.feature_extractor.build_feature_matrix(
+            user_table[pair_users],
+            dish_table[pair_dishes],
+            cuisine_match,
+            counts,
+        )
         
-        return np.array(X), np.array(y)
+        # Skip pairs whose dish no longer exists
+        keep = dish_found[pair_dishes]
+        return X[keep], y[keep]
     
     async def train(
         self,
         db: AsyncSession,
         model_save_path: Optional[str] = None,
+        days_back: int = 30,
+        features_path: Optional[str] = None,
+        registry: Optional[ModelRegistry] = None,
+        trained_until: Optional[datetime] = None,
     ) -> Dict:
         """
         Train the ML model.
         
+        Args:
+            db: Database session
+            model_save_path: Where to pickle the trained model
+            days_back: How many days of data to use
+            features_path: Train from a feature matrix written by
+                prepare_training_data_streaming instead of querying the database
+            registry: Publish the trained model as a new live registry version
+            trained_until: High-water mark recorded with the published version
+                (defaults to the start of training)
+        
         Returns:
             Dictionary with training metrics
         """
+        # Pairs touched after this point are picked up by the next increment
+        trained_until = trained_until or datetime.now()
+        
         # Prepare data
-        X, y = await self.prepare_training_data(db)
+        if features_path:
+            X, y = load_training_data(features_path)
+        else:
+            X, y = await self.prepare_training_data(db, days_back=days_back)
         
         if len(X) == 0:
             raise ValueError("No training data available. Need user interactions.")
@@ -360,14 +662,8 @@ class MLModelTrainer:
         self.model.fit(X_train, y_train)
         
         # Evaluate
-        y_pred = self.model.predict(X_test)
-        y_pred_proba = self.model.predict_proba(X_test)[:, 1]
-        
         metrics = {
-            'accuracy': accuracy_score(y_test, y_pred),
-            'precision': precision_score(y_test, y_pred, zero_division=0),
-            'recall': recall_score(y_test, y_pred, zero_division=0),
-            'roc_auc': roc_auc_score(y_test, y_pred_proba) if len(np.unique(y_test)) > 1 else 0.0,
+            **evaluate_model(self.model, X_test, y_test),
             'train_size': len(X_train),
             'test_size': len(X_test),
         }
@@ -379,19 +675,134 @@ class MLModelTrainer:
                 pickle.dump(self.model, f)
             metrics['model_path'] = model_save_path
         
+        if registry is not None:
+            metrics['model_version'] = registry.publish(
+                self.model,
+                {
+                    'model_type': self.model_type,
+                    'days_back': days_back,
+                    'trained_until': trained_until.isoformat(),
+                    **metrics,
+                },
+            )
+        
+        return metrics
+    
+    async def train_incremental(
+        self,
+        db: AsyncSession,
+        registry: ModelRegistry,
+        snapshot_dir: Optional[str] = None,
+        trees_per_increment: int = 10,
+        max_estimators: int = 300,
+        min_samples: int = 50,
+    ) -> Dict:
+        """
+        Update the live model with the interactions since it was trained.
+        
+        The high-water mark is the `trained_until` recorded with the live
+        registry version. Only pairs with interactions after it are extracted;
+        their features are saved to snapshot_dir, and the model is warm-started
+        with `trees_per_increment` more trees fitted on them. For random
+        forests the oldest trees are dropped beyond `max_estimators`, so the
+        forest keeps covering a sliding window of increments.
+        
+        Increments that are too small (fewer than min_samples pairs, or fewer
+        than two of either label) are not fitted and the mark is not moved, so
+        their interactions roll into the next run.
+        
+        Args:
+            db: Database session
+            registry: Registry holding the base model; the update is published to it
+            snapshot_dir: Where to keep each increment's features and labels
+            trees_per_increment: Trees (or boosting stages) added per increment
+            max_estimators: Maximum forest size
+            min_samples: Minimum pairs needed to fit an increment
+        
+        Returns:
+            Dictionary with the increment's metrics
+        """
+        base_version = registry.current_version()
+        if base_version is None:
+            raise ValueError("No published model to update. Run a full training first.")
+        
+        metadata = registry.metadata(base_version)
+        if 'trained_until' not in metadata:
+            raise ValueError(f"Model version {base_version} has no high-water mark. Run a full training first.")
+        
+        since = datetime.fromisoformat(metadata['trained_until'])
+        until = datetime.now()
+        
+        pairs = (await db.execute(self._training_pairs_query(since, until))).all()
+        X, y = await self._pair_features(pairs, db) if pairs else (
+            np.empty((0, len(FEATURE_NAMES))), np.empty(0, dtype=np.int64)
+        )
+        
+        metrics = {
+            'base_version': base_version,
+            'since': since.isoformat(),
+            'until': until.isoformat(),
+            'samples': len(X),
+            'positives': int(y.sum()),
+        }
+        if len(X) < min_samples or np.bincount(y, minlength=2).min() < 2:
+            metrics['skipped'] = True
+            return metrics
+        
+        if snapshot_dir:
+            X_path = Path(snapshot_dir) / f"{until.strftime('%Y%m%dT%H%M%S')}.npy"
+            X_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(X_path, X.astype(np.float32))
+            np.save(labels_path_for(X_path), y.astype(np.int8))
+            metrics['snapshot_path'] = str(X_path)
+        
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42, stratify=y
+        )
+        
+        # Load a private, writable copy; serving workers keep the mapped one
+        self.model = registry.load(base_version, mmap_mode=None)
+        before = evaluate_model(self.model, X_test, y_test)
+        
+        if isinstance(self.model, RandomForestClassifier):
+            keep = max(0, max_estimators - trees_per_increment)
+            self.model.estimators_ = self.model.estimators_[-keep:] if keep else []
+        self.model.set_params(
+            warm_start=True,
+            n_estimators=len(self.model.estimators_) + trees_per_increment,
+        )
+        self.model.fit(X_train, y_train)
+        
+        metrics.update({
+            **evaluate_model(self.model, X_test, y_test),
+            'base_roc_auc': before['roc_auc'],
+            'n_estimators': len(self.model.estimators_),
+            'train_size': len(X_train),
+            'test_size': len(X_test),
+        })
+        metrics['model_version'] = registry.publish(
+            self.model,
+            {
+                'model_type': self.model_type,
+                'incremental': True,
+                'trained_until': until.isoformat(),
+                **metrics,
+            },
+        )
         return metrics
 
 
 class MLRecommendationEngine:
     """ML-based recommendation engine for real-time inference."""
     
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: Optional[str] = None, model=None):
         """
         Args:
             model_path: Path to saved model file
+            model: Already loaded model (e.g. from ModelRegistry); used instead of model_path
         """
         self.model_path = model_path
-        self.model = self._load_model()
+        self.model = model if model is not None else self._load_model()
         self.feature_extractor = FeatureExtractor()
     
     def _load_model(self):
@@ -460,6 +871,43 @@ class MLRecommendationEngine:
         
         # Convert to 0-100 score
         return float(probability * 100)
+    
+    async def predict_scores(
+        self,
+        user_id: uuid.UUID,
+        dish_ids: Sequence[uuid.UUID],
+        db: AsyncSession,
+    ) -> np.ndarray:
+        """
+        Predict match scores for one user against many dishes.
+        
+        User features are extracted once, dish features and interaction counts
+        with one query each, and the whole matrix is scored with a single
+        predict_proba call.
+        
+        Returns:
+            float64 array of scores from 0.0 to 100.0, aligned with dish_ids
+        """
+        if len(dish_ids) == 0:
+            return np.empty(0, dtype=np.float64)
+        
+        user_table, favorite_cuisines = await self.feature_extractor.extract_user_feature_table([user_id], db)
+        dish_table, dish_cuisines, _ = await self.feature_extractor.extract_dish_feature_table(dish_ids, db)
+        counts = await self.feature_extractor.extract_interaction_count_table(user_id, dish_ids, db)
+        cuisine_match = np.fromiter(
+            ((user_id, cuisine_id) in favorite_cuisines for cuisine_id in dish_cuisines),
+            dtype=np.float64,
+            count=len(dish_ids),
+        )
+        
+        X = self.feature_extractor.build_feature_matrix(
+            np.repeat(user_table, len(dish_ids), axis=0),
+            dish_table,
+            cuisine_match,
+            counts,
+        )
+        
+        return self.model.predict_proba(X)[:, 1] * 100
 
 
 # Example usage:
@@ -467,5 +915,7 @@ class MLRecommendationEngine:
 # metrics = await trainer.train(db, model_save_path='app/ai/models/recommendation_model.pkl')
 # 
 # engine = MLRecommendationEngine('app/ai/models/recommendation_model.pkl')
+# engine = MLRecommendationEngine(model=ModelRegistry('app/ai/models/registry').load(version))
 # score = await engine.predict_score(user_id, dish_id, db)
+# scores = await engine.predict_scores(user_id, dish_ids, db)
 
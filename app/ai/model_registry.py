@@ -0,0 +1,311 @@
+"""
+Versioned model registry for the recommendation ML model.
+
+Layout on disk:
+
+    <root>/
+        CURRENT                      # name of the live version
+        versions/<version>/model.joblib
+        versions/<version>/metadata.json
+        versions/<version>/forest/*.npy  # random forests only, see FlatForest
+
+Models are saved with joblib. scikit-learn copies every tree's nodes into
+private buffers when a model is unpickled (joblib's ``mmap_mode`` does not
+change that), so a joblib-loaded forest is a full copy per worker process.
+Random forests are therefore also saved as flat node arrays, which workers map
+read-only and predict from directly: the pages come from the page cache and
+are shared by every worker on the host. Other models (gradient boosting) are
+loaded privately in each worker.
+
+Publishing writes the new version first and then swaps CURRENT atomically;
+workers notice the new pointer and load it in a background thread while still
+serving the old model.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import joblib
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILENAME = "model.joblib"
+METADATA_FILENAME = "metadata.json"
+CURRENT_FILENAME = "CURRENT"
+FOREST_DIRNAME = "forest"
+
+# sklearn.tree._tree.TREE_LEAF: child index of leaf nodes
+TREE_LEAF = -1
+
+
+class FlatForest:
+    """
+    The trees of a fitted forest classifier as flat node arrays.
+
+    Nodes of all trees are concatenated (child indices point into the
+    concatenation, `roots` holds each tree's first node) and leaf values are
+    stored as class probabilities. Saved as plain .npy files, the arrays can
+    be loaded with ``mmap_mode='r'`` and stay backed by the file, unlike an
+    unpickled scikit-learn tree. `predict_proba` follows scikit-learn: float32
+    features, ``x <= threshold`` goes left, NaN follows ``missing_go_to_left``,
+    and the per-tree probabilities are averaged.
+    """
+
+    ARRAYS = (
+        "children_left",
+        "children_right",
+        "feature",
+        "threshold",
+        "missing_go_to_left",
+        "value",
+        "roots",
+        "classes",
+    )
+
+    def __init__(self, **arrays: np.ndarray):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        self.classes_ = self.classes
+
+    @staticmethod
+    def supports(model: Any) -> bool:
+        """Whether a model is a forest classifier of decision trees (e.g. RandomForestClassifier)."""
+        estimators = getattr(model, "estimators_", None)
+        return (
+            hasattr(model, "classes_")
+            and isinstance(estimators, list)
+            and bool(estimators)
+            and all(hasattr(estimator, "tree_") for estimator in estimators)
+        )
+
+    @classmethod
+    def from_forest(cls, model: Any) -> "FlatForest":
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+
+        def children(attribute: str) -> np.ndarray:
+            return np.concatenate([
+                np.where(getattr(tree, attribute) == TREE_LEAF, TREE_LEAF, getattr(tree, attribute) + offset)
+                for tree, offset in zip(trees, offsets)
+            ]).astype(np.int64)
+
+        # Leaf values are class counts or fractions depending on the
+        # scikit-learn version; normalize them the way predict_proba does
+        value = np.concatenate([tree.value[:, 0, :] for tree in trees]).astype(np.float64)
+        totals = value.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1.0
+        return cls(
+            children_left=children("children_left"),
+            children_right=children("children_right"),
+            feature=np.concatenate([tree.feature for tree in trees]).astype(np.int64),
+            threshold=np.concatenate([tree.threshold for tree in trees]).astype(np.float64),
+            missing_go_to_left=np.concatenate([
+                getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=np.uint8))
+                for tree in trees
+            ]).astype(bool),
+            value=value / totals,
+            roots=offsets.astype(np.int64),
+            classes=np.asarray(model.classes_),
+        )
+
+    def save(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name), allow_pickle=False)
+
+    @classmethod
+    def load(cls, directory: Path, mmap_mode: Optional[str] = "r") -> "FlatForest":
+        return cls(**{
+            name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+            for name in cls.ARRAYS
+        })
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Class probabilities, shape (n_samples, n_classes)."""
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(len(X))[:, None]
+        # Walk every (sample, tree) pair down one level per step
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots))).copy()
+        while True:
+            left = self.children_left[nodes]
+            internal = left != TREE_LEAF
+            if not internal.any():
+                break
+            values = X[rows, self.feature[nodes]]  # Leaves (feature -2) are masked below
+            go_left = (values <= self.threshold[nodes]) | (np.isnan(values) & self.missing_go_to_left[nodes])
+            nodes = np.where(internal, np.where(go_left, left, self.children_right[nodes]), nodes)
+        return self.value[nodes].mean(axis=1)
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+
+
+class ModelRegistry:
+    """Filesystem registry of versioned model artifacts."""
+
+    def __init__(self, root: str, keep_versions: int = 5):
+        """
+        Args:
+            root: Registry directory
+            keep_versions: How many versions to keep when publishing
+        """
+        self.root = Path(root)
+        self.keep_versions = keep_versions
+
+    @property
+    def versions_dir(self) -> Path:
+        return self.root / "versions"
+
+    @property
+    def current_path(self) -> Path:
+        return self.root / CURRENT_FILENAME
+
+    def model_path(self, version: str) -> Path:
+        return self.versions_dir / version / MODEL_FILENAME
+
+    def current_version(self) -> Optional[str]:
+        """Name of the live version, or None if nothing has been published."""
+        try:
+            return self.current_path.read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def list_versions(self) -> List[str]:
+        """Published versions, oldest first."""
+        if not self.versions_dir.exists():
+            return []
+        return sorted(
+            path.name for path in self.versions_dir.iterdir()
+            if (path / MODEL_FILENAME).exists()
+        )
+
+    def metadata(self, version: str) -> Dict[str, Any]:
+        try:
+            return json.loads((self.versions_dir / version / METADATA_FILENAME).read_text())
+        except FileNotFoundError:
+            return {}
+
+    def publish(self, model: Any, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Save a model as a new version and make it the live one.
+
+        Returns:
+            The new version name
+        """
+        version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        version_dir = self.versions_dir / version
+        version_dir.mkdir(parents=True, exist_ok=False)
+
+        joblib.dump(model, version_dir / MODEL_FILENAME)
+        if FlatForest.supports(model):
+            FlatForest.from_forest(model).save(version_dir / FOREST_DIRNAME)
+        (version_dir / METADATA_FILENAME).write_text(
+            json.dumps({"version": version, **(metadata or {})}, default=str, indent=2)
+        )
+
+        self.activate(version)
+        self._prune()
+        logger.info(f"Published recommendation model version {version}")
+        return version
+
+    def activate(self, version: str) -> None:
+        """Point CURRENT at an existing version (atomic rename)."""
+        if not self.model_path(version).exists():
+            raise ValueError(f"Unknown model version: {version}")
+        tmp_path = self.root / f"{CURRENT_FILENAME}.{os.getpid()}.tmp"
+        tmp_path.write_text(version)
+        os.replace(tmp_path, self.current_path)
+
+    def load(self, version: str, mmap_mode: Optional[str] = "r") -> Any:
+        """
+        Load a version for prediction.
+
+        Forests are loaded as a FlatForest mapped with `mmap_mode` (shared
+        between processes), other models with joblib. Pass mmap_mode=None for
+        the full, modifiable scikit-learn model (e.g. to keep training it).
+        """
+        forest_dir = self.versions_dir / version / FOREST_DIRNAME
+        if mmap_mode is not None and forest_dir.exists():
+            return FlatForest.load(forest_dir, mmap_mode=mmap_mode)
+        return joblib.load(self.model_path(version))
+
+    def _prune(self) -> None:
+        """Delete the oldest versions beyond keep_versions (never the live one)."""
+        current = self.current_version()
+        stale = [version for version in self.list_versions() if version != current]
+        for version in stale[: max(0, len(stale) - (self.keep_versions - 1))]:
+            # Workers still mapping these files keep their pages until they swap
+            shutil.rmtree(self.versions_dir / version, ignore_errors=True)
+
+
+class HotSwappingModel:
+    """
+    Per-process handle on the live registry version.
+
+    `get()` never blocks on a reload once a model is loaded: at most every
+    `poll_seconds` it reads the CURRENT pointer, and if the version changed
+    it loads the new one in a worker thread and swaps it in when ready.
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        poll_seconds: float = 30.0,
+        wrap: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Args:
+            registry: Registry to follow
+            poll_seconds: Minimum interval between CURRENT checks
+            wrap: Optional factory applied to each loaded model (e.g. an engine class)
+        """
+        self.registry = registry
+        self.poll_seconds = poll_seconds
+        self.wrap = wrap or (lambda model: model)
+        self.version: Optional[str] = None
+        self._value: Any = None
+        self._last_check = 0.0
+        self._loading: Optional[asyncio.Future] = None
+
+    def _load(self, version: str) -> Any:
+        return self.wrap(self.registry.load(version))
+
+    def _swap(self, version: str, value: Any) -> None:
+        # A single reference assignment; in-flight requests keep the old object
+        self._value = value
+        self.version = version
+        logger.info(f"Recommendation model version {version} loaded")
+
+    async def get(self) -> Any:
+        """Current model (wrapped), or None if nothing has been published."""
+        now = time.monotonic()
+        if self._value is not None and now - self._last_check < self.poll_seconds:
+            return self._value
+        self._last_check = now
+
+        version = self.registry.current_version()
+        if version is None or version == self.version:
+            return self._value
+
+        if self._value is None:
+            # Nothing to serve yet, so the first load has to be waited for
+            self._swap(version, await asyncio.to_thread(self._load, version))
+        elif self._loading is None or self._loading.done():
+            self._loading = asyncio.ensure_future(self._reload(version))
+
+        return self._value
+
+    async def _reload(self, version: str) -> None:
+        try:
+            self._swap(version, await asyncio.to_thread(self._load, version))
+        except Exception as e:
+            logger.error(f"Failed to load recommendation model version {version}: {str(e)}")
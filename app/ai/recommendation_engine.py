@@ -9,12 +9,39 @@ from __future__ import annotations
 import json
 import uuid
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+SPICE_LEVELS = ["Mild", "Medium", "Spicy", "Extra Spicy"]
+SPICE_ORDINALS = {level: idx for idx, level in enumerate(SPICE_LEVELS)}
+
+# Column order of the breakdown matrix returned by RecommendationEngine.score_batch
+BREAKDOWN_COLUMNS = (
+    "spice_level",
+    "cuisine_match",
+    "budget_match",
+    "dietary_tags",
+    "past_interactions",
+    "dish_rating",
+)
+
+# Dishes priced above max_budget * BUDGET_HARD_CEILING score zero budget points
+# and are pruned before scoring by the recommendations endpoint
+BUDGET_HARD_CEILING = 1.20
+
+# Column order of DishColumns.interactions
+INTERACTION_COLUMNS = (
+    ("reservation", "order"),
+    ("click", "view"),
+    ("favorite",),
+    ("review",),
+)
+
+
 @dataclass
 class ScoringWeights:
     """Configurable weights for different scoring factors."""
@@ -81,6 +108,135 @@ class ScoreBreakdown:
         
         return explanations
 
+    @classmethod
+    def from_row(cls, row: np.ndarray, total: float) -> "ScoreBreakdown":
+        """Build a breakdown from one row of the score_batch breakdown matrix."""
+        return cls(
+            spice_level_score=float(row[0]),
+            cuisine_match_score=float(row[1]),
+            budget_match_score=float(row[2]),
+            dietary_tags_score=float(row[3]),
+            past_interactions_score=float(row[4]),
+            dish_rating_score=float(row[5]),
+            total_score=float(total),
+        )
+
+
+@dataclass
+class DishColumns:
+    """
+    Column-oriented dish data for vectorized scoring.
+
+    Missing prices/ratings are NaN, unknown spice levels and cuisines are -1.
+    Dietary tags are a uint64 bitset per dish, using the codes in tag_bits.
+    """
+    ids: List[uuid.UUID]
+    price: np.ndarray
+    rating: np.ndarray
+    spice: np.ndarray
+    cuisine: np.ndarray
+    dietary_bits: np.ndarray
+    interactions: np.ndarray
+    cuisine_codes: Dict[uuid.UUID, int]
+    tag_bits: Dict[uuid.UUID, int]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_records(
+        cls,
+        dishes: Sequence[Dict],
+        dish_dietary_tags: Dict[uuid.UUID, List[uuid.UUID]],
+        user_interactions: Dict[uuid.UUID, Dict[str, int]],
+        preferred_tags: Sequence[uuid.UUID] = (),
+    ) -> "DishColumns":
+        """
+        Encode dish dicts (same shape as calculate_match_score expects) into columns.
+
+        Preferred tags get the low bits so they always fit into the bitset;
+        other tags only get a bit while there is room, since scoring only
+        looks at the intersection with the user's preferred tags.
+        """
+        n = len(dishes)
+        cuisine_codes: Dict[uuid.UUID, int] = {}
+        tag_bits: Dict[uuid.UUID, int] = {}
+        for tag_id in preferred_tags:
+            if tag_id not in tag_bits and len(tag_bits) < 64:
+                tag_bits[tag_id] = len(tag_bits)
+
+        price = np.full(n, np.nan, dtype=np.float64)
+        rating = np.full(n, np.nan, dtype=np.float64)
+        spice = np.full(n, -1, dtype=np.int8)
+        cuisine = np.full(n, -1, dtype=np.int32)
+        dietary_bits = np.zeros(n, dtype=np.uint64)
+        interactions = np.zeros((n, len(INTERACTION_COLUMNS)), dtype=np.int32)
+        ids = []
+
+        for i, dish in enumerate(dishes):
+            dish_id = dish.get("id")
+            ids.append(dish_id)
+            if dish.get("price") is not None:
+                price[i] = dish["price"]
+            if dish.get("rating") is not None:
+                rating[i] = dish["rating"]
+            spice[i] = SPICE_ORDINALS.get(dish.get("spice_level"), -1)
+
+            cuisine_id = dish.get("cuisine_id")
+            if cuisine_id:
+                cuisine[i] = cuisine_codes.setdefault(cuisine_id, len(cuisine_codes))
+
+            bits = 0
+            for tag_id in dish_dietary_tags.get(dish_id, ()):
+                if tag_id not in tag_bits and len(tag_bits) < 64:
+                    tag_bits[tag_id] = len(tag_bits)
+                if tag_id in tag_bits:
+                    bits |= 1 << tag_bits[tag_id]
+            dietary_bits[i] = bits
+
+            counts = user_interactions.get(dish_id)
+            if counts:
+                for col, types in enumerate(INTERACTION_COLUMNS):
+                    interactions[i, col] = sum(counts.get(t, 0) for t in types)
+
+        return cls(
+            ids=ids,
+            price=price,
+            rating=rating,
+            spice=spice,
+            cuisine=cuisine,
+            dietary_bits=dietary_bits,
+            interactions=interactions,
+            cuisine_codes=cuisine_codes,
+            tag_bits=tag_bits,
+        )
+
+
+def select_top_k(
+    scores: np.ndarray,
+    k: int,
+    min_score: float = 0.0,
+) -> np.ndarray:
+    """
+    Return indices of the k best scores at or above min_score, best first.
+    
+    Uses a partial partition instead of sorting the whole array, so the cost
+    is O(n + k log k). Ties are broken by index, matching a stable sort.
+    """
+    candidates = np.flatnonzero(scores >= min_score)
+    if k <= 0 or len(candidates) == 0:
+        return candidates[:0]
+    
+    candidate_scores = scores[candidates]
+    if len(candidates) > k:
+        kth = np.partition(candidate_scores, len(candidates) - k)[len(candidates) - k]
+        above = candidates[candidate_scores > kth]
+        ties = candidates[candidate_scores == kth][: k - len(above)]
+        candidates = np.concatenate([above, ties])
+        candidate_scores = scores[candidates]
+    
+    return candidates[np.lexsort((candidates, -candidate_scores))]
+
 
 class RecommendationEngine:
     """
@@ -199,23 +355,20 @@ class RecommendationEngine:
         if not dish_spice_level or not user_preferred_spice:
             return 0.5  # Neutral if missing data
         
-        spice_levels = ["Mild", "Medium", "Spicy", "Extra Spicy"]
-        
-        try:
-            dish_idx = spice_levels.index(dish_spice_level)
-            user_idx = spice_levels.index(user_preferred_spice)
-            diff = abs(dish_idx - user_idx)
-            
-            if diff == 0:
-                return 1.0
-            elif diff == 1:
-                return 0.7
-            elif diff == 2:
-                return 0.4
-            else:
-                return 0.1
-        except ValueError:
+        dish_idx = SPICE_ORDINALS.get(dish_spice_level)
+        user_idx = SPICE_ORDINALS.get(user_preferred_spice)
+        if dish_idx is None or user_idx is None:
             return 0.5  # Unknown spice level, neutral
+        
+        diff = abs(dish_idx - user_idx)
+        if diff == 0:
+            return 1.0
+        elif diff == 1:
+            return 0.7
+        elif diff == 2:
+            return 0.4
+        else:
+            return 0.1
     
     def _score_cuisine_match(
         self,
@@ -383,6 +536,137 @@ class RecommendationEngine:
         
         # Normalize 1-5 scale to 0-1
         return (dish_rating - 1.0) / 4.0
+    
+    def score_batch(
+        self,
+        columns: DishColumns,
+        user_preferences: Dict,
+        user_favorite_cuisines: Sequence[uuid.UUID],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every dish in ``columns`` in one vectorized pass.
+        
+        Applies the same rules as calculate_match_score, but over column arrays
+        instead of one dish dict at a time.
+        
+        Args:
+            columns: Encoded dish columns (see DishColumns.from_records)
+            user_preferences: User preference dict with spice_level, min_budget, max_budget, etc.
+            user_favorite_cuisines: List of cuisine IDs the user likes
+            
+        Returns:
+            Tuple of (totals: float64 array of shape (n,),
+            breakdown: float64 array of shape (n, 6) in BREAKDOWN_COLUMNS order)
+        """
+        n = len(columns)
+        breakdown = np.empty((n, len(BREAKDOWN_COLUMNS)), dtype=np.float64)
+        
+        breakdown[:, 0] = self._batch_spice_level(
+            columns.spice, user_preferences.get("preferred_spice_level")
+        ) * self.weights.spice_level * 100
+        breakdown[:, 1] = self._batch_cuisine_match(
+            columns, user_favorite_cuisines
+        ) * self.weights.cuisine_match * 100
+        breakdown[:, 2] = self._batch_budget_match(
+            columns.price,
+            user_preferences.get("min_budget"),
+            user_preferences.get("max_budget"),
+        ) * self.weights.budget_match * 100
+        breakdown[:, 3] = self._batch_dietary_tags(
+            columns, user_preferences.get("preferred_dietary_tags", [])
+        ) * self.weights.dietary_tags * 100
+        breakdown[:, 4] = self._batch_past_interactions(
+            columns.interactions
+        ) * self.weights.past_interactions * 100
+        breakdown[:, 5] = self._batch_dish_rating(
+            columns.rating
+        ) * self.weights.dish_rating * 100
+        
+        totals = np.clip(breakdown.sum(axis=1), 0.0, 100.0)
+        return totals, breakdown
+    
+    def _batch_spice_level(
+        self,
+        dish_spice: np.ndarray,
+        user_preferred_spice: Optional[str],
+    ) -> np.ndarray:
+        """Vectorized _score_spice_level over spice ordinals."""
+        user_idx = SPICE_ORDINALS.get(user_preferred_spice) if user_preferred_spice else None
+        if user_idx is None:
+            return np.full(dish_spice.shape, 0.5)
+        
+        diff_scores = np.array([1.0, 0.7, 0.4, 0.1])
+        diff = np.abs(dish_spice.astype(np.int16) - user_idx)
+        return np.where(dish_spice < 0, 0.5, diff_scores[np.minimum(diff, 3)])
+    
+    def _batch_cuisine_match(
+        self,
+        columns: DishColumns,
+        user_favorite_cuisines: Sequence[uuid.UUID],
+    ) -> np.ndarray:
+        """Vectorized _score_cuisine_match over cuisine codes."""
+        if not user_favorite_cuisines:
+            return np.where(columns.cuisine < 0, 0.0, 0.5)
+        
+        favorite_codes = [
+            columns.cuisine_codes[cuisine_id]
+            for cuisine_id in user_favorite_cuisines
+            if cuisine_id in columns.cuisine_codes
+        ]
+        return np.isin(columns.cuisine, favorite_codes).astype(np.float64)
+    
+    def _batch_budget_match(
+        self,
+        price: np.ndarray,
+        min_budget: Optional[float],
+        max_budget: Optional[float],
+    ) -> np.ndarray:
+        """Vectorized _score_budget_match over prices."""
+        if min_budget is None and max_budget is None:
+            return np.full(price.shape, 0.5)
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if max_budget is not None:
+                within = 1.0
+                if min_budget is not None:
+                    within = np.where(price < min_budget, 0.8, 1.0)
+                overage = (price - max_budget) / max_budget
+                scores = np.select(
+                    [price <= max_budget, overage <= 0.10, overage <= 0.20],
+                    [within, 0.7, 0.4],
+                    default=0.0,
+                )
+            else:
+                scores = np.where(price >= min_budget, 1.0, 0.8)
+        
+        return np.where(np.isnan(price), 0.5, scores)
+    
+    def _batch_dietary_tags(
+        self,
+        columns: DishColumns,
+        user_preferred_tags: Sequence[uuid.UUID],
+    ) -> np.ndarray:
+        """Vectorized _score_dietary_tags over dietary tag bitsets."""
+        if not user_preferred_tags:
+            return np.full(len(columns), 0.5)
+        
+        matches = np.zeros(len(columns), dtype=np.int32)
+        for tag_id in set(user_preferred_tags):
+            bit = columns.tag_bits.get(tag_id)
+            if bit is not None:
+                matches += ((columns.dietary_bits >> np.uint64(bit)) & np.uint64(1)).astype(np.int32)
+        
+        return np.array([0.3, 0.7, 1.0])[np.minimum(matches, 2)]
+    
+    def _batch_past_interactions(self, interactions: np.ndarray) -> np.ndarray:
+        """Vectorized _score_past_interactions over interaction count columns."""
+        per_count = np.array([0.5, 0.2, 0.3, 0.4])
+        caps = np.array([1.0, 0.6, 0.9, 1.0])
+        return np.minimum(np.minimum(interactions * per_count, caps).sum(axis=1), 1.0)
+    
+    def _batch_dish_rating(self, rating: np.ndarray) -> np.ndarray:
+        """Vectorized _score_dish_rating over ratings."""
+        return np.where(np.isnan(rating), 0.5, (rating - 1.0) / 4.0)
 
 
 # Default engine instance
@@ -6,20 +6,77 @@ Run this script daily/weekly to retrain the model:
 
 Or schedule with cron:
     0 2 * * * cd /path/to/kyakhao_API && python -m app.ai.training_script
+
+For long windows, stream features to a memory-mapped file instead of
+building them in memory:
+    python -m app.ai.training_script --days-back 365 --streaming
+
+Each run publishes a new version to the model registry (MODEL_REGISTRY_DIR);
+running API workers pick it up without a restart.
+
+Between full runs, update the live model with only the interactions since it
+was trained (e.g. hourly):
+    0 * * * * cd /path/to/kyakhao_API && python -m app.ai.training_script --incremental
 """
+import argparse
 import asyncio
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.ai.ml_pipeline import MLModelTrainer
+from app.ai.model_registry import ModelRegistry
+from app.core.config import settings
 from app.core.database import get_db
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train the recommendation model.")
+    parser.add_argument("--days-back", type=int, default=30, help="Days of interactions to train on")
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Extract features in chunks into a memory-mapped .npy file",
+    )
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Pairs per chunk in streaming mode")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Warm-start the live model on interactions since its high-water mark",
+    )
+    parser.add_argument("--trees-per-increment", type=int, default=10, help="Trees added per increment")
+    return parser.parse_args()
+
+
+async def train_incremental(trainer: MLModelTrainer, db, snapshot_dir: Path, trees_per_increment: int):
+    """Run one increment and print its metrics."""
+    metrics = await trainer.train_incremental(
+        db,
+        ModelRegistry(settings.MODEL_REGISTRY_DIR),
+        snapshot_dir=str(snapshot_dir),
+        trees_per_increment=trees_per_increment,
+    )
+    
+    print(f"   Window: {metrics['since']} -> {metrics['until']}")
+    print(f"   Samples: {metrics['samples']} ({metrics['positives']} positive)")
+    if metrics.get('skipped'):
+        print("⏭️  Not enough new interactions; they will be included in the next increment.")
+        return
+    
+    print("✅ Incremental training completed!")
+    print(f"   ROC-AUC: {metrics['base_roc_auc']:.3f} -> {metrics['roc_auc']:.3f}")
+    print(f"   Precision: {metrics['precision']:.3f}")
+    print(f"   Recall: {metrics['recall']:.3f}")
+    print(f"   Trees: {metrics['n_estimators']}")
+    print(f"   Live version: {metrics['model_version']}")
+
+
 async def main():
     """Main training function."""
+    args = parse_args()
     print("🚀 Starting ML model training...")
     
     # Get database session
@@ -31,8 +88,34 @@ async def main():
             model_path = Path(__file__).parent / 'models' / 'recommendation_model.pkl'
             model_path.parent.mkdir(parents=True, exist_ok=True)
             
+            if args.incremental:
+                print("📊 Extracting new interactions...")
+                await train_incremental(
+                    trainer, db, model_path.parent / 'increments', args.trees_per_increment
+                )
+                break
+            
+            trained_until = datetime.now()
             print("📊 Preparing training data...")
-            metrics = await trainer.train(db, model_save_path=str(model_path))
+            features_path = None
+            if args.streaming:
+                features_path = str(model_path.parent / 'training_features.npy')
+                X, _ = await trainer.prepare_training_data_streaming(
+                    db,
+                    features_path,
+                    days_back=args.days_back,
+                    chunk_size=args.chunk_size,
+                )
+                print(f"   Streamed {len(X)} samples to {features_path}")
+            
+            metrics = await trainer.train(
+                db,
+                model_save_path=str(model_path),
+                days_back=args.days_back,
+                features_path=features_path,
+                registry=ModelRegistry(settings.MODEL_REGISTRY_DIR),
+                trained_until=trained_until,
+            )
             
             print("✅ Training completed!")
             print(f"   Accuracy: {metrics['accuracy']:.3f}")
@@ -40,6 +123,7 @@ async def main():
             print(f"   Recall: {metrics['recall']:.3f}")
             print(f"   ROC-AUC: {metrics['roc_auc']:.3f}")
             print(f"   Model saved to: {metrics['model_path']}")
+            print(f"   Live version: {metrics['model_version']}")
             
             break  # Exit after first iteration
             
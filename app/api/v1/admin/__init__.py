@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends
 
 from app.utils.auth import get_current_admin
 
-from .endpoints import allergies, contact, cuisines, dishes, faq, favorites, moods, notifications, promotions, restaurants, reviews
+from .endpoints import allergies, contact, cuisines, dishes, faq, favorites, moods, notifications, promotions, restaurants, reviews, search
 
 admin_router = APIRouter(dependencies=[Depends(get_current_admin)])
 
@@ -17,6 +17,7 @@ admin_router.include_router(notifications.router)
 admin_router.include_router(promotions.router)
 admin_router.include_router(restaurants.router)
 admin_router.include_router(reviews.router)
+admin_router.include_router(search.router)
 admin_router.include_router(
     faq.router, prefix="/faqs"
 )
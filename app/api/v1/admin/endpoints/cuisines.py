@@ -13,6 +13,7 @@ from app.core.response_handler import error_response, success_response
 from app.models.food import Cuisine
 from app.schemas.cuisine import CuisineCreate, CuisineOut, CuisineUpdate
 from app.schemas.pagination import PaginationParams, PaginatedResponse
+from app.services.cache_service import get_cache_service
 from app.utils.pagination import paginate
 from app.api.v1.endpoints.cuisines import get_cuisine_or_404
 
@@ -78,6 +79,8 @@ async def create_cuisine(
         cuisine = Cuisine(**payload.dict())
         session.add(cuisine)
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_cuisine(cuisine.id)
         await session.refresh(cuisine)
         
         cuisine_out = CuisineOut.model_validate(cuisine)
@@ -117,6 +120,8 @@ async def update_cuisine(
         for field, value in payload.dict(exclude_unset=True).items():
             setattr(cuisine, field, value)
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_cuisine(cuisine.id)
         await session.refresh(cuisine)
         
         cuisine_out = CuisineOut.model_validate(cuisine)
@@ -156,6 +161,8 @@ async def delete_cuisine(
         cuisine = await get_cuisine_or_404(session, cuisine_id)
         cuisine.is_deleted = True
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_cuisine(cuisine.id)
         return success_response(
             message="Cuisine deleted successfully",
             data={"id": str(cuisine.id), "name": cuisine.name}
@@ -69,9 +69,8 @@ async def get_dish(
     try:
         # Use service layer - thin controller
         service = DishService(session)
-        dish = await service.get_dish(dish_id)
+        dish_out = await service.get_dish_detail(dish_id)
         
-        dish_out = serialize_dish(dish)
         return success_response(
             message="Dish retrieved successfully",
             data=dish_out
@@ -11,6 +11,7 @@ from app.core.admin_deps import AdminUser
 from app.core.response_handler import error_response, success_response
 from app.models.faq import FAQ
 from app.schemas.faq import FAQCreate, FAQUpdate, FAQResponse, FAQListResponse
+from app.services.cache_service import get_cache_service
 from app.utils.faq_utils import (
     get_all_faqs,
     get_faq_by_id_or_404,
@@ -47,6 +48,8 @@ async def create_faq(
         )
         db.add(db_faq)
         await db.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_faq(db_faq.id)
         await db.refresh(db_faq)
 
         faq_response = FAQResponse.model_validate(db_faq)
@@ -151,6 +154,8 @@ async def update_faq(
                 setattr(faq, field, value)
 
         await db.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_faq(faq.id)
         await db.refresh(faq)
 
         faq_response = FAQResponse.model_validate(faq)
@@ -185,6 +190,8 @@ async def delete_faq(
     try:
         faq = await soft_delete_faq(db, faq_id)
         await db.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_faq(faq.id)
         
         return success_response(
             message="FAQ deleted successfully",
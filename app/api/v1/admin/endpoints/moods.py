@@ -13,6 +13,7 @@ from app.core.response_handler import error_response, success_response
 from app.models.food import Mood
 from app.schemas.mood import MoodCreate, MoodOut, MoodUpdate
 from app.schemas.pagination import PaginationParams, PaginatedResponse
+from app.services.cache_service import get_cache_service
 from app.utils.pagination import paginate
 from app.api.v1.endpoints.moods import get_mood_or_404
 
@@ -78,6 +79,8 @@ async def create_mood(
         mood = Mood(**payload.dict())
         session.add(mood)
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_mood(mood.id)
         await session.refresh(mood)
         
         mood_out = MoodOut.model_validate(mood)
@@ -117,6 +120,8 @@ async def update_mood(
         for field, value in payload.dict(exclude_unset=True).items():
             setattr(mood, field, value)
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_mood(mood.id)
         await session.refresh(mood)
         
         mood_out = MoodOut.model_validate(mood)
@@ -156,6 +161,8 @@ async def delete_mood(
         mood = await get_mood_or_404(session, mood_id)
         mood.is_deleted = True
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_mood(mood.id)
         return success_response(
             message="Mood deleted successfully",
             data={"id": str(mood.id), "name": mood.name}
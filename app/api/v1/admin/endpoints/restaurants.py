@@ -13,6 +13,7 @@ from app.core.response_handler import error_response, success_response
 from app.models.food import Restaurant
 from app.schemas.restaurant import RestaurantCreate, RestaurantOut, RestaurantUpdate
 from app.schemas.pagination import PaginationParams, PaginatedResponse
+from app.services.cache_service import get_cache_service
 from app.utils.pagination import paginate
 from app.api.v1.endpoints.restaurants import get_restaurant_or_404
 
@@ -78,6 +79,8 @@ async def create_restaurant(
         restaurant = Restaurant(**payload.dict())
         session.add(restaurant)
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_restaurant(restaurant.id)
         await session.refresh(restaurant)
         
         restaurant_out = RestaurantOut.model_validate(restaurant)
@@ -117,6 +120,8 @@ async def update_restaurant(
         for field, value in payload.dict(exclude_unset=True).items():
             setattr(restaurant, field, value)
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_restaurant(restaurant.id)
         await session.refresh(restaurant)
         
         restaurant_out = RestaurantOut.model_validate(restaurant)
@@ -156,6 +161,8 @@ async def delete_restaurant(
         restaurant = await get_restaurant_or_404(session, restaurant_id)
         restaurant.is_deleted = True
         await session.commit()
+        cache = await get_cache_service()
+        await cache.invalidate_restaurant(restaurant.id)
         return success_response(
             message="Restaurant deleted successfully",
             data={"id": str(restaurant.id), "name": restaurant.name}
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Query, status
+
+from app.core.config import settings
+from app.core.response_handler import error_response, success_response
+from app.services.cache_service import get_cache_service
+from app.services.search_cache import top_search_queries
+
+router = APIRouter(prefix="/search", tags=["Admin"])
+
+
+@router.get("/top-queries")
+async def list_top_queries(
+    days: int = Query(default=7, gt=0, description="Days to sum, today included"),
+    limit: int = Query(default=20, gt=0, le=100),
+) -> Any:
+    """Most searched (normalized) queries over the last `days` days."""
+    try:
+        cache = await get_cache_service()
+        days = min(days, settings.SEARCH_STATS_RETENTION_DAYS)
+        queries = await top_search_queries(cache, days, limit)
+        return success_response(
+            message="Top search queries retrieved successfully",
+            data={"days": days, "queries": queries}
+        )
+    except Exception as e:
+        return error_response(
+            message=f"Error retrieving top search queries: {str(e)}",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -13,6 +13,7 @@ from app.models.food import Cuisine
 from app.schemas.cuisine import CuisineOut
 from app.schemas.pagination import PaginationParams
 from app.utils.pagination import paginate
+from app.utils.response_cache import cached_response
 
 router = APIRouter(prefix="/cuisines", tags=["Cuisines"])
 
@@ -28,6 +29,7 @@ async def get_cuisine_or_404(session: AsyncSession, cuisine_id: uuid.UUID) -> Cu
 
 
 @router.get("/")
+@cached_response("cuisine:list")
 async def list_cuisines(
     params: PaginationParams = Depends(),
     session: AsyncSession = Depends(get_db),
@@ -13,12 +13,18 @@ from app.core.response_handler import error_response, success_response
 from app.models.food import Dish, Mood
 from app.schemas.dish import DishFilterParams, DishOut
 from app.schemas.pagination import PaginationParams
+from app.services.cache_service import get_cache_service
+from app.services.dish_service import DishService
 from app.utils.pagination import paginate
+from app.utils.response_cache import cached_response
 
 router = APIRouter(prefix="/dishes", tags=["Dishes"])
 
 
 async def get_dish_or_404(session: AsyncSession, dish_id: uuid.UUID) -> Dish:
+    cache = await get_cache_service()
+    if await cache.known_missing("dish", dish_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dish not found")
     result = await session.execute(
         select(Dish)
         .options(selectinload(Dish.moods))
@@ -26,6 +32,7 @@ async def get_dish_or_404(session: AsyncSession, dish_id: uuid.UUID) -> Dish:
     )
     dish = result.scalar_one_or_none()
     if not dish:
+        await cache.remember_missing("dish", dish_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dish not found")
     return dish
 
@@ -35,6 +42,7 @@ def serialize_dish(dish: Dish) -> DishOut:
 
 
 @router.get("/")
+@cached_response("dish:list", "mood:list")
 async def list_dishes(
     params: PaginationParams = Depends(),
     filters: DishFilterParams = Depends(),
@@ -91,6 +99,7 @@ async def list_dishes(
 # Otherwise FastAPI will try to match "featured" and "top-rated" as UUIDs
 
 @router.get("/featured")
+@cached_response("dish:featured", "mood:list")
 async def featured_dishes(
     limit: int = Query(default=10, gt=0, le=50),
     session: AsyncSession = Depends(get_db),
@@ -119,6 +128,7 @@ async def featured_dishes(
 
 
 @router.get("/top-rated")
+@cached_response("dish:top-rated", "mood:list")
 async def top_rated_dishes(
     limit: int = Query(default=10, gt=0, le=50),
     session: AsyncSession = Depends(get_db),
@@ -202,8 +212,7 @@ async def dishes_by_mood(
 @router.get("/{dish_id}")
 async def get_dish(dish_id: uuid.UUID, session: AsyncSession = Depends(get_db)) -> Any:
     try:
-        dish = await get_dish_or_404(session, dish_id)
-        dish_out = serialize_dish(dish)
+        dish_out = await DishService(session).get_dish_detail(dish_id)
         return success_response(
             message="Dish retrieved successfully",
             data=dish_out
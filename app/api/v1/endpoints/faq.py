@@ -12,11 +12,13 @@ from app.utils.faq_utils import (
     get_faq_by_id_or_404,
     get_published_faqs,
 )
+from app.utils.response_cache import cached_response
 
 router = APIRouter(tags=["FAQs"])
 
 
 @router.get("/")
+@cached_response("faq:list", public=True)
 async def get_all_faqs(
     db: AsyncSession = Depends(get_db),
     skip: int = 0,
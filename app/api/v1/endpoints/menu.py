@@ -21,6 +21,7 @@ from app.schemas.menu import (
 )
 from app.schemas.pagination import PaginatedResponse, PaginationParams
 from app.utils.pagination import paginate
+from app.utils.response_cache import cached_response
 
 router = APIRouter(prefix="/menu", tags=["Menu"])
 
@@ -95,6 +96,7 @@ async def get_restaurant_by_category(category_name: str, session: AsyncSession)
 
 
 @router.get("/categories", response_model=List[MenuCategoryOut])
+@cached_response("restaurant:list", "dish:list")
 async def list_menu_categories(
     session: AsyncSession = Depends(get_db),
 ) -> List[MenuCategoryOut]:
@@ -13,6 +13,7 @@ from app.models.food import Mood
 from app.schemas.mood import MoodOut
 from app.schemas.pagination import PaginationParams
 from app.utils.pagination import paginate
+from app.utils.response_cache import cached_response
 
 router = APIRouter(prefix="/moods", tags=["Moods"])
 
@@ -28,6 +29,7 @@ async def get_mood_or_404(session: AsyncSession, mood_id: uuid.UUID) -> Mood:
 
 
 @router.get("/")
+@cached_response("mood:list")
 async def list_moods(
     params: PaginationParams = Depends(),
     session: AsyncSession = Depends(get_db),
@@ -14,6 +14,8 @@ from app.core.response_handler import error_response
 from app.models.food import Cuisine, Restaurant, UserCuisineAssociation, UserRestaurantAssociation
 from app.models.user import User
 from app.schemas.personalization import PersonalizationResponse, PersonalizationUpdate
+from app.services.cache_service import get_cache_service
+from app.tasks.recommendation_tasks import schedule_recommendation_refresh
 from app.utils.auth import get_current_user
 
 router = APIRouter(prefix="/users", tags=["Personalization"])
@@ -139,6 +141,9 @@ async def update_personalization(
         await db.commit()
         await db.refresh(user)
         
+        # Spice level and favorite cuisines feed the recommendation scores
+        await schedule_recommendation_refresh(user_id, await get_cache_service(), invalidate=True)
+        
         # Get updated cuisines
         stmt = select(Cuisine).join(
             UserCuisineAssociation,
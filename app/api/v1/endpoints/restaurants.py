@@ -12,6 +12,7 @@ from app.core.response_handler import error_response, success_response
 from app.models.food import Dish, Restaurant
 from app.schemas.dish import DishOut
 from app.schemas.pagination import PaginatedResponse, PaginationParams
+from app.services.cache_service import get_cache_service
 from app.schemas.restaurant import (
     NearbyRestaurantRequest,
     RestaurantOut,
@@ -24,11 +25,15 @@ router = APIRouter(prefix="/restaurants", tags=["Restaurants"])
 
 
 async def get_restaurant_or_404(session: AsyncSession, restaurant_id: uuid.UUID) -> Restaurant:
+    cache = await get_cache_service()
+    if await cache.known_missing("restaurant", restaurant_id):
+        raise HTTPException(status_code=404, detail="Restaurant not found")
     result = await session.execute(
         select(Restaurant).where(Restaurant.id == restaurant_id, Restaurant.is_deleted.is_(False))
     )
     restaurant = result.scalar_one_or_none()
     if not restaurant:
+        await cache.remember_missing("restaurant", restaurant_id)
         raise HTTPException(status_code=404, detail="Restaurant not found")
     return restaurant
 
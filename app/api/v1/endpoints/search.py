@@ -1,18 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy import func, select
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.core.response_handler import error_response, success_response
-from app.models.food import Cuisine, Dish, Restaurant
 from app.schemas.cuisine import CuisineOut
 from app.schemas.dish import DishOut
 from app.schemas.restaurant import RestaurantOut
+from app.services.cache_service import get_cache_service
+from app.services.search_cache import cached_search, record_search_query
+from app.services.search_service import SearchService
+from app.services.suggest_service import suggest
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
@@ -20,51 +22,78 @@ router = APIRouter(prefix="/search", tags=["Search"])
 @router.get("/")
 async def global_search(
     q: str = Query(..., min_length=2, description="Search keyword"),
-    limit: int = Query(default=10, gt=0, le=50),
+    limit: int = Query(default=10, gt=0, le=50, description="Results per type"),
+    dish_limit: Optional[int] = Query(default=None, ge=0, le=50, description="Dish results (0 skips dishes)"),
+    restaurant_limit: Optional[int] = Query(default=None, ge=0, le=50, description="Restaurant results"),
+    cuisine_limit: Optional[int] = Query(default=None, ge=0, le=50, description="Cuisine results"),
+    dish_cursor: Optional[str] = Query(default=None, description="next_cursors.dishes of the previous page"),
+    restaurant_cursor: Optional[str] = Query(default=None, description="next_cursors.restaurants of the previous page"),
+    cuisine_cursor: Optional[str] = Query(default=None, description="next_cursors.cuisines of the previous page"),
+    facets: bool = Query(default=False, description="Also return facet counts of the matching dishes"),
     session: AsyncSession = Depends(get_db),
 ) -> Any:
-    try:
-        term = f"%{q.lower()}%"
+    limits = {"dishes": dish_limit, "restaurants": restaurant_limit, "cuisines": cuisine_limit}
+    cursors = {"dishes": dish_cursor, "restaurants": restaurant_cursor, "cuisines": cuisine_cursor}
 
-        dish_stmt = (
-            select(Dish)
-            .options(selectinload(Dish.moods))
-            .where(Dish.is_deleted.is_(False), func.lower(Dish.name).like(term))
-            .limit(limit)
-        )
-        restaurant_stmt = (
-            select(Restaurant)
-            .where(Restaurant.is_deleted.is_(False), func.lower(Restaurant.name).like(term))
-            .limit(limit)
-        )
-        cuisine_stmt = (
-            select(Cuisine)
-            .where(Cuisine.is_deleted.is_(False), func.lower(Cuisine.name).like(term))
-            .limit(limit)
+    async def render():
+        results = await SearchService(session).search(
+            q,
+            limit,
+            limits={group: value for group, value in limits.items() if value is not None},
+            cursors=cursors,
+            facets=facets,
         )
-
-        dish_result = await session.execute(dish_stmt)
-        dishes = [DishOut.model_validate(item).model_dump() for item in dish_result.scalars().all()]
-
-        restaurant_result = await session.execute(restaurant_stmt)
-        restaurants = [RestaurantOut.model_validate(item).model_dump() for item in restaurant_result.scalars().all()]
-
-        cuisine_result = await session.execute(cuisine_stmt)
-        cuisines = [CuisineOut.model_validate(item).model_dump() for item in cuisine_result.scalars().all()]
-
-        search_data = {
-            "query": q,
-            "dishes": dishes,
-            "restaurants": restaurants,
-            "cuisines": cuisines
+        data = {
+            "dishes": [DishOut.model_validate(item).model_dump() for item in results.pages["dishes"].items],
+            "restaurants": [RestaurantOut.model_validate(item).model_dump() for item in results.pages["restaurants"].items],
+            "cuisines": [CuisineOut.model_validate(item).model_dump() for item in results.pages["cuisines"].items],
+            "next_cursors": {group: page.next_cursor for group, page in results.pages.items()},
         }
+        if facets:
+            data["facets"] = results.facets
+        return jsonable_encoder(data)
+
+    try:
+        cache = await get_cache_service()
+        params = {"limit": limit, "limits": limits, "cursors": cursors, "facets": facets}
+        search_data = {"query": q, **await cached_search(cache, q, params, render)}
+        if not any(cursors.values()):
+            await record_search_query(cache, q)
         
         return success_response(
             message="Search completed successfully",
             data=search_data
         )
+    except ValueError as e:
+        return error_response(
+            message=str(e),
+            status_code=status.HTTP_400_BAD_REQUEST
+        )
     except Exception as e:
         return error_response(
             message=f"Error performing search: {str(e)}",
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
+
+
+@router.get("/suggest")
+async def suggest_search(
+    q: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    limit: int = Query(default=8, gt=0, le=20),
+    kind: Optional[Literal["dish", "restaurant", "cuisine"]] = Query(
+        default=None, alias="type", description="Only suggest this kind of entry"
+    ),
+    session: AsyncSession = Depends(get_db),
+) -> Any:
+    """Type-ahead suggestions across dishes, restaurants and cuisines."""
+    try:
+        suggestions = await suggest(session, q, limit, kind)
+        return success_response(
+            message="Suggestions retrieved successfully",
+            data={"query": q, "suggestions": suggestions}
+        )
+    except Exception as e:
+        return error_response(
+            message=f"Error retrieving suggestions: {str(e)}",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -2,17 +2,18 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
-from app.models.food import Cuisine, Dish, Restaurant
 from app.schemas.cuisine import CuisineOut
 from app.schemas.dish import DishOut
 from app.schemas.restaurant import RestaurantOut
 from app.schemas.search import SearchResponse
+from app.services.cache_service import get_cache_service
+from app.services.search_cache import cached_search, record_search_query
+from app.services.search_service import SearchService
 
 router = APIRouter(prefix="/search", tags=["User Search"])
 
@@ -20,35 +21,42 @@ router = APIRouter(prefix="/search", tags=["User Search"])
 @router.get("/", response_model=SearchResponse)
 async def global_search(
     q: str = Query(..., min_length=2, description="Search keyword"),
-    limit: int = Query(default=10, gt=0, le=50),
+    limit: int = Query(default=10, gt=0, le=50, description="Results per type"),
+    dish_limit: Optional[int] = Query(default=None, ge=0, le=50, description="Dish results (0 skips dishes)"),
+    restaurant_limit: Optional[int] = Query(default=None, ge=0, le=50, description="Restaurant results"),
+    cuisine_limit: Optional[int] = Query(default=None, ge=0, le=50, description="Cuisine results"),
+    dish_cursor: Optional[str] = Query(default=None, description="next_cursors.dishes of the previous page"),
+    restaurant_cursor: Optional[str] = Query(default=None, description="next_cursors.restaurants of the previous page"),
+    cuisine_cursor: Optional[str] = Query(default=None, description="next_cursors.cuisines of the previous page"),
+    facets: bool = Query(default=False, description="Also return facet counts of the matching dishes"),
     session: AsyncSession = Depends(get_db),
 ) -> SearchResponse:
-    term = f"%{q.lower()}%"
-
-    dish_stmt = (
-        select(Dish)
-        .options(selectinload(Dish.moods))
-        .where(Dish.is_deleted.is_(False), func.lower(Dish.name).like(term))
-        .limit(limit)
-    )
-    restaurant_stmt = (
-        select(Restaurant)
-        .where(Restaurant.is_deleted.is_(False), func.lower(Restaurant.name).like(term))
-        .limit(limit)
-    )
-    cuisine_stmt = (
-        select(Cuisine)
-        .where(Cuisine.is_deleted.is_(False), func.lower(Cuisine.name).like(term))
-        .limit(limit)
-    )
-
-    dish_result = await session.execute(dish_stmt)
-    dishes = [DishOut.model_validate(item) for item in dish_result.scalars().all()]
-
-    restaurant_result = await session.execute(restaurant_stmt)
-    restaurants = [RestaurantOut.model_validate(item) for item in restaurant_result.scalars().all()]
-
-    cuisine_result = await session.execute(cuisine_stmt)
-    cuisines = [CuisineOut.model_validate(item) for item in cuisine_result.scalars().all()]
-
-    return SearchResponse(query=q, dishes=dishes, restaurants=restaurants, cuisines=cuisines)
+    limits = {"dishes": dish_limit, "restaurants": restaurant_limit, "cuisines": cuisine_limit}
+    cursors = {"dishes": dish_cursor, "restaurants": restaurant_cursor, "cuisines": cuisine_cursor}
+
+    async def render():
+        results = await SearchService(session).search(
+            q,
+            limit,
+            limits={group: value for group, value in limits.items() if value is not None},
+            cursors=cursors,
+            facets=facets,
+        )
+        return jsonable_encoder({
+            "dishes": [DishOut.model_validate(item) for item in results.pages["dishes"].items],
+            "restaurants": [RestaurantOut.model_validate(item) for item in results.pages["restaurants"].items],
+            "cuisines": [CuisineOut.model_validate(item) for item in results.pages["cuisines"].items],
+            "next_cursors": {group: page.next_cursor for group, page in results.pages.items()},
+            "facets": results.facets,
+        })
+
+    cache = await get_cache_service()
+    params = {"limit": limit, "limits": limits, "cursors": cursors, "facets": facets}
+    try:
+        data = await cached_search(cache, q, params, render)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not any(cursors.values()):
+        await record_search_query(cache, q)
+
+    return SearchResponse(query=q, **data)
@@ -13,6 +13,8 @@ celery_app = Celery(
     backend=settings.CELERY_RESULT_BACKEND,
     include=[
         "app.tasks.email_tasks",
+        "app.tasks.recommendation_tasks",
+        "app.tasks.cache_tasks",
     ],
 )
 
@@ -38,3 +40,12 @@ celery_app.conf.update(
     task_ignore_result=False,
     task_store_eager_result=True,
 )
+
+
+# Periodic tasks (run with: celery -A app.core.celery_app beat)
+celery_app.conf.beat_schedule = {
+    "refresh-all-recommendations": {
+        "task": "refresh_all_recommendations",
+        "schedule": float(settings.RECOMMENDATION_REFRESH_INTERVAL),
+    },
+}
@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Dict, List
 
 from dotenv import load_dotenv
 
@@ -47,6 +47,80 @@ class Settings:
     CACHE_DEFAULT_TTL: int = int(os.getenv("CACHE_DEFAULT_TTL", "3600"))  # 1 hour
     CACHE_DISH_TTL: int = int(os.getenv("CACHE_DISH_TTL", "1800"))  # 30 minutes
     CACHE_LIST_TTL: int = int(os.getenv("CACHE_LIST_TTL", "600"))  # 10 minutes
+    # In-process (L1) tier in front of Redis
+    CACHE_L1_ENABLED: bool = os.getenv("CACHE_L1_ENABLED", "true").lower() == "true"
+    CACHE_L1_MAX_ENTRIES: int = int(os.getenv("CACHE_L1_MAX_ENTRIES", "1000"))  # per namespace
+    CACHE_L1_TTL: int = int(os.getenv("CACHE_L1_TTL", "60"))  # seconds; bounds staleness if an invalidation is missed
+    CACHE_INVALIDATION_CHANNEL: str = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+    CACHE_LOCK_TIMEOUT: float = float(os.getenv("CACHE_LOCK_TIMEOUT", "10"))  # seconds a refill lock is held
+    CACHE_NEGATIVE_TTL: int = int(os.getenv("CACHE_NEGATIVE_TTL", "60"))  # seconds a "not found" is remembered
+    # In-process Bloom filters of live dish/restaurant ids (reject unknown ids without a query)
+    ID_FILTER_ENABLED: bool = os.getenv("ID_FILTER_ENABLED", "true").lower() == "true"
+    ID_FILTER_REFRESH_SECONDS: int = int(os.getenv("ID_FILTER_REFRESH_SECONDS", "300"))
+    ID_FILTER_ERROR_RATE: float = float(os.getenv("ID_FILTER_ERROR_RATE", "0.01"))
+    # Catalog search: query the dish/restaurant/cuisine groups (and facets) concurrently
+    SEARCH_CONCURRENT_QUERIES: bool = os.getenv("SEARCH_CONCURRENT_QUERIES", "true").lower() == "true"
+    # Extra pooled connections concurrent searches may hold at once, per process (pool: 3 + 5 overflow)
+    SEARCH_MAX_EXTRA_CONNECTIONS: int = int(os.getenv("SEARCH_MAX_EXTRA_CONNECTIONS", "2"))
+    # Rendered search results, keyed on the normalized query (app/services/search_cache.py)
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_TTL: int = int(os.getenv("SEARCH_CACHE_TTL", "300"))  # seconds
+    # Daily top-query rankings in Redis
+    SEARCH_STATS_ENABLED: bool = os.getenv("SEARCH_STATS_ENABLED", "true").lower() == "true"
+    SEARCH_STATS_RETENTION_DAYS: int = int(os.getenv("SEARCH_STATS_RETENTION_DAYS", "7"))
+    SEARCH_STATS_MAX_QUERIES: int = int(os.getenv("SEARCH_STATS_MAX_QUERIES", "10000"))  # per day, trimmed to the top
+    # In-process prefix index behind /search/suggest, updated on catalog writes
+    SUGGEST_INDEX_ENABLED: bool = os.getenv("SUGGEST_INDEX_ENABLED", "true").lower() == "true"
+    SUGGEST_INDEX_REBUILD_SECONDS: int = int(os.getenv("SUGGEST_INDEX_REBUILD_SECONDS", "3600"))  # full rebuild interval
+    # Redis connection pool used by CacheService
+    CACHE_REDIS_MAX_CONNECTIONS: int = int(os.getenv("CACHE_REDIS_MAX_CONNECTIONS", "50"))  # per process
+    CACHE_REDIS_SOCKET_TIMEOUT: float = float(os.getenv("CACHE_REDIS_SOCKET_TIMEOUT", "2"))  # seconds
+    CACHE_REDIS_HEALTH_CHECK_INTERVAL: int = int(os.getenv("CACHE_REDIS_HEALTH_CHECK_INTERVAL", "30"))  # seconds
+    CACHE_REDIS_RECONNECT_MIN_DELAY: float = float(os.getenv("CACHE_REDIS_RECONNECT_MIN_DELAY", "1"))  # seconds
+    CACHE_REDIS_RECONNECT_MAX_DELAY: float = float(os.getenv("CACHE_REDIS_RECONNECT_MAX_DELAY", "60"))  # seconds
+    # Payload format: codec json | orjson | msgpack, compression none | zstd | lz4
+    # (orjson, msgpack, zstandard and lz4 are optional packages)
+    CACHE_CODEC: str = os.getenv("CACHE_CODEC", "json")
+    CACHE_COMPRESSION: str = os.getenv("CACHE_COMPRESSION", "none")
+    CACHE_COMPRESSION_THRESHOLD: int = int(os.getenv("CACHE_COMPRESSION_THRESHOLD", "1024"))  # bytes
+    # HTTP response cache (ETag / 304) for catalog list endpoints
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_TTL: int = int(os.getenv("RESPONSE_CACHE_TTL", "600"))  # seconds kept server-side
+    RESPONSE_CACHE_MAX_AGE: int = int(os.getenv("RESPONSE_CACHE_MAX_AGE", "60"))  # Cache-Control max-age
+    # Hot responses are refreshed in the background instead of expiring under load
+    RESPONSE_CACHE_STALE_TTL: int = int(os.getenv("RESPONSE_CACHE_STALE_TTL", "60"))  # seconds served stale while refreshing
+    RESPONSE_CACHE_EARLY_EXPIRATION: float = float(os.getenv("RESPONSE_CACHE_EARLY_EXPIRATION", "1.0"))  # XFetch beta, 0 disables
+    # Catalog cache warming (app/utils/cache_warming.py)
+    CACHE_WARM_ON_STARTUP: bool = os.getenv("CACHE_WARM_ON_STARTUP", "true").lower() == "true"
+    CACHE_WARM_PAGES: int = int(os.getenv("CACHE_WARM_PAGES", "5"))  # dish listing pages
+    CACHE_WARM_CONCURRENCY: int = int(os.getenv("CACHE_WARM_CONCURRENCY", "4"))  # responses rendered at once
+    # Prometheus /metrics endpoint (main.py)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    @property
+    def CACHE_L1_NAMESPACE_LIMITS(self) -> Dict[str, int]:
+        """Per-namespace L1 sizes, e.g. CACHE_L1_NAMESPACE_LIMITS="dish=5000,faq=50"."""
+        raw = os.getenv("CACHE_L1_NAMESPACE_LIMITS", "")
+        limits = {}
+        for item in raw.split(","):
+            namespace, _, size = item.partition("=")
+            if namespace.strip() and size.strip():
+                limits[namespace.strip()] = int(size)
+        return limits
+
+    # Materialized recommendation settings
+    RECOMMENDATION_STORE_SIZE: int = int(os.getenv("RECOMMENDATION_STORE_SIZE", "100"))
+    RECOMMENDATION_STORE_TTL: int = int(os.getenv("RECOMMENDATION_STORE_TTL", "21600"))  # 6 hours
+    RECOMMENDATION_REFRESH_DELAY: int = int(os.getenv("RECOMMENDATION_REFRESH_DELAY", "30"))  # seconds
+    RECOMMENDATION_REFRESH_INTERVAL: int = int(
+        os.getenv("RECOMMENDATION_REFRESH_INTERVAL", "3600")
+    )  # 1 hour
+    RECOMMENDATION_ACTIVE_DAYS: int = int(os.getenv("RECOMMENDATION_ACTIVE_DAYS", "30"))
+    RECOMMENDATION_MODEL_PATH: str = os.getenv(
+        "RECOMMENDATION_MODEL_PATH", "app/ai/models/recommendation_model.pkl"
+    )
+    MODEL_REGISTRY_DIR: str = os.getenv("MODEL_REGISTRY_DIR", "app/ai/models/registry")
+    MODEL_REGISTRY_POLL_SECONDS: float = float(os.getenv("MODEL_REGISTRY_POLL_SECONDS", "30"))
     CELERY_TASK_SERIALIZER: str = "json"
     CELERY_RESULT_SERIALIZER: str = "json"
     CELERY_ACCEPT_CONTENT: List[str] = ["json"]
@@ -0,0 +1,58 @@
+"""
+In-process Prometheus metrics, served by the /metrics endpoint in main.py.
+
+Metrics live in a dedicated registry (not prometheus_client's global one),
+so nothing outside this module ends up on the endpoint by accident. Each
+process exposes its own counters; scrape every worker.
+"""
+
+from typing import Dict, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+
+REGISTRY = CollectorRegistry()
+
+CACHE_REQUESTS = Counter(
+    "cache_requests",
+    "Cache lookups by key namespace, tier (l1 = in-process, l2 = Redis) and result.",
+    ["namespace", "tier", "result"],
+    registry=REGISTRY,
+)
+CACHE_ERRORS = Counter(
+    "cache_errors",
+    "Cache operations that failed (Redis unreachable, undecodable payloads, ...).",
+    ["namespace", "operation"],
+    registry=REGISTRY,
+)
+CACHE_PAYLOAD_BYTES = Histogram(
+    "cache_payload_bytes",
+    "Encoded size of values read from or written to Redis.",
+    ["namespace", "operation"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    registry=REGISTRY,
+)
+CACHE_LATENCY = Histogram(
+    "cache_operation_seconds",
+    "Redis round-trip time of cache reads and writes.",
+    ["namespace", "operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    registry=REGISTRY,
+)
+CACHE_L1_ENTRIES = Gauge(
+    "cache_l1_entries",
+    "Entries held in the in-process L1 tier.",
+    ["namespace"],
+    registry=REGISTRY,
+)
+
+
+def set_l1_entries(sizes: Dict[str, int]) -> None:
+    """Refresh the L1 size gauge (from CacheService.get_stats) before a scrape."""
+    CACHE_L1_ENTRIES.clear()
+    for namespace, size in sizes.items():
+        CACHE_L1_ENTRIES.labels(namespace).set(size)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Exposition-format body and its content type."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -1,6 +1,6 @@
 """Repository for Dish data access operations."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import select, and_, or_
@@ -9,6 +9,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.food import Dish, Restaurant, Cuisine, Mood
 from app.repositories.base import BaseRepository
+from app.schemas.dish import DishDetailOut
 from app.services.cache_service import get_cache_service
 from app.core.config import settings
 
@@ -19,27 +20,16 @@ class DishRepository(BaseRepository[Dish]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Dish)
 
-    async def get_by_id_with_relations(self, id: UUID, use_cache: bool = True) -> Optional[Dish]:
+    async def get_by_id_with_relations(self, id: UUID) -> Optional[Dish]:
         """
         Get dish by ID with all relations eagerly loaded.
         
         Args:
             id: Dish UUID
-            use_cache: Whether to use cache (default: True)
             
         Returns:
             Dish with moods, restaurant, and cuisine loaded
         """
-        cache_key = f"dish:{id}:full"
-        
-        # Try cache first
-        if use_cache and settings.CACHE_ENABLED:
-            cache = await get_cache_service()
-            cached = await cache.get(cache_key)
-            if cached:
-                # Reconstruct dish from cached data (simplified - in production, use proper deserialization)
-                pass  # For now, always fetch from DB for data integrity
-        
         stmt = (
             select(Dish)
             .options(
@@ -50,23 +40,69 @@ class DishRepository(BaseRepository[Dish]):
             .where(Dish.id == id, Dish.is_deleted == False)
         )
         result = await self.session.execute(stmt)
-        dish = result.scalar_one_or_none()
-        
-        # Cache result
-        if dish and use_cache and settings.CACHE_ENABLED:
-            cache = await get_cache_service()
-            # Convert to dict for caching
-            dish_dict = {
-                "id": str(dish.id),
-                "name": dish.name,
-                "description": dish.description,
-                "price": float(dish.price) if dish.price else None,
-                "rating": float(dish.rating) if dish.rating else None,
-                # Add more fields as needed
-            }
-            await cache.set(cache_key, dish_dict, ttl=settings.CACHE_DISH_TTL)
-        
-        return dish
+        return result.scalar_one_or_none()
+
+    async def get_detail(self, id: UUID, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get the full dish detail payload, served from cache when possible.
+        
+        The cached entry holds the JSON-ready DishDetailOut payload (moods,
+        restaurant and cuisine included) under the dish's versioned namespace,
+        together with the generations of the restaurant, cuisine and mood
+        namespaces it embeds; a hit is only used while all of those are
+        current, so admin writes to any of them invalidate it. Missing dishes
+        go through the same negative cache as every other dish lookup
+        (CacheService.known_missing / remember_missing).
+        
+        Args:
+            id: Dish UUID
+            use_cache: Whether to use cache (default: True)
+            
+        Returns:
+            DishDetailOut payload as a dict, or None if the dish does not exist
+        """
+        if not (use_cache and settings.CACHE_ENABLED):
+            dish = await self.get_by_id_with_relations(id)
+            return DishDetailOut.model_validate(dish).model_dump(mode="json") if dish else None
+        
+        cache = await get_cache_service()
+        if not cache.might_exist("dish", id):
+            return None
+        cache_key = await cache.versioned_key(f"dish:{id}", "full")
+        cached = await cache.get(cache_key)
+        if cached and await self._generations_current(cache, cached["generations"]):
+            return cached["dish"]
+        # Only checked on a miss, so hits stay a single lookup
+        if await cache.known_missing("dish", id):
+            return None
+        
+        dish = await self.get_by_id_with_relations(id)
+        if not dish:
+            await cache.remember_missing("dish", id)
+            return None
+        
+        entry = await self._detail_entry(cache, dish)
+        await cache.set(cache_key, entry, ttl=settings.CACHE_DISH_TTL)
+        return entry["dish"]
+
+    @staticmethod
+    async def _detail_entry(cache, dish: Dish) -> Dict[str, Any]:
+        """Cached detail payload plus the generations of the namespaces it embeds."""
+        namespaces = [f"restaurant:{dish.restaurant_id}", f"cuisine:{dish.cuisine_id}"]
+        namespaces += [f"mood:{mood.id}" for mood in dish.moods]
+        return {
+            "dish": DishDetailOut.model_validate(dish).model_dump(mode="json"),
+            "generations": {
+                namespace: await cache.namespace_generation(namespace) for namespace in namespaces
+            },
+        }
+
+    @staticmethod
+    async def _generations_current(cache, generations: Dict[str, int]) -> bool:
+        for namespace, generation in generations.items():
+            if await cache.namespace_generation(namespace) != generation:
+                return False
+        return True
 
     async def list_by_restaurant(
         self,
@@ -349,13 +385,19 @@ class DishRepository(BaseRepository[Dish]):
         Returns:
             True if restaurant exists and is active
         """
+        cache = await get_cache_service()
+        if await cache.known_missing("restaurant", restaurant_id):
+            return False
         result = await self.session.execute(
-            select(Restaurant).where(
+            select(Restaurant.id).where(
                 Restaurant.id == restaurant_id,
                 Restaurant.is_deleted == False,
             )
         )
-        return result.scalar_one_or_none() is not None
+        exists = result.scalar_one_or_none() is not None
+        if not exists:
+            await cache.remember_missing("restaurant", restaurant_id)
+        return exists
 
     async def validate_cuisine_exists(self, cuisine_id: UUID) -> bool:
         """
@@ -6,7 +6,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.cuisine import CuisineOut
 from app.schemas.mood import MoodOut
+from app.schemas.restaurant import RestaurantOut
 
 
 class DishBase(BaseModel):
@@ -50,6 +52,14 @@ class DishOut(DishBase):
         from_attributes = True
 
 
+class DishDetailOut(DishOut):
+    restaurant: Optional[RestaurantOut] = None
+    cuisine: Optional[CuisineOut] = None
+
+    class Config:
+        from_attributes = True
+
+
 class DishFilterParams(BaseModel):
     cuisine_id: Optional[uuid.UUID] = None
     restaurant_id: Optional[uuid.UUID] = None
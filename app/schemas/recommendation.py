@@ -1,7 +1,7 @@
 """
 Schemas for dish recommendation API.
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 
 import uuid
 from pydantic import BaseModel, Field
@@ -14,6 +14,10 @@ class RecommendationRequest(BaseModel):
     restaurant_id: Optional[uuid.UUID] = Field(default=None, description="Filter by specific restaurant")
     min_score: Optional[float] = Field(default=0.0, ge=0.0, le=100.0, description="Minimum match score threshold")
     include_explanation: bool = Field(default=True, description="Include score breakdown in response")
+    backend: Literal["rules", "ml"] = Field(
+        default="rules",
+        description="Scoring backend: rule-based engine or trained ML model (no score breakdown)",
+    )
 
 
 class ScoreBreakdownResponse(BaseModel):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -9,8 +9,20 @@ from app.schemas.dish import DishOut
 from app.schemas.restaurant import RestaurantOut
 
 
+class FacetCount(BaseModel):
+    value: str  # Id for cuisine/mood/dietary_tag, the label otherwise
+    label: str
+    count: int
+    # Price and rating buckets only: min <= x < max, None if open-ended. Not the
+    # same bounds as the /dishes max_price filter, which is inclusive.
+    min: Optional[Union[int, float]] = None
+    max: Optional[Union[int, float]] = None
+
+
 class SearchResponse(BaseModel):
     query: str
     dishes: List[DishOut]
     restaurants: List[RestaurantOut]
     cuisines: List[CuisineOut]
+    next_cursors: Dict[str, Optional[str]] = {}  # Per type; None on the last page
+    facets: Optional[Dict[str, List[FacetCount]]] = None  # Only when requested
@@ -4,11 +4,15 @@ from app.services.base import BaseService
 from app.services.dish_service import DishService
 from app.services.restaurant_service import RestaurantService
 from app.services.cuisine_service import CuisineService
+from app.services.recommendation_service import RecommendationService
+from app.services.search_service import SearchService
 
 __all__ = [
     "BaseService",
     "DishService",
     "RestaurantService",
     "CuisineService",
+    "RecommendationService",
+    "SearchService",
 ]
 
@@ -1,53 +1,356 @@
 """Caching service for Redis-based caching operations."""
 
+import asyncio
+import fnmatch
 import json
 import logging
-from typing import Optional, Any, Dict, List
+import math
+import random
+import re
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Any, Awaitable, Callable, Dict, Iterable, List, Tuple
 from uuid import UUID
 
 import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
 from app.core.config import settings
+from app.core.metrics import CACHE_ERRORS, CACHE_LATENCY, CACHE_PAYLOAD_BYTES, CACHE_REQUESTS
+from app.utils.bloom_filter import BloomFilter
+from app.utils.cache_codecs import get_payload_codec
 
 logger = logging.getLogger(__name__)
 
 
+# Deletes the refill lock only if this process still holds it
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Keys whose last fetch duration is remembered for early expiration
+FETCH_DURATIONS_MAX_KEYS = 10_000
+
+
+def key_namespace(key: str) -> str:
+    """Namespace of a cache key: the part before the first ':' (e.g. "dish")."""
+    return key.split(":", 1)[0]
+
+
+# Key segments that identify one entity (UUIDs, numeric ids)
+_ID_SEGMENT = re.compile(r"^([0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}|\d+)$", re.I)
+_VERSION_SEGMENT = re.compile(r"^v\d+(\.\d+)*$")
+# Key segments that name one day (e.g. daily rankings)
+_DATE_SEGMENT = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def metric_namespace(key: str) -> str:
+    """
+    Low-cardinality metrics label for a key: the segments before its
+    generation, with ids and dates collapsed, e.g. "dish:list:v3:response:ab12"
+    -> "dish:list", "dish:<uuid>:v1:full" -> "dish:{id}" and
+    "search:top-queries:2026-01-31" -> "search:top-queries:{date}".
+    """
+    segments = []
+    for segment in key.split(":")[:3]:
+        if _VERSION_SEGMENT.match(segment):
+            break
+        if _ID_SEGMENT.match(segment):
+            segment = "{id}"
+        elif _DATE_SEGMENT.match(segment):
+            segment = "{date}"
+        segments.append(segment)
+    return ":".join(segments)
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL (the L1 tier).
+    
+    Entries are partitioned by key namespace, each with its own size limit, so
+    a burst of one kind of key (e.g. per-dish entries) cannot evict near-static
+    ones (cuisines, moods, FAQs). Values are returned as stored, without
+    copying; callers must treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        namespace_limits: Optional[Dict[str, int]] = None,
+        ttl: int = 60,
+    ):
+        """
+        Args:
+            max_entries: Default size limit per namespace
+            namespace_limits: Size limits overriding max_entries for given namespaces
+            ttl: Upper bound on how long an entry is kept, in seconds
+        """
+        self.max_entries = max_entries
+        self.namespace_limits = namespace_limits or {}
+        self.ttl = ttl
+        self._namespaces: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        entries = self._namespaces.get(key_namespace(key))
+        entry = entries.get(key) if entries else None
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        namespace = key_namespace(key)
+        limit = self.namespace_limits.get(namespace, self.max_entries)
+        if limit <= 0:
+            return
+        entries = self._namespaces.setdefault(namespace, OrderedDict())
+        entries[key] = (time.monotonic() + min(ttl or self.ttl, self.ttl), value)
+        entries.move_to_end(key)
+        while len(entries) > limit:
+            entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        entries = self._namespaces.get(key_namespace(key))
+        return bool(entries) and entries.pop(key, None) is not None
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Delete keys matching a Redis-style glob pattern."""
+        namespace = key_namespace(pattern)
+        if any(char in namespace for char in "*?[") or ":" not in pattern:
+            candidates = list(self._namespaces.values())
+        else:
+            candidates = [self._namespaces.get(namespace) or {}]
+        deleted = 0
+        for entries in candidates:
+            for key in [key for key in entries if fnmatch.fnmatchcase(key, pattern)]:
+                del entries[key]
+                deleted += 1
+        return deleted
+
+    def clear(self) -> None:
+        self._namespaces.clear()
+
+    def sizes(self) -> Dict[str, int]:
+        return {namespace: len(entries) for namespace, entries in self._namespaces.items()}
+
+
 class CacheService:
     """
     Redis-based caching service for application data.
     
     Provides async caching operations with automatic serialization/deserialization.
     Gracefully handles Redis unavailability (returns None, logs error).
+    
+    Reads go through an in-process L1 tier (LocalCache) before Redis. Writes
+    and deletes publish the affected keys/patterns on a Redis pub/sub channel,
+    and every CacheService with an L1 tier listens on it and evicts them, so
+    invalidations reach all workers. The L1 tier is only consulted while that
+    subscription is live.
+    
+    Lookups of missing entities are cached too (remember_missing /
+    known_missing), and instances with an L1 tier can hold Bloom filters of
+    live entity ids (rebuild_id_filter) that reject unknown ids without a
+    round-trip. Ids of created or restored entities are broadcast on the same
+    channel, and filters are only trusted while subscribed, so they never
+    reject an id that exists. The same ids reach entity listeners
+    (add_entity_listener), which keep other in-process indexes current.
     """
 
-    def __init__(self):
-        """Initialize cache service with Redis connection."""
+    def __init__(self, local_cache: Optional[bool] = None):
+        """
+        Initialize cache service with Redis connection.
+        
+        Args:
+            local_cache: Enable the L1 tier (default: CACHE_L1_ENABLED). Short-lived
+                instances (e.g. in Celery tasks) can disable it; they still publish
+                invalidations.
+        """
         self._redis: Optional[redis.Redis] = None
-        self._enabled = True
+        self._connect_lock = asyncio.Lock()
+        self._connect_failures = 0
+        self._reconnect_at = 0.0  # monotonic time of the next connection attempt
+        self._instance_id = uuid.uuid4().hex
+        self._local: Optional[LocalCache] = None
+        if settings.CACHE_L1_ENABLED if local_cache is None else local_cache:
+            self._local = LocalCache(
+                max_entries=settings.CACHE_L1_MAX_ENTRIES,
+                namespace_limits=settings.CACHE_L1_NAMESPACE_LIMITS,
+                ttl=settings.CACHE_L1_TTL,
+            )
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = False
+        self._id_filters: Dict[str, BloomFilter] = {}
+        self._id_filter_adds: Dict[str, List[str]] = {}  # ids added during a rebuild
+        self._id_filter_epoch = 0  # bumped whenever filters are dropped
+        self.id_filters_stale = asyncio.Event()  # set when filters must be rebuilt early
+        self._entity_listeners: List[Callable[[Dict[str, List[str]]], None]] = []
+        self._stats = {"l1_hits": 0, "l1_misses": 0, "l2_hits": 0, "l2_misses": 0}
+        self._codec = get_payload_codec()
+        # Refills in flight per (key, stale): callers missing a key never join a
+        # background refresh, which gives up when another process holds the lock
+        self._inflight: Dict[Tuple[str, bool], asyncio.Future] = {}
+        self._fetch_durations: "OrderedDict[str, float]" = OrderedDict()
 
     async def _get_redis(self) -> Optional[redis.Redis]:
         """
-        Get Redis connection, creating if needed.
+        Get Redis connection, creating its connection pool if needed.
+        
+        If Redis cannot be reached, caching is skipped and the connection is
+        retried after an exponentially growing delay (CACHE_REDIS_RECONNECT_*),
+        so the cache comes back on its own once Redis does.
         
         Returns:
             Redis client or None if unavailable
         """
-        if self._redis is None:
+        if self._redis is not None:
+            return self._redis
+        if time.monotonic() < self._reconnect_at:
+            return None
+        
+        async with self._connect_lock:
+            if self._redis is None and time.monotonic() >= self._reconnect_at:
+                await self._connect()
+        return self._redis
+
+    async def _connect(self) -> None:
+        """Open the connection pool, or schedule the next attempt with backoff."""
+        client = None
+        try:
+            redis_url = settings.REDIS_URL or "redis://localhost:6379/0"
+            client = redis.from_url(
+                redis_url,
+                encoding="utf-8",
+                decode_responses=False,  # We'll handle encoding ourselves
+                max_connections=settings.CACHE_REDIS_MAX_CONNECTIONS,
+                socket_timeout=settings.CACHE_REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.CACHE_REDIS_SOCKET_TIMEOUT,
+                health_check_interval=settings.CACHE_REDIS_HEALTH_CHECK_INTERVAL,
+                # Retry individual commands on dropped connections
+                retry=Retry(ExponentialBackoff(cap=0.5, base=0.01), retries=2),
+                retry_on_error=[RedisConnectionError, RedisTimeoutError],
+            )
+            # Test connection
+            await client.ping()
+        except Exception as e:
+            self._connect_failures += 1
+            delay = min(
+                settings.CACHE_REDIS_RECONNECT_MAX_DELAY,
+                settings.CACHE_REDIS_RECONNECT_MIN_DELAY * 2 ** (self._connect_failures - 1),
+            )
+            self._reconnect_at = time.monotonic() + delay * random.uniform(0.5, 1.0)
+            logger.warning(
+                f"Redis cache unavailable: {str(e)}. Caching disabled, retrying in {delay:g}s."
+            )
+            if client is not None:
+                try:
+                    await client.aclose()
+                except Exception:
+                    pass
+            return
+        
+        self._redis = client
+        self._connect_failures = 0
+        logger.info("Redis cache connection established")
+        if self._local is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen_for_invalidations())
+
+    async def _listen_for_invalidations(self):
+        """Evict L1 entries named on the invalidation channel, reconnecting on errors."""
+        while True:
+            pubsub = self._redis.pubsub()
             try:
-                redis_url = settings.CELERY_BROKER_URL or "redis://localhost:6379/0"
-                self._redis = redis.from_url(
-                    redis_url,
-                    encoding="utf-8",
-                    decode_responses=False,  # We'll handle encoding ourselves
-                )
-                # Test connection
-                await self._redis.ping()
-                logger.info("Redis cache connection established")
+                await pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+                self._subscribed = True
+                self.id_filters_stale.set()  # Id filters can be (re)built from now on
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") == self._instance_id:
+                        continue  # Already applied locally
+                    for key in payload.get("keys", []):
+                        self._local.delete(key)
+                    for pattern in payload.get("patterns", []):
+                        self._local.delete_pattern(pattern)
+                    for entity, ids in payload.get("known_ids", {}).items():
+                        self._add_known_ids(entity, ids)
+                    if payload.get("known_ids"):
+                        self._notify_entity_listeners(payload["known_ids"])
+                    if payload.get("reset_id_filters"):
+                        self._drop_id_filters()
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.warning(f"Redis cache unavailable: {str(e)}. Caching disabled.")
-                self._enabled = False
-                self._redis = None
-        
-        return self._redis if self._enabled else None
+                logger.warning(f"Cache invalidation listener error: {str(e)}. Resubscribing.")
+            finally:
+                # Invalidations may be missed while unsubscribed, so start over empty
+                self._subscribed = False
+                self._local.clear()
+                self._drop_id_filters()
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(1)
+
+    async def _publish_invalidation(
+        self,
+        redis_client: redis.Redis,
+        keys: Optional[List[str]] = None,
+        patterns: Optional[List[str]] = None,
+        known_ids: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
+        """
+        Evict keys/patterns from the local L1 tier and tell other workers to do
+        the same; `known_ids` ({entity: [id, ...]}) are added to id filters.
+        """
+        if self._local is not None:
+            for key in keys or []:
+                self._local.delete(key)
+            for pattern in patterns or []:
+                self._local.delete_pattern(pattern)
+        for entity, ids in (known_ids or {}).items():
+            self._add_known_ids(entity, ids)
+        payload = {"origin": self._instance_id, "keys": keys or [], "patterns": patterns or []}
+        if known_ids:
+            payload["known_ids"] = known_ids
+        await redis_client.publish(settings.CACHE_INVALIDATION_CHANNEL, json.dumps(payload))
+
+    def _local_tier(self) -> Optional[LocalCache]:
+        """The L1 tier, if enabled and receiving invalidations."""
+        return self._local if self._subscribed else None
+
+    def _count(self, key: str, tier: str, hit: bool) -> None:
+        self._stats[f"{tier}_{'hits' if hit else 'misses'}"] += 1
+        CACHE_REQUESTS.labels(metric_namespace(key), tier, "hit" if hit else "miss").inc()
+
+    @staticmethod
+    def _observe(key: str, operation: str, started: float, payload: Optional[bytes] = None) -> None:
+        """Record a Redis round-trip started at `started` (perf_counter) and its payload size."""
+        namespace = metric_namespace(key)
+        CACHE_LATENCY.labels(namespace, operation).observe(time.perf_counter() - started)
+        if payload:
+            CACHE_PAYLOAD_BYTES.labels(namespace, operation).observe(len(payload))
+
+    @staticmethod
+    def _error(key: str, operation: str) -> None:
+        CACHE_ERRORS.labels(metric_namespace(key), operation).inc()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per tier and current L1 sizes per namespace."""
+        return {
+            **self._stats,
+            "l1_entries": self._local.sizes() if self._local is not None else {},
+        }
 
     async def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
@@ -57,21 +360,46 @@ class CacheService:
             key: Cache key
             
         Returns:
-            Cached data as dict or None if not found/unavailable
+            Cached data as dict or None if not found/unavailable. Values served
+            from the L1 tier are shared; do not mutate them.
         """
+        local = self._local_tier()
+        if local is not None:
+            value = local.get(key)
+            if value is not None:
+                self._count(key, "l1", hit=True)
+                return value
+            self._count(key, "l1", hit=False)
+        
         try:
             redis_client = await self._get_redis()
             if not redis_client:
                 return None
             
-            data = await redis_client.get(key)
+            started = time.perf_counter()
+            data, ttl = await self._get_with_ttl(redis_client, key)
+            self._observe(key, "get", started, data)
             if data:
-                return json.loads(data.decode("utf-8"))
+                self._count(key, "l2", hit=True)
+                value = self._codec.decode(data)
+                if local is not None:
+                    local.set(key, value, ttl)
+                return value
+            self._count(key, "l2", hit=False)
             return None
         except Exception as e:
+            self._error(key, "get")
             logger.error(f"Cache get error for key '{key}': {str(e)}")
             return None
 
+    async def _get_with_ttl(self, redis_client: redis.Redis, key: str) -> Tuple[Optional[bytes], Optional[int]]:
+        """Value and remaining TTL in one round-trip (the TTL caps the L1 copy)."""
+        if self._local_tier() is None:
+            return await redis_client.get(key), None
+        async with redis_client.pipeline(transaction=False) as pipe:
+            data, ttl = await pipe.get(key).ttl(key).execute()
+        return data, ttl if ttl and ttl > 0 else None
+
     async def set(
         self,
         key: str,
@@ -83,7 +411,8 @@ class CacheService:
         
         Args:
             key: Cache key
-            value: Data to cache (must be JSON serializable)
+            value: Data to cache (JSON-like; UUID, datetime and Decimal are
+                stored as strings). Encoded with CACHE_CODEC/CACHE_COMPRESSION
             ttl: Time to live in seconds (default: 1 hour)
             
         Returns:
@@ -94,13 +423,100 @@ class CacheService:
             if not redis_client:
                 return False
             
-            serialized = json.dumps(value, default=str)  # default=str handles UUID, datetime
+            serialized = self._codec.encode(value)
+            started = time.perf_counter()
             await redis_client.setex(key, ttl, serialized)
+            self._observe(key, "set", started, serialized)
+            # Drop stale L1 copies everywhere; this worker re-reads through Redis
+            await self._publish_invalidation(redis_client, keys=[key])
             return True
         except Exception as e:
+            self._error(key, "set")
             logger.error(f"Cache set error for key '{key}': {str(e)}")
             return False
 
+    async def set_if_absent(self, key: str, ttl: int, value: str = "1") -> bool:
+        """
+        Set a short-lived marker key only if it does not exist yet (SET NX).
+        
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+            value: Raw value to store
+            
+        Returns:
+            True if the key was set, False if it already existed or Redis is unavailable
+        """
+        try:
+            redis_client = await self._get_redis()
+            if not redis_client:
+                return False
+            
+            return bool(await redis_client.set(key, value, ex=ttl, nx=True))
+        except Exception as e:
+            self._error(key, "set_if_absent")
+            logger.error(f"Cache set_if_absent error for key '{key}': {str(e)}")
+            return False
+
+    async def increment_ranking(
+        self,
+        key: str,
+        member: str,
+        ttl: int,
+        max_members: Optional[int] = None,
+    ) -> None:
+        """
+        Add one to a member's score in a ranking (a Redis sorted set).
+        
+        Args:
+            key: Ranking key
+            member: Member to count
+            ttl: Seconds the ranking is kept after its last increment
+            max_members: Trim the ranking to its top members from time to time,
+                so a long tail of one-off members cannot grow it without bound
+        """
+        try:
+            redis_client = await self._get_redis()
+            if not redis_client:
+                return
+            
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zincrby(key, 1, member)
+                pipe.expire(key, ttl)
+                if max_members and random.random() < 0.01:
+                    pipe.zremrangebyrank(key, 0, -max_members - 1)
+                await pipe.execute()
+        except Exception as e:
+            self._error(key, "increment_ranking")
+            logger.error(f"Cache increment_ranking error for key '{key}': {str(e)}")
+
+    async def top_ranked(self, keys: List[str], limit: int) -> List[Tuple[str, int]]:
+        """
+        Highest-scored members of the sum of several rankings (e.g. one per day).
+        
+        Returns:
+            (member, score) pairs, highest first; empty if Redis is unavailable
+        """
+        if not keys:
+            return []
+        union_key = f"ranking-union:{uuid.uuid4().hex}"
+        try:
+            redis_client = await self._get_redis()
+            if not redis_client:
+                return []
+            
+            # Summed server-side, so only the top members cross the wire
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zunionstore(union_key, keys)
+                pipe.zrevrange(union_key, 0, limit - 1, withscores=True)
+                pipe.delete(union_key)
+                _, top, _ = await pipe.execute()
+            return [(member.decode("utf-8"), int(score)) for member, score in top]
+        except Exception as e:
+            self._error(keys[0], "top_ranked")
+            logger.error(f"Cache top_ranked error for keys {keys}: {str(e)}")
+            return []
+
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache.
@@ -117,8 +533,10 @@ class CacheService:
                 return False
             
             deleted = await redis_client.delete(key)
+            await self._publish_invalidation(redis_client, keys=[key])
             return deleted > 0
         except Exception as e:
+            self._error(key, "delete")
             logger.error(f"Cache delete error for key '{key}': {str(e)}")
             return False
 
@@ -126,6 +544,9 @@ class CacheService:
         """
         Delete all keys matching pattern.
         
+        This SCANs the whole keyspace; prefer versioned keys and
+        bump_namespaces for invalidation on request paths.
+        
         Args:
             pattern: Redis key pattern (e.g., "dish:*")
             
@@ -141,6 +562,7 @@ class CacheService:
             async for key in redis_client.scan_iter(match=pattern):
                 keys.append(key)
             
+            await self._publish_invalidation(redis_client, patterns=[pattern])
             if keys:
                 return await redis_client.delete(*keys)
             return 0
@@ -165,79 +587,604 @@ class CacheService:
             
             return await redis_client.exists(key) > 0
         except Exception as e:
+            self._error(key, "exists")
             logger.error(f"Cache exists error for key '{key}': {str(e)}")
             return False
 
+    async def mget(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many keys at once: L1 first, then one Redis round-trip for the rest.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Cached values by key; keys that are not cached are left out. Values
+            served from the L1 tier are shared; do not mutate them.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        local = self._local_tier()
+        missing = []
+        for key in dict.fromkeys(keys):
+            value = local.get(key) if local is not None else None
+            if value is not None:
+                self._count(key, "l1", hit=True)
+                found[key] = value
+            else:
+                if local is not None:
+                    self._count(key, "l1", hit=False)
+                missing.append(key)
+        if not missing:
+            return found
+        
+        try:
+            redis_client = await self._get_redis()
+            if not redis_client:
+                return found
+            
+            started = time.perf_counter()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key in missing:
+                    pipe.get(key)
+                    if local is not None:
+                        pipe.ttl(key)
+                results = await pipe.execute()
+            self._observe(missing[0], "mget", started)
+            step = 2 if local is not None else 1
+            for index, key in enumerate(missing):
+                data = results[index * step]
+                if not data:
+                    self._count(key, "l2", hit=False)
+                    continue
+                self._count(key, "l2", hit=True)
+                CACHE_PAYLOAD_BYTES.labels(metric_namespace(key), "get").observe(len(data))
+                value = self._codec.decode(data)
+                found[key] = value
+                if local is not None:
+                    ttl = results[index * step + 1]
+                    local.set(key, value, ttl if ttl and ttl > 0 else None)
+        except Exception as e:
+            self._error(missing[0], "mget")
+            logger.error(f"Cache mget error for {len(missing)} keys: {str(e)}")
+        return found
+
+    async def mset(self, items: Dict[str, Dict[str, Any]], ttl: int = 3600) -> bool:
+        """
+        Set many keys with the same TTL in one Redis round-trip.
+        
+        Args:
+            items: Values by cache key (encoded as in `set`)
+            ttl: Time to live in seconds (default: 1 hour)
+            
+        Returns:
+            True if set successfully, False otherwise
+        """
+        if not items:
+            return True
+        try:
+            redis_client = await self._get_redis()
+            if not redis_client:
+                return False
+            
+            started = time.perf_counter()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    serialized = self._codec.encode(value)
+                    CACHE_PAYLOAD_BYTES.labels(metric_namespace(key), "set").observe(len(serialized))
+                    pipe.setex(key, ttl, serialized)
+                await pipe.execute()
+            self._observe(next(iter(items)), "mset", started)
+            await self._publish_invalidation(redis_client, keys=list(items))
+            return True
+        except Exception as e:
+            self._error(next(iter(items)), "mset")
+            logger.error(f"Cache mset error for {len(items)} keys: {str(e)}")
+            return False
+
+    def pipeline(self) -> "CachePipeline":
+        """
+        Batch gets, sets and deletes into one Redis round-trip:
+        
+            pipe = cache.pipeline()
+            pipe.get(key_a).set(key_b, value, ttl=60).delete(key_c)
+            value_a, was_set, was_deleted = await pipe.execute()
+        """
+        return CachePipeline(self)
+
     async def get_or_set(
         self,
         key: str,
         fetch_func,
         ttl: int = 3600,
+        stale_ttl: int = 0,
+        early_expiration: float = 0.0,
     ) -> Optional[Dict[str, Any]]:
         """
         Get from cache or fetch and cache.
         
+        Refills are single-flight: concurrent callers in this process share one
+        fetch per key, and across processes a short Redis lock lets only one
+        of them run fetch_func while the others wait for its result.
+        
         Args:
             key: Cache key
             fetch_func: Async function to fetch data if not cached
             ttl: Time to live in seconds
+            stale_ttl: Keep serving the value for this many seconds after it
+                expires while it is refreshed in the background
+                (stale-while-revalidate)
+            early_expiration: Beta of probabilistic early expiration; with
+                beta > 0 a hot key is refreshed in the background shortly before
+                it expires, the more likely the closer it is to expiring and the
+                slower it was to fetch (1.0 is a good default)
             
         Returns:
             Cached or fetched data
         """
-        # Try cache first
-        cached = await self.get(key)
-        if cached is not None:
-            return cached
+        local = self._local_tier()
+        if local is not None:
+            value = local.get(key)
+            if value is not None:
+                self._count(key, "l1", hit=True)
+                return value
+            self._count(key, "l1", hit=False)
         
-        # Fetch and cache
         try:
-            data = await fetch_func()
-            if data:
-                # Convert to dict if needed
-                if hasattr(data, "dict"):
-                    data_dict = data.dict()
-                elif hasattr(data, "model_dump"):
-                    data_dict = data.model_dump()
-                elif isinstance(data, dict):
-                    data_dict = data
-                else:
-                    # Try to serialize
-                    data_dict = json.loads(json.dumps(data, default=str))
-                
-                await self.set(key, data_dict, ttl)
-                return data_dict
+            redis_client = await self._get_redis()
+            cached, pttl = None, None
+            if redis_client:
+                started = time.perf_counter()
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    cached, pttl = await pipe.get(key).pttl(key).execute()
+                self._observe(key, "get", started, cached)
+            
+            if cached:
+                self._count(key, "l2", hit=True)
+                value = self._codec.decode(cached)
+                remaining = (pttl / 1000 - stale_ttl) if pttl and pttl > 0 else None
+                if remaining is not None and remaining <= 0:
+                    # Stale: serve it and refresh in the background
+                    self._refill(key, fetch_func, ttl, stale_ttl, stale=True)
+                    return value
+                if remaining is not None and self._should_refresh_early(key, remaining, early_expiration):
+                    self._refill(key, fetch_func, ttl, stale_ttl, stale=True)
+                if local is not None and (remaining is None or remaining >= 1):
+                    local.set(key, value, int(remaining) if remaining else ttl)
+                return value
+            
+            if redis_client:
+                self._count(key, "l2", hit=False)
+            # Shielded so that a cancelled caller does not cancel the shared fetch
+            return await asyncio.shield(self._refill(key, fetch_func, ttl, stale_ttl))
         except Exception as e:
+            self._error(key, "get")
             logger.error(f"Cache get_or_set error for key '{key}': {str(e)}")
         
         return None
 
+    def _should_refresh_early(self, key: str, remaining: float, beta: float) -> bool:
+        """
+        Probabilistic early expiration (XFetch): refresh when
+        -delta * beta * ln(U) >= time left, delta being the last fetch time.
+        """
+        delta = self._fetch_durations.get(key)
+        if beta <= 0 or not delta:
+            return False
+        return -delta * beta * math.log(random.random() or 1e-12) >= remaining
+
+    def _refill(self, key: str, fetch_func, ttl: int, stale_ttl: int, stale: bool = False) -> asyncio.Future:
+        """Start (or join) the single in-flight refill of a key in this process."""
+        future = self._inflight.get((key, stale))
+        if future is None:
+            future = asyncio.ensure_future(self._fill(key, fetch_func, ttl, stale_ttl, stale))
+            self._inflight[(key, stale)] = future
+            future.add_done_callback(lambda _: self._inflight.pop((key, stale), None))
+            if stale:
+                # Nobody awaits background refreshes; log instead of warning about it
+                future.add_done_callback(self._log_refill_error)
+        return future
+
+    @staticmethod
+    def _log_refill_error(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Cache background refresh error: {str(future.exception())}")
+
+    async def _fill(
+        self,
+        key: str,
+        fetch_func,
+        ttl: int,
+        stale_ttl: int,
+        stale: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch and store a key, holding the cross-process refill lock while doing so."""
+        redis_client = await self._get_redis()
+        lock_key = f"lock:{key}"
+        token = uuid.uuid4().hex
+        locked = False
+        if redis_client:
+            locked = bool(await redis_client.set(
+                lock_key, token, px=int(settings.CACHE_LOCK_TIMEOUT * 1000), nx=True
+            ))
+            if not locked:
+                if stale:
+                    return None  # Another process is already refreshing it
+                value = await self._wait_for_fill(redis_client, key, lock_key)
+                if value is not None:
+                    return value
+                # The other process stored nothing (its fetch failed or returned
+                # nothing cacheable) or did not finish in time; fetch ourselves
+        
+        try:
+            started = time.monotonic()
+            data = await fetch_func()
+            self._remember_fetch_duration(key, time.monotonic() - started)
+            if not data:
+                return None
+            data_dict = self._to_cacheable(data)
+            await self.set(key, data_dict, ttl + stale_ttl)
+            return data_dict
+        finally:
+            if locked:
+                try:
+                    await redis_client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    # The lock expires on its own after CACHE_LOCK_TIMEOUT
+                    logger.warning(f"Cache lock release error for key '{key}': {str(e)}")
+
+    async def _wait_for_fill(
+        self,
+        redis_client: redis.Redis,
+        key: str,
+        lock_key: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Poll for a value another process is filling, while it holds the lock
+        and up to CACHE_LOCK_TIMEOUT; None once the lock is released without a
+        value.
+        """
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+        delay = 0.01
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            # Lock first: a value stored before the release is then always seen
+            async with redis_client.pipeline(transaction=False) as pipe:
+                locked, data = await pipe.exists(lock_key).get(key).execute()
+            if data:
+                return self._codec.decode(data)
+            if not locked:
+                return None
+            delay = min(delay * 2, 0.2)
+        return None
+
+    def _remember_fetch_duration(self, key: str, duration: float) -> None:
+        self._fetch_durations[key] = duration
+        self._fetch_durations.move_to_end(key)
+        while len(self._fetch_durations) > FETCH_DURATIONS_MAX_KEYS:
+            self._fetch_durations.popitem(last=False)
+
+    @staticmethod
+    def _to_cacheable(data: Any) -> Dict[str, Any]:
+        """Convert fetched data to a JSON-serializable dict."""
+        if hasattr(data, "dict"):
+            return data.dict()
+        if hasattr(data, "model_dump"):
+            return data.model_dump()
+        if isinstance(data, dict):
+            return data
+        # Try to serialize
+        return json.loads(json.dumps(data, default=str))
+
+    async def namespace_generation(self, namespace: str) -> int:
+        """
+        Current generation of an invalidation namespace (0 if never bumped).
+        
+        Generations are held in the L1 tier, so this usually costs no round-trip.
+        """
+        gen_key = f"gen:{namespace}"
+        local = self._local_tier()
+        version = local.get(gen_key) if local is not None else None
+        if version is None:
+            version = 0
+            try:
+                redis_client = await self._get_redis()
+                if redis_client:
+                    version = int(await redis_client.get(gen_key) or 0)
+                    if local is not None:
+                        local.set(gen_key, version)
+            except Exception as e:
+                logger.error(f"Cache generation lookup error for '{namespace}': {str(e)}")
+        return version
+
+    async def versioned_key(self, namespace: str, key: str) -> str:
+        """
+        Cache key for `key` under the current generation of `namespace`.
+        
+        Entries are written as "<namespace>:v<generation>:<key>"; bumping the
+        namespace's generation (see bump_namespaces) makes every existing entry
+        unreachable at once, and they age out through their TTL.
+        
+        Args:
+            namespace: Invalidation namespace (e.g. "dish:list", "dish:<id>")
+            key: Rest of the key within the namespace
+        """
+        return f"{namespace}:v{await self.namespace_generation(namespace)}:{key}"
+
+    async def bump_namespaces(
+        self,
+        *namespaces: str,
+        known_ids: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
+        """
+        Invalidate every entry of the given namespaces by incrementing their
+        generations: one INCR each, sent in a single round-trip, independent
+        of how many keys are cached.
+        
+        Args:
+            namespaces: Namespaces to invalidate
+            known_ids: Ids of the entities written ({entity: [id, ...]}), added
+                to every worker's id filters and passed to its entity listeners
+        """
+        for entity, ids in (known_ids or {}).items():
+            self._add_known_ids(entity, ids)  # Even if Redis is down
+        if known_ids:
+            self._notify_entity_listeners(known_ids)
+        try:
+            redis_client = await self._get_redis()
+            if not redis_client:
+                return
+            
+            gen_keys = [f"gen:{namespace}" for namespace in namespaces]
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for gen_key in gen_keys:
+                    pipe.incr(gen_key)
+                await pipe.execute()
+            await self._publish_invalidation(redis_client, keys=gen_keys, known_ids=known_ids)
+        except Exception as e:
+            logger.error(f"Cache bump error for namespaces {namespaces}: {str(e)}")
+
+    async def known_missing(self, entity: str, entity_id: UUID) -> bool:
+        """
+        Whether an entity is known not to exist, so its lookup can be skipped:
+        its id is absent from the entity's id filter, or a recent lookup
+        found nothing (see remember_missing).
+        
+        Args:
+            entity: Entity name ("dish", "restaurant")
+            entity_id: Entity id
+        """
+        if not settings.CACHE_ENABLED:
+            return False
+        if not self.might_exist(entity, entity_id):
+            return True
+        key = await self.versioned_key(f"{entity}:{entity_id}", "missing")
+        return await self.get(key) is not None
+
+    async def remember_missing(self, entity: str, entity_id: UUID) -> None:
+        """
+        Cache a lookup that found nothing for CACHE_NEGATIVE_TTL seconds.
+        
+        The entry lives under the entity's namespace, so invalidate_<entity>
+        (called on create and restore) retires it.
+        """
+        if not settings.CACHE_ENABLED:
+            return
+        key = await self.versioned_key(f"{entity}:{entity_id}", "missing")
+        await self.set(key, {"missing": True}, ttl=settings.CACHE_NEGATIVE_TTL)
+
+    def might_exist(self, entity: str, entity_id: UUID) -> bool:
+        """
+        False only if the entity's id filter rules the id out. Without a
+        filter, or while invalidations could be missed, every id might exist.
+        """
+        bloom = self._id_filters.get(entity) if self._subscribed else None
+        return bloom is None or str(entity_id) in bloom
+
+    async def rebuild_id_filter(
+        self,
+        entity: str,
+        load_ids: Callable[[], Awaitable[Iterable[Any]]],
+    ) -> Optional[BloomFilter]:
+        """
+        Replace an entity's id filter with one built from `load_ids()`.
+        
+        Ids registered while the load runs are added to the new filter too, so
+        an entity created mid-rebuild is never rejected. Filters are only built
+        while subscribed to invalidations, and discarded if the subscription
+        dropped during the load, since ids may have been missed meanwhile.
+        
+        Returns:
+            The new filter, or None if none could be built
+        """
+        if not self._subscribed:
+            return None
+        epoch = self._id_filter_epoch
+        self._id_filter_adds[entity] = []
+        try:
+            ids = [str(entity_id) for entity_id in await load_ids()]
+            bloom = BloomFilter.from_keys(
+                ids,
+                capacity=max(len(ids) * 2, 1000),  # Room for ids added until the next rebuild
+                error_rate=settings.ID_FILTER_ERROR_RATE,
+            )
+            for entity_id in self._id_filter_adds[entity]:
+                bloom.add(entity_id)
+        finally:
+            self._id_filter_adds.pop(entity, None)
+        if epoch != self._id_filter_epoch or not self._subscribed:
+            return None
+        self._id_filters[entity] = bloom
+        return bloom
+
+    async def reset_id_filters(self) -> None:
+        """
+        Drop every worker's id filters until they are rebuilt, after writes
+        that bypassed the invalidate_* hooks (e.g. fixture imports).
+        """
+        self._drop_id_filters()
+        try:
+            redis_client = await self._get_redis()
+            if redis_client:
+                payload = {"origin": self._instance_id, "reset_id_filters": True}
+                await redis_client.publish(settings.CACHE_INVALIDATION_CHANNEL, json.dumps(payload))
+        except Exception as e:
+            logger.error(f"Cache id filter reset error: {str(e)}")
+
+    def add_entity_listener(self, callback: Callable[[Dict[str, List[str]]], None]) -> None:
+        """
+        Call `callback({entity: [id, ...]})` whenever entities are written
+        through the invalidate_* hooks, on this worker or (while subscribed
+        to invalidations) any other. Used to keep in-process indexes current.
+        """
+        self._entity_listeners.append(callback)
+
+    def _notify_entity_listeners(self, known_ids: Dict[str, List[str]]) -> None:
+        for callback in self._entity_listeners:
+            try:
+                callback(known_ids)
+            except Exception as e:
+                logger.warning(f"Cache entity listener error: {str(e)}")
+
+    def _add_known_ids(self, entity: str, ids: List[str]) -> None:
+        bloom = self._id_filters.get(entity)
+        for entity_id in ids:
+            if bloom is not None:
+                bloom.add(str(entity_id))
+            if entity in self._id_filter_adds:
+                self._id_filter_adds[entity].append(str(entity_id))
+
+    def _drop_id_filters(self) -> None:
+        self._id_filter_epoch += 1
+        self._id_filters.clear()
+        self.id_filters_stale.set()
+
     async def invalidate_dish(self, dish_id: UUID):
-        """Invalidate all cache entries for a dish."""
-        await self.delete_pattern(f"dish:{dish_id}*")
-        await self.delete_pattern("dish:list:*")
-        await self.delete_pattern("dish:featured:*")
-        await self.delete_pattern("dish:top-rated:*")
+        """
+        Invalidate all cache entries for a dish, including a cached "missing"
+        result, and register its id in the dish id filters (create/restore).
+        """
+        await self.bump_namespaces(
+            f"dish:{dish_id}",
+            "dish:list",
+            "dish:featured",
+            "dish:top-rated",
+            known_ids={"dish": [str(dish_id)]},
+        )
 
     async def invalidate_restaurant(self, restaurant_id: UUID):
-        """Invalidate all cache entries for a restaurant."""
-        await self.delete_pattern(f"restaurant:{restaurant_id}*")
-        await self.delete_pattern("restaurant:list:*")
-        await self.delete_pattern("dish:restaurant:{restaurant_id}*")
+        """
+        Invalidate all cache entries for a restaurant, including a cached
+        "missing" result, and register its id in the restaurant id filters.
+        """
+        await self.bump_namespaces(
+            f"restaurant:{restaurant_id}",
+            "restaurant:list",
+            f"dish:restaurant:{restaurant_id}",
+            known_ids={"restaurant": [str(restaurant_id)]},
+        )
 
     async def invalidate_cuisine(self, cuisine_id: UUID):
         """Invalidate all cache entries for a cuisine."""
-        await self.delete_pattern(f"cuisine:{cuisine_id}*")
-        await self.delete_pattern("cuisine:list:*")
-        await self.delete_pattern("dish:cuisine:{cuisine_id}*")
+        await self.bump_namespaces(
+            f"cuisine:{cuisine_id}",
+            "cuisine:list",
+            f"dish:cuisine:{cuisine_id}",
+            known_ids={"cuisine": [str(cuisine_id)]},
+        )
+
+    async def invalidate_mood(self, mood_id: UUID):
+        """Invalidate all cache entries for a mood."""
+        await self.bump_namespaces(f"mood:{mood_id}", "mood:list")
+
+    async def invalidate_faq(self, faq_id: UUID):
+        """Invalidate all cache entries for a FAQ."""
+        await self.bump_namespaces(f"faq:{faq_id}", "faq:list")
 
     async def close(self):
         """Close Redis connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
         if self._redis:
-            await self._redis.close()
+            await self._redis.aclose()
             self._redis = None
 
 
+class CachePipeline:
+    """
+    Queued cache operations sent to Redis in a single round-trip.
+    
+    Reads bypass the L1 tier; writes and deletes evict the affected keys from
+    every worker's L1 tier once the pipeline has run.
+    """
+
+    def __init__(self, cache: CacheService):
+        self._cache = cache
+        self._ops: List[Tuple[str, str, Any, Optional[int]]] = []
+
+    def get(self, key: str) -> "CachePipeline":
+        self._ops.append(("get", key, None, None))
+        return self
+
+    def set(self, key: str, value: Dict[str, Any], ttl: int = 3600) -> "CachePipeline":
+        self._ops.append(("set", key, value, ttl))
+        return self
+
+    def delete(self, key: str) -> "CachePipeline":
+        self._ops.append(("delete", key, None, None))
+        return self
+
+    async def execute(self) -> List[Any]:
+        """
+        Run the queued operations in order.
+        
+        Returns:
+            One result per operation: the cached value (or None) for gets,
+            True/False for sets and deletes. If Redis is unavailable every
+            result is None/False.
+        """
+        ops, self._ops = self._ops, []
+        failed = [None if op == "get" else False for op, _, _, _ in ops]
+        if not ops:
+            return []
+        cache = self._cache
+        try:
+            redis_client = await cache._get_redis()
+            if not redis_client:
+                return failed
+            
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for op, key, value, ttl in ops:
+                    if op == "get":
+                        pipe.get(key)
+                    elif op == "set":
+                        pipe.setex(key, ttl, cache._codec.encode(value))
+                    else:
+                        pipe.delete(key)
+                raw = await pipe.execute()
+            
+            results = []
+            for (op, _, _, _), result in zip(ops, raw):
+                if op == "get":
+                    results.append(cache._codec.decode(result) if result else None)
+                elif op == "set":
+                    results.append(bool(result))
+                else:
+                    results.append(result > 0)
+            written = [key for op, key, _, _ in ops if op != "get"]
+            if written:
+                await cache._publish_invalidation(redis_client, keys=written)
+            return results
+        except Exception as e:
+            cache._error(ops[0][1], "pipeline")
+            logger.error(f"Cache pipeline error for {len(ops)} operations: {str(e)}")
+            return failed
+
+
 # Global cache service instance
 _cache_service: Optional[CacheService] = None
 
@@ -249,3 +1196,11 @@ async def get_cache_service() -> CacheService:
         _cache_service = CacheService()
     return _cache_service
 
+
+async def close_cache_service():
+    """Close the global cache service (stops its invalidation listener)."""
+    global _cache_service
+    if _cache_service is not None:
+        await _cache_service.close()
+        _cache_service = None
+
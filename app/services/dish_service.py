@@ -1,6 +1,6 @@
 """Service for Dish business logic operations."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -231,6 +231,28 @@ class DishService(BaseService[Dish]):
             )
         return dish
 
+    async def get_dish_detail(self, dish_id: UUID) -> Dict[str, Any]:
+        """
+        Get the full dish detail payload (DishDetailOut), served from cache
+        without touching the ORM when possible.
+        
+        Args:
+            dish_id: Dish UUID
+            
+        Returns:
+            DishDetailOut payload as a dict
+            
+        Raises:
+            HTTPException: If dish not found
+        """
+        dish = await self.repository.get_detail(dish_id)
+        if not dish:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Dish not found"
+            )
+        return dish
+
     async def list_dishes(
         self,
         restaurant_id: Optional[UUID] = None,
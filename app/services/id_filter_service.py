@@ -0,0 +1,57 @@
+"""Periodic rebuild of the in-process id filters held by CacheService."""
+
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.food import Dish, Restaurant
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+# Entities whose lookups are short-circuited by an id filter
+ID_FILTER_MODELS = {
+    "dish": Dish,
+    "restaurant": Restaurant,
+}
+
+
+def _live_ids_loader(model):
+    async def load_ids():
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(select(model.id).where(model.is_deleted.is_(False)))
+            return result.scalars().all()
+
+    return load_ids
+
+
+async def refresh_id_filters(cache: CacheService) -> None:
+    """Rebuild the dish and restaurant id filters from the database."""
+    for entity, model in ID_FILTER_MODELS.items():
+        bloom = await cache.rebuild_id_filter(entity, _live_ids_loader(model))
+        if bloom is not None:
+            logger.info(
+                f"Rebuilt {entity} id filter: {bloom.count} ids, {bloom.memory_bytes / 1024:.0f} KiB"
+            )
+
+
+async def run_id_filter_refresher(cache: CacheService) -> None:
+    """
+    Keep the id filters fresh: rebuild every ID_FILTER_REFRESH_SECONDS, or
+    right away when they are dropped (lost subscription, bulk import).
+    """
+    while True:
+        cache.id_filters_stale.clear()
+        try:
+            await refresh_id_filters(cache)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Id filter refresh failed: {str(e)}")
+        try:
+            await asyncio.wait_for(cache.id_filters_stale.wait(), timeout=settings.ID_FILTER_REFRESH_SECONDS)
+        except asyncio.TimeoutError:
+            pass
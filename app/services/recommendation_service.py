@@ -0,0 +1,389 @@
+"""Service for personalized dish recommendations."""
+
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.model_registry import HotSwappingModel, ModelRegistry
+from app.ai.recommendation_engine import (
+    BUDGET_HARD_CEILING,
+    DishColumns,
+    RecommendationEngine,
+    ScoreBreakdown,
+    select_top_k,
+)
+from app.core.config import settings
+from app.models.food import (
+    Cuisine,
+    Dish,
+    Restaurant,
+    UserCuisineAssociation,
+)
+from app.models.recommendation import (
+    DishDietaryTagAssociation,
+    UserInteraction,
+    UserPreference,
+)
+from app.models.user import User
+from app.schemas.recommendation import RecommendedDish, ScoreBreakdownResponse
+from app.services.base import BaseService
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+RULES_BACKEND = "rules"
+ML_BACKEND = "ml"
+
+_ml_model: Optional[HotSwappingModel] = None
+_legacy_ml_engine = None
+
+
+async def get_ml_engine():
+    """
+    Get the ML recommendation engine for the live model version.
+
+    Follows the model registry at MODEL_REGISTRY_DIR, picking up newly
+    published versions without a restart. Falls back to the pickled model at
+    RECOMMENDATION_MODEL_PATH when nothing has been published, and returns
+    None when neither exists.
+    """
+    global _ml_model, _legacy_ml_engine
+    # Imported lazily so the rule-based path does not need scikit-learn
+    from app.ai.ml_pipeline import MLRecommendationEngine
+
+    if _ml_model is None:
+        _ml_model = HotSwappingModel(
+            ModelRegistry(settings.MODEL_REGISTRY_DIR),
+            poll_seconds=settings.MODEL_REGISTRY_POLL_SECONDS,
+            wrap=lambda model: MLRecommendationEngine(model=model),
+        )
+
+    engine = await _ml_model.get()
+    if engine is not None:
+        return engine
+
+    if _legacy_ml_engine is None and Path(settings.RECOMMENDATION_MODEL_PATH).exists():
+        _legacy_ml_engine = MLRecommendationEngine(settings.RECOMMENDATION_MODEL_PATH)
+    return _legacy_ml_engine
+
+
+class RecommendationService(BaseService[Dish]):
+    """Service for scoring and ranking dishes for a user."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        engine: Optional[RecommendationEngine] = None,
+        ml_engine: Optional[Any] = None,
+    ):
+        super().__init__(session)
+        self.engine = engine or RecommendationEngine()
+        # Defaults to the live registry model (see get_ml_engine)
+        self.ml_engine = ml_engine
+
+    async def get_user_preferences(self, user_id: uuid.UUID) -> Dict:
+        """Get user preferences for recommendations."""
+        stmt = select(UserPreference).where(UserPreference.user_id == user_id)
+        result = await self.session.execute(stmt)
+        pref = result.scalar_one_or_none()
+
+        if not pref:
+            return {}
+
+        # Parse JSON fields
+        preferred_dietary_tags = []
+        if pref.preferred_dietary_tags:
+            try:
+                preferred_dietary_tags = json.loads(pref.preferred_dietary_tags)
+            except (json.JSONDecodeError, TypeError):
+                preferred_dietary_tags = []
+
+        return {
+            "min_budget": float(pref.min_budget) if pref.min_budget else None,
+            "max_budget": float(pref.max_budget) if pref.max_budget else None,
+            "preferred_dietary_tags": [uuid.UUID(tag_id) for tag_id in preferred_dietary_tags],
+            "preferred_spice_level": pref.preferred_spice_level,
+        }
+
+    async def get_user_favorite_cuisines(self, user_id: uuid.UUID) -> List[uuid.UUID]:
+        """Get list of user's favorite cuisine IDs."""
+        stmt = (
+            select(Cuisine.id)
+            .join(UserCuisineAssociation, Cuisine.id == UserCuisineAssociation.c.cuisine_id)
+            .where(
+                UserCuisineAssociation.c.user_id == user_id,
+                Cuisine.is_deleted.is_(False),
+            )
+        )
+        result = await self.session.execute(stmt)
+        return [row[0] for row in result.all()]
+
+    async def get_user_interactions(
+        self, user_id: uuid.UUID
+    ) -> Dict[uuid.UUID, Dict[str, int]]:
+        """Get user interaction counts grouped by dish_id."""
+        stmt = (
+            select(
+                UserInteraction.dish_id,
+                UserInteraction.interaction_type,
+                func.count(UserInteraction.id).label("count"),
+            )
+            .where(UserInteraction.user_id == user_id)
+            .group_by(UserInteraction.dish_id, UserInteraction.interaction_type)
+        )
+        result = await self.session.execute(stmt)
+
+        interactions: Dict[uuid.UUID, Dict[str, int]] = {}
+        for dish_id, interaction_type, count in result.all():
+            interactions.setdefault(dish_id, {})[interaction_type] = count
+
+        return interactions
+
+    async def get_dish_dietary_tags(
+        self, dish_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[uuid.UUID]]:
+        """Get dietary tags for multiple dishes."""
+        if not dish_ids:
+            return {}
+
+        stmt = select(
+            DishDietaryTagAssociation.c.dish_id,
+            DishDietaryTagAssociation.c.dietary_tag_id,
+        ).where(DishDietaryTagAssociation.c.dish_id.in_(dish_ids))
+        result = await self.session.execute(stmt)
+
+        dish_tags: Dict[uuid.UUID, List[uuid.UUID]] = {}
+        for dish_id, tag_id in result.all():
+            dish_tags.setdefault(dish_id, []).append(tag_id)
+
+        return dish_tags
+
+    async def get_candidate_dishes(
+        self,
+        user_preferences: Dict,
+        cuisine_id: Optional[uuid.UUID] = None,
+        restaurant_id: Optional[uuid.UUID] = None,
+    ) -> List[Any]:
+        """
+        Get candidate dish rows with their cuisine and restaurant names.
+
+        Dishes that can never be recommended are pruned in SQL before scoring:
+        dishes of deleted cuisines/restaurants, dishes outside the requested
+        cuisine/restaurant, and dishes far above the user's max budget.
+        Names are joined in the same query so ranking and hydrating the
+        response never needs a per-dish lookup.
+        """
+        stmt = (
+            select(
+                Dish.id,
+                Dish.name,
+                Dish.description,
+                Dish.price,
+                Dish.rating,
+                Dish.spice_level,
+                Dish.cuisine_id,
+                Dish.restaurant_id,
+                Cuisine.name.label("cuisine_name"),
+                Restaurant.name.label("restaurant_name"),
+            )
+            .join(Cuisine, Cuisine.id == Dish.cuisine_id)
+            .join(Restaurant, Restaurant.id == Dish.restaurant_id)
+            .where(
+                Dish.is_deleted.is_(False),
+                Cuisine.is_deleted.is_(False),
+                Restaurant.is_deleted.is_(False),
+            )
+        )
+
+        # Apply filters
+        if cuisine_id:
+            stmt = stmt.where(Dish.cuisine_id == cuisine_id)
+        if restaurant_id:
+            stmt = stmt.where(Dish.restaurant_id == restaurant_id)
+
+        # Hard budget ceiling (dishes without a price are kept and scored neutrally)
+        max_budget = user_preferences.get("max_budget")
+        if max_budget is not None:
+            stmt = stmt.where(
+                or_(Dish.price.is_(None), Dish.price <= max_budget * BUDGET_HARD_CEILING)
+            )
+
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def score_rules(
+        self,
+        user_preferences: Dict,
+        user_id: uuid.UUID,
+        dishes: List[Any],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score candidate rows with the rule-based engine in one vectorized pass."""
+        user_favorite_cuisines = await self.get_user_favorite_cuisines(user_id)
+        user_interactions = await self.get_user_interactions(user_id)
+
+        # Get dietary tags for all dishes
+        dish_tags_map = await self.get_dish_dietary_tags([dish.id for dish in dishes])
+
+        dish_records = [
+            {
+                "id": dish.id,
+                "price": float(dish.price) if dish.price else None,
+                "cuisine_id": dish.cuisine_id,
+                "rating": float(dish.rating) if dish.rating else None,
+                "spice_level": dish.spice_level,
+            }
+            for dish in dishes
+        ]
+        columns = DishColumns.from_records(
+            dish_records,
+            dish_tags_map,
+            user_interactions,
+            user_preferences.get("preferred_dietary_tags", []),
+        )
+        return self.engine.score_batch(
+            columns,
+            user_preferences,
+            user_favorite_cuisines,
+        )
+
+    async def score_ml(self, user_id: uuid.UUID, dishes: List[Any]) -> np.ndarray:
+        """Score candidate rows with the trained ML model in one batch."""
+        ml_engine = self.ml_engine or await get_ml_engine()
+        if ml_engine is None:
+            raise ValueError("ML recommendation model is not available")
+        return await ml_engine.predict_scores(user_id, [dish.id for dish in dishes], self.session)
+
+    async def recommend(
+        self,
+        user: User,
+        limit: int,
+        min_score: float = 0.0,
+        cuisine_id: Optional[uuid.UUID] = None,
+        restaurant_id: Optional[uuid.UUID] = None,
+        backend: str = RULES_BACKEND,
+    ) -> List[RecommendedDish]:
+        """
+        Score candidate dishes for a user and return the top `limit`, best first.
+
+        With the rules backend every returned dish carries its score breakdown
+        and explanation; callers strip them when they are not wanted. The ML
+        backend returns scores only.
+        """
+        user_preferences = await self.get_user_preferences(user.id)
+
+        # Also check user's spice_level_preference from User model
+        if not user_preferences.get("preferred_spice_level") and user.spice_level_preference:
+            user_preferences["preferred_spice_level"] = user.spice_level_preference
+
+        # Get all matching dishes with cuisine/restaurant names in one query
+        dishes = await self.get_candidate_dishes(user_preferences, cuisine_id, restaurant_id)
+        if not dishes:
+            return []
+
+        breakdowns = None
+        if backend == ML_BACKEND:
+            totals = await self.score_ml(user.id, dishes)
+        else:
+            totals, breakdowns = await self.score_rules(user_preferences, user.id, dishes)
+
+        # Select the top `limit` dishes above min_score without sorting everything
+        ranked = select_top_k(totals, limit, min_score or 0.0)
+
+        # Only build recommendation objects for the dishes being returned
+        recommendations = []
+        for idx in ranked:
+            dish = dishes[idx]
+            score = float(totals[idx])
+            breakdown = None
+            if breakdowns is not None:
+                breakdown = ScoreBreakdown.from_row(breakdowns[idx], score)
+
+            recommendations.append(
+                RecommendedDish(
+                    dish_id=dish.id,
+                    name=dish.name,
+                    description=dish.description,
+                    price=float(dish.price) if dish.price else None,
+                    rating=float(dish.rating) if dish.rating else None,
+                    cuisine_id=dish.cuisine_id,
+                    cuisine_name=dish.cuisine_name,
+                    restaurant_id=dish.restaurant_id,
+                    restaurant_name=dish.restaurant_name,
+                    match_score=round(score, 2),
+                    score_breakdown=ScoreBreakdownResponse(**breakdown.to_dict()) if breakdown else None,
+                    explanation=breakdown.get_explanation() if breakdown else None,
+                )
+            )
+
+        return recommendations
+
+
+class RecommendationStore:
+    """
+    Materialized per-user top-N recommendations, stored through CacheService.
+
+    Entries expire after RECOMMENDATION_STORE_TTL; a missing entry means the
+    caller should fall back to live scoring.
+    """
+
+    def __init__(self, cache: CacheService):
+        self.cache = cache
+
+    @staticmethod
+    def key(user_id: uuid.UUID) -> str:
+        return f"recommendations:user:{user_id}"
+
+    @staticmethod
+    def refresh_key(user_id: uuid.UUID) -> str:
+        return f"recommendations:refresh:{user_id}"
+
+    async def get(self, user_id: uuid.UUID) -> Optional[List[RecommendedDish]]:
+        """Get stored recommendations for a user, or None if missing/stale."""
+        cached = await self.cache.get(self.key(user_id))
+        if not cached:
+            return None
+        try:
+            return [RecommendedDish.model_validate(item) for item in cached["recommendations"]]
+        except Exception as e:
+            logger.warning(f"Discarding unreadable stored recommendations for {user_id}: {str(e)}")
+            return None
+
+    async def put(self, user_id: uuid.UUID, recommendations: List[RecommendedDish]) -> bool:
+        """Store a user's top-N recommendations."""
+        return await self.cache.set(
+            self.key(user_id),
+            {
+                "computed_at": datetime.now(timezone.utc).isoformat(),
+                "recommendations": [item.model_dump(mode="json") for item in recommendations],
+            },
+            ttl=settings.RECOMMENDATION_STORE_TTL,
+        )
+
+    async def invalidate(self, user_id: uuid.UUID) -> bool:
+        """Drop a user's stored recommendations so the next read scores live."""
+        return await self.cache.delete(self.key(user_id))
+
+    async def claim_refresh(self, user_id: uuid.UUID) -> bool:
+        """
+        Claim the right to enqueue a refresh for a user.
+
+        Returns False while another refresh is already pending, so bursts of
+        interactions only schedule one recomputation.
+        """
+        return await self.cache.set_if_absent(
+            self.refresh_key(user_id),
+            settings.RECOMMENDATION_REFRESH_DELAY,
+        )
+
+    async def refresh(self, user: User, service: RecommendationService) -> List[RecommendedDish]:
+        """Recompute and store a user's top-N recommendations."""
+        recommendations = await service.recommend(user, limit=settings.RECOMMENDATION_STORE_SIZE)
+        await self.put(user.id, recommendations)
+        return recommendations
@@ -0,0 +1,114 @@
+"""
+Search result caching and top-query statistics.
+
+Rendered search results are cached in CacheService under the normalized query
+(see normalize_query: Unicode-normalized, case-folded, whitespace-collapsed)
+and the search parameters, so "Biryani", "biryani " and "ＢＩＲＹＡＮＩ" share
+an entry. Keys carry the generations of the namespaces the results depend
+on; the admin dish, restaurant, cuisine and mood mutations bump those
+(invalidate_dish, ...), which retires every cached search at once.
+
+Every first-page search also counts its normalized query in a daily ranking
+(a Redis sorted set kept SEARCH_STATS_RETENTION_DAYS), and top_search_queries
+sums the recent days. Dietary tag edits bump no namespace; searches pick
+them up when their entry expires (SEARCH_CACHE_TTL).
+"""
+
+import hashlib
+import json
+import logging
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Dict, List
+
+from app.core.config import settings
+from app.services.cache_service import CacheService
+from app.services.search_service import normalize_query
+
+logger = logging.getLogger(__name__)
+
+# "search" first: it names the keys (and their metrics) and can be bumped on its
+# own when ranking changes; the others are bumped by catalog mutations
+SEARCH_CACHE_NAMESPACES = ("search", "dish:list", "restaurant:list", "cuisine:list", "mood:list")
+
+
+def _ranking_key(day: date) -> str:
+    return f"search:top-queries:{day.isoformat()}"
+
+
+async def search_cache_key(cache: CacheService, query: str, params: Dict[str, Any]) -> str:
+    """Cache key of a search: normalized query and parameters, under the current generations."""
+    generations = [str(await cache.namespace_generation(namespace)) for namespace in SEARCH_CACHE_NAMESPACES]
+    parts = json.dumps([normalize_query(query), params], sort_keys=True, default=str)
+    digest = hashlib.blake2b(parts.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{SEARCH_CACHE_NAMESPACES[0]}:v{'.'.join(generations)}:results:{digest}"
+
+
+async def cached_search(
+    cache: CacheService,
+    query: str,
+    params: Dict[str, Any],
+    render: Callable[[], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Search results from the cache, or rendered by `render()` and cached.
+
+    Args:
+        cache: Cache service
+        query: Query as typed; only its normalized form is part of the key
+        params: Every other parameter the results depend on (limits, cursors, ...)
+        render: Runs the search; returns JSON-serializable data
+
+    Raises:
+        Whatever `render()` raises
+    """
+    if not settings.SEARCH_CACHE_ENABLED:
+        return await render()
+
+    key = await search_cache_key(cache, query, params)
+    outcome: Dict[str, Any] = {}
+
+    async def fetch():
+        try:
+            outcome["data"] = await render()
+        except Exception as e:
+            outcome["error"] = e
+            return None
+        return outcome["data"]
+
+    data = await cache.get_or_set(key, fetch, ttl=settings.SEARCH_CACHE_TTL)
+    if data is not None:
+        return data
+    if "error" in outcome:
+        raise outcome["error"]
+    if "data" in outcome:
+        return outcome["data"]
+    # Cache unavailable, or another caller's fetch failed
+    return await render()
+
+
+async def record_search_query(cache: CacheService, query: str) -> None:
+    """Count a query in today's ranking."""
+    if not settings.SEARCH_STATS_ENABLED:
+        return
+    normalized = normalize_query(query)
+    if not normalized:
+        return
+    await cache.increment_ranking(
+        _ranking_key(date.today()),
+        normalized,
+        ttl=settings.SEARCH_STATS_RETENTION_DAYS * 86400,
+        max_members=settings.SEARCH_STATS_MAX_QUERIES,
+    )
+
+
+async def top_search_queries(cache: CacheService, days: int = 7, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Most searched normalized queries over the last `days` days (today included).
+
+    Returns:
+        {"query", "count"} entries, most searched first
+    """
+    days = max(1, min(days, settings.SEARCH_STATS_RETENTION_DAYS))
+    today = date.today()
+    keys = [_ranking_key(today - timedelta(days=offset)) for offset in range(days)]
+    return [{"query": query, "count": count} for query, count in await cache.top_ranked(keys, limit)]
@@ -0,0 +1,440 @@
+"""
+Ranked catalog search over dishes, restaurants and cuisines.
+
+On Postgres each searchable table carries a generated `search_vector` tsvector
+column (name weighted above description) with a GIN index, plus a pg_trgm GIN
+index on `lower(name)`; both are created by the `add_catalog_search` migration
+and are not mapped on the models. A row matches when the full-text query
+matches its vector, its name contains the term, or the term is a close trigram
+match for a word of its name (typos). Rows are ranked by `ts_rank_cd` plus the
+trigram word similarity of the name.
+
+Other dialects (SQLite test runs) fall back to scoring names and descriptions
+in Python with `text_match_score`, which follows the same rules.
+
+Each group is paged on its own: it has its own limit, and the next page of a
+group is requested with the opaque cursor returned for it. On Postgres the
+groups are queried concurrently (SEARCH_CONCURRENT_QUERIES), each on a pooled
+connection of its own, so a search costs one round-trip of latency instead of
+three. At most SEARCH_MAX_EXTRA_CONNECTIONS such connections are held per
+process; queries that find no free slot run one after another on the request's
+session rather than wait for the pool.
+
+Facet counts of the matching dishes (cuisine, mood, dietary tag, spice level,
+price and rating bucket) can be requested alongside; they are computed by a
+single statement that groups the matches once per facet (UNION ALL).
+"""
+
+import asyncio
+import base64
+import binascii
+import difflib
+import hashlib
+import json
+import re
+import unicodedata
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import String, case, cast, func, literal, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.models.food import Cuisine, Dish, DishMoodAssociation, Mood, Restaurant
+from app.models.recommendation import DietaryTag, DishDietaryTagAssociation
+from app.services.base import BaseService
+
+# Text search configuration of the search_vector columns (see the migration)
+SEARCH_TEXT_CONFIG = "english"
+
+# Result groups of a search, in response order
+SEARCHABLE = {
+    "dishes": Dish,
+    "restaurants": Restaurant,
+    "cuisines": Cuisine,
+}
+
+# Minimum difflib ratio for a query word to count as a misspelt name word
+FUZZY_WORD_CUTOFF = 0.8
+
+# Upper bounds (exclusive) of the price (menu currency) and rating facet
+# buckets; the last bucket is open-ended
+PRICE_FACET_BUCKETS = (500, 1000, 2000, 5000)
+RATING_FACET_BUCKETS = (3.0, 4.0, 4.5)
+
+_WORD_RE = re.compile(r"\w+")
+
+# Slots for the extra pooled connections of concurrent searches. Only ever
+# acquired when free, so a saturated pool slows searches down instead of
+# blocking other requests on pool_timeout.
+_extra_connections = asyncio.Semaphore(settings.SEARCH_MAX_EXTRA_CONNECTIONS)
+
+
+def normalize_query(query: str) -> str:
+    """Unicode-normalize (NFKC) and case-fold a query, and collapse its whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def _query_digest(query: str) -> str:
+    return hashlib.blake2b(normalize_query(query).encode("utf-8"), digest_size=6).hexdigest()
+
+
+def encode_cursor(query: str, offset: int) -> str:
+    """Opaque cursor for the results of `query` from `offset` on."""
+    payload = json.dumps({"q": _query_digest(query), "o": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(query: str, cursor: Optional[str]) -> int:
+    """
+    Offset a cursor points at (0 without one).
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another query
+    """
+    if not cursor:
+        return 0
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        offset = int(payload["o"])
+        digest = payload["q"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ValueError("Invalid search cursor") from None
+    if digest != _query_digest(query) or offset < 0:
+        raise ValueError("Search cursor does not belong to this query")
+    return offset
+
+
+@dataclass
+class SearchPage:
+    """One page of a result group, and the cursor of the next page (None on the last)."""
+
+    items: List = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class SearchResults:
+    """Pages per result group, and dish facet counts if requested."""
+
+    pages: Dict[str, SearchPage]
+    facets: Optional[Dict[str, List[Dict]]] = None
+
+
+def _bucket_ranges(edges: Sequence[float]) -> List[Tuple[str, Optional[float], Optional[float]]]:
+    """(label, min, max) per bucket: "<500", "500-1000", ..., "5000+"."""
+    bounds = [None, *edges, None]
+    ranges = []
+    for low, high in zip(bounds, bounds[1:]):
+        if low is None:
+            label = f"<{high:g}"
+        elif high is None:
+            label = f"{low:g}+"
+        else:
+            label = f"{low:g}-{high:g}"
+        ranges.append((label, low, high))
+    return ranges
+
+
+def _bucket(column, edges: Sequence[float]):
+    """SQL CASE mapping a column to its bucket label (NULL stays NULL)."""
+    ranges = _bucket_ranges(edges)
+    return case(
+        (column.is_(None), None),
+        *((column < high, label) for label, _, high in ranges[:-1]),
+        else_=ranges[-1][0],
+    )
+
+
+def _matching_dishes(*where):
+    """Columns of the matching dishes that facets are counted over."""
+    return select(
+        Dish.id,
+        Dish.cuisine_id,
+        Dish.spice_level,
+        _bucket(Dish.price, PRICE_FACET_BUCKETS).label("price_bucket"),
+        _bucket(Dish.rating, RATING_FACET_BUCKETS).label("rating_bucket"),
+    ).where(*where)
+
+
+def _facet_statement(matches):
+    """
+    Counts of the matching dishes (a _matching_dishes CTE) per facet value,
+    as (facet, value, label, count) rows.
+    """
+    def counts(facet: str, value, label, source, *where):
+        return (
+            select(
+                literal(facet).label("facet"),
+                cast(value, String).label("value"),
+                cast(label, String).label("label"),
+                func.count().label("count"),
+            )
+            .select_from(source)
+            .where(*where)
+            .group_by(value, label)
+        )
+
+    return union_all(
+        counts(
+            "cuisine", Cuisine.id, Cuisine.name,
+            matches.join(Cuisine, Cuisine.id == matches.c.cuisine_id),
+            Cuisine.is_deleted.is_(False),
+        ),
+        counts(
+            "mood", Mood.id, Mood.name,
+            matches.join(DishMoodAssociation, DishMoodAssociation.c.dish_id == matches.c.id)
+            .join(Mood, Mood.id == DishMoodAssociation.c.mood_id),
+            Mood.is_deleted.is_(False),
+        ),
+        counts(
+            "dietary_tag", DietaryTag.id, DietaryTag.name,
+            matches.join(DishDietaryTagAssociation, DishDietaryTagAssociation.c.dish_id == matches.c.id)
+            .join(DietaryTag, DietaryTag.id == DishDietaryTagAssociation.c.dietary_tag_id),
+            DietaryTag.is_deleted.is_(False),
+        ),
+        *(
+            counts(facet, column, column, matches, column.is_not(None))
+            for facet, column in (
+                ("spice_level", matches.c.spice_level),
+                ("price", matches.c.price_bucket),
+                ("rating", matches.c.rating_bucket),
+            )
+        ),
+    )
+
+
+def _facets_from_rows(rows) -> Dict[str, List[Dict]]:
+    """Group (facet, value, label, count) rows; buckets keep their order, other values go by count."""
+    facets: Dict[str, List[Dict]] = {
+        facet: [] for facet in ("cuisine", "mood", "dietary_tag", "spice_level", "price", "rating")
+    }
+    for facet, value, label, count in rows:
+        if facet in ("cuisine", "mood", "dietary_tag"):
+            value = str(uuid.UUID(value))  # SQLite renders UUIDs without dashes
+        facets[facet].append({"value": value, "label": label, "count": count})
+    for facet in ("cuisine", "mood", "dietary_tag", "spice_level"):
+        facets[facet].sort(key=lambda entry: (-entry["count"], entry["label"]))
+    for facet, edges in (("price", PRICE_FACET_BUCKETS), ("rating", RATING_FACET_BUCKETS)):
+        counted = {entry["value"]: entry["count"] for entry in facets[facet]}
+        facets[facet] = [
+            {"value": label, "label": label, "min": low, "max": high, "count": counted[label]}
+            for label, low, high in _bucket_ranges(edges)
+            if label in counted
+        ]
+    return facets
+
+
+def text_match_score(query: str, name: str, description: Optional[str] = None) -> float:
+    """
+    Relevance of a row to a query; 0.0 means it does not match.
+
+    Whole-name and substring matches rank highest, then query words found in
+    the name (exactly, as a prefix, or misspelt), then words found only in
+    the description.
+    """
+    query = normalize_query(query)
+    name = normalize_query(name or "")
+    if not query or not name:
+        return 0.0
+
+    score = 0.0
+    if name == query:
+        score += 3.0
+    elif name.startswith(query):
+        score += 2.0
+    elif query in name:
+        score += 1.5
+
+    name_words = _WORD_RE.findall(name)
+    description_words = set(_WORD_RE.findall((description or "").lower()))
+    for word in _WORD_RE.findall(query):
+        if word in name_words:
+            score += 1.0
+        elif any(name_word.startswith(word) for name_word in name_words):
+            score += 0.75
+        elif difflib.get_close_matches(word, name_words, n=1, cutoff=FUZZY_WORD_CUTOFF):
+            score += 0.5
+        elif word in description_words or any(d.startswith(word) for d in description_words):
+            score += 0.25
+    return score
+
+
+class SearchService(BaseService):
+    """Catalog search with a Postgres full-text/trigram backend and a Python fallback."""
+
+    @property
+    def dialect(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        limits: Optional[Dict[str, int]] = None,
+        cursors: Optional[Dict[str, Optional[str]]] = None,
+        facets: bool = False,
+    ) -> SearchResults:
+        """
+        Search every catalog group for a query.
+
+        Args:
+            query: Search keywords, as typed by the user
+            limit: Maximum results per group
+            limits: Per-group overrides of `limit` ({"dishes": 20, ...}); 0 skips a group
+            cursors: Per-group cursors from a previous page's `next_cursor`
+            facets: Also count the matching dishes per facet value (see dish_facets)
+
+        Returns:
+            A page of live rows per group ("dishes", "restaurants", "cuisines"),
+            best match first, and the facet counts if requested
+
+        Raises:
+            ValueError: If a cursor is invalid for this query
+        """
+        limits = limits or {}
+        cursors = cursors or {}
+        groups = list(SEARCHABLE)
+        jobs = [
+            ("_search_page", (query, model, limits.get(group, limit), decode_cursor(query, cursors.get(group))))
+            for group, model in SEARCHABLE.items()
+        ]
+        if facets:
+            jobs.append(("dish_facets", (query,)))
+        if self.dialect == "postgresql" and settings.SEARCH_CONCURRENT_QUERIES:
+            outputs = await self._run_concurrently(jobs)
+        else:
+            outputs = await self._run_sequentially(jobs)
+        return SearchResults(
+            pages=dict(zip(groups, outputs)),
+            facets=outputs[len(groups)] if facets else None,
+        )
+
+    async def _run_sequentially(self, jobs) -> List:
+        return [await getattr(self, name)(*args) for name, args in jobs]
+
+    async def _run_concurrently(self, jobs) -> List:
+        """
+        Run jobs on connections of their own while extra connection slots are
+        free; the rest (at least one) run alongside on the request session.
+        """
+        slots = 0
+        while slots < len(jobs) - 1 and not _extra_connections.locked():
+            await _extra_connections.acquire()  # Does not wait: a slot is free
+            slots += 1
+        try:
+            *outputs, rest = await asyncio.gather(
+                *(self._run_in_own_session(name, *args) for name, args in jobs[:slots]),
+                self._run_sequentially(jobs[slots:]),
+            )
+        finally:
+            for _ in range(slots):
+                _extra_connections.release()
+        return outputs + rest
+
+    async def _run_in_own_session(self, method: str, *args):
+        # A session of its own checks out its own pooled connection
+        async with AsyncSession(self.session.bind, expire_on_commit=False) as session:
+            return await getattr(SearchService(session), method)(*args)
+
+    async def dish_facets(self, query: str) -> Dict[str, List[Dict]]:
+        """
+        Facet counts of the live dishes matching a query, in one statement.
+
+        Returns:
+            Per facet ("cuisine", "mood", "dietary_tag", "spice_level", "price",
+            "rating"), {"value", "label", "count"} entries; price and rating
+            buckets also carry their "min" (inclusive) and "max" (exclusive),
+            None if open-ended; they describe the bucket, not /dishes filters
+        """
+        term = normalize_query(query)
+        if not term:
+            return _facets_from_rows([])
+        if self.dialect == "postgresql":
+            match, _ = self._postgres_match(Dish, term)
+            matching = _matching_dishes(Dish.is_deleted.is_(False), match)
+        else:
+            ids = await self._python_matches(Dish, term)
+            if not ids:
+                return _facets_from_rows([])
+            matching = _matching_dishes(Dish.id.in_(ids))
+        result = await self.session.execute(_facet_statement(matching.cte("matches")))
+        return _facets_from_rows(result.all())
+
+    async def _search_page(self, query: str, model, limit: int, offset: int) -> SearchPage:
+        if limit <= 0:
+            return SearchPage()
+        # One extra row tells whether there is a next page
+        items = await self.search_model(model, query, limit + 1, offset)
+        next_cursor = encode_cursor(query, offset + limit) if len(items) > limit else None
+        return SearchPage(items=items[:limit], next_cursor=next_cursor)
+
+    async def search_model(self, model, query: str, limit: int = 10, offset: int = 0) -> List:
+        """Ranked live rows of one searchable model."""
+        term = normalize_query(query)
+        if not term:
+            return []
+        if self.dialect == "postgresql":
+            return await self._search_postgres(model, term, limit, offset)
+        return await self._search_python(model, term, limit, offset)
+
+    def _base_query(self, model):
+        stmt = select(model).where(model.is_deleted.is_(False))
+        if model is Dish:
+            stmt = stmt.options(selectinload(Dish.moods))
+        return stmt
+
+    @staticmethod
+    def _postgres_match(model, term: str):
+        """The match condition of a model's rows and their rank."""
+        search_vector = literal_column(f"{model.__tablename__}.search_vector", type_=TSVECTOR)
+        ts_query = func.websearch_to_tsquery(SEARCH_TEXT_CONFIG, term)
+        name = func.lower(model.name)
+        match = (
+            search_vector.op("@@")(ts_query)
+            | name.contains(term, autoescape=True)
+            # word_similarity above pg_trgm.word_similarity_threshold (0.6)
+            | literal(term).op("<%")(name)
+        )
+        return match, func.ts_rank_cd(search_vector, ts_query) + func.word_similarity(term, name)
+
+    async def _search_postgres(self, model, term: str, limit: int, offset: int) -> List:
+        match, rank = self._postgres_match(model, term)
+        stmt = (
+            self._base_query(model)
+            .where(match)
+            .order_by(rank.desc(), model.name, model.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def _python_matches(self, model, term: str) -> List[uuid.UUID]:
+        """Ids of a model's live rows matching a term, best first."""
+        result = await self.session.execute(
+            select(model.id, model.name, model.description).where(model.is_deleted.is_(False))
+        )
+        return self._rank(term, result.all())
+
+    async def _search_python(self, model, term: str, limit: int, offset: int) -> List:
+        ranked = (await self._python_matches(model, term))[offset:offset + limit]
+        if not ranked:
+            return []
+        result = await self.session.execute(self._base_query(model).where(model.id.in_(ranked)))
+        by_id = {item.id: item for item in result.scalars().all()}
+        return [by_id[item_id] for item_id in ranked if item_id in by_id]
+
+    @staticmethod
+    def _rank(term: str, rows: Sequence[Tuple[uuid.UUID, str, Optional[str]]]) -> List[uuid.UUID]:
+        scored = [
+            (score, name.lower(), item_id)
+            for item_id, name, description in rows
+            if (score := text_match_score(term, name, description)) > 0
+        ]
+        # Equal scores: the shorter name is the closer match; ids keep pages stable
+        scored.sort(key=lambda row: (-row[0], len(row[1]), row[1], str(row[2])))
+        return [item_id for _, _, item_id in scored]
@@ -0,0 +1,134 @@
+"""Type-ahead suggestions from an in-process SuggestIndex kept in step with the catalog."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.food import Cuisine, Dish, Restaurant
+from app.services.cache_service import CacheService
+from app.services.search_service import SearchService
+from app.utils.suggest_index import SuggestIndex
+
+logger = logging.getLogger(__name__)
+
+# Entities offered as suggestions, keyed by their SuggestIndex kind
+SUGGEST_MODELS = {
+    "dish": Dish,
+    "restaurant": Restaurant,
+    "cuisine": Cuisine,
+}
+
+_suggest_index = SuggestIndex()  # Not ready until the first build
+
+
+async def rebuild_suggest_index() -> SuggestIndex:
+    """Build a fresh index from the live catalog and swap it in."""
+    global _suggest_index
+    entries = []
+    async with AsyncSessionLocal() as session:
+        for kind, model in SUGGEST_MODELS.items():
+            result = await session.execute(
+                select(model.id, model.name).where(model.is_deleted.is_(False))
+            )
+            entries.extend((kind, entity_id, name) for entity_id, name in result.all())
+    # A 100k-entry build takes a few seconds of pure Python, which would hold
+    # the GIL in a thread just the same; build in steps and let requests run
+    # in between instead
+    steps = SuggestIndex.build_steps(entries)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            _suggest_index = done.value
+            return _suggest_index
+        await asyncio.sleep(0)
+
+
+async def apply_entity_changes(changes: Dict[str, Set[str]]) -> None:
+    """Re-read written entities ({kind: {id, ...}}) and upsert or drop them in the index."""
+    async with AsyncSessionLocal() as session:
+        for kind, ids in changes.items():
+            model = SUGGEST_MODELS.get(kind)
+            if model is None:
+                continue
+            entity_ids = [uuid.UUID(entity_id) for entity_id in ids]
+            result = await session.execute(
+                select(model.id, model.name).where(model.id.in_(entity_ids), model.is_deleted.is_(False))
+            )
+            live = dict(result.all())
+            for entity_id in entity_ids:
+                if entity_id in live:
+                    _suggest_index.upsert(kind, entity_id, live[entity_id])
+                else:
+                    _suggest_index.remove(kind, entity_id)
+
+
+async def run_suggest_index_refresher(cache: CacheService) -> None:
+    """
+    Build the index, then apply catalog writes as CacheService reports them
+    (from any worker). A full rebuild every SUGGEST_INDEX_REBUILD_SECONDS
+    picks up writes that bypassed the invalidate_* hooks or were broadcast
+    while Redis was unreachable.
+    """
+    changes: asyncio.Queue = asyncio.Queue()
+    cache.add_entity_listener(changes.put_nowait)
+    while True:
+        try:
+            started = time.monotonic()
+            index = await rebuild_suggest_index()
+            logger.info(
+                f"Built suggest index: {len(index)} entries, "
+                f"{index.memory_report()['total_bytes'] / 1024 / 1024:.1f} MiB, "
+                f"{time.monotonic() - started:.2f}s"
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Suggest index build failed: {str(e)}")
+
+        rebuild_at = time.monotonic() + settings.SUGGEST_INDEX_REBUILD_SECONDS
+        while (remaining := rebuild_at - time.monotonic()) > 0:
+            try:
+                written = [await asyncio.wait_for(changes.get(), timeout=remaining)]
+            except asyncio.TimeoutError:
+                break
+            while not changes.empty():
+                written.append(changes.get_nowait())
+            pending: Dict[str, Set[str]] = defaultdict(set)
+            for known_ids in written:
+                for kind, ids in known_ids.items():
+                    pending[kind].update(ids)
+            try:
+                await apply_entity_changes(pending)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Suggest index update failed: {str(e)}")
+
+
+async def suggest(
+    session: AsyncSession,
+    query: str,
+    limit: int = 8,
+    kind: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """
+    Suggestions ({"id", "name", "type"}) for the text typed so far, from the
+    index; until it is built, from SearchService (a query per kind).
+    """
+    if _suggest_index.ready:
+        return _suggest_index.suggest(query, limit, [kind] if kind else None)
+    service = SearchService(session)
+    suggestions = []
+    for name in [kind] if kind else SUGGEST_MODELS:
+        for item in await service.search_model(SUGGEST_MODELS[name], query, limit):
+            suggestions.append({"id": str(item.id), "name": item.name, "type": name})
+    return suggestions[:limit]
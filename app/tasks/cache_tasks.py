@@ -0,0 +1,49 @@
+"""
+Celery tasks for warming the catalog response cache.
+"""
+
+import logging
+
+from app.core.celery_app import celery_app
+from app.services.cache_service import CacheService, close_cache_service
+from app.tasks.recommendation_tasks import run_async
+from app.utils.cache_warming import warm_catalog_cache
+
+logger = logging.getLogger(__name__)
+
+# Marker that collapses the startup warm-ups of several API workers into one
+WARM_SCHEDULED_KEY = "cache-warm:scheduled"
+WARM_SCHEDULED_TTL = 60  # seconds
+
+
+@celery_app.task(name="warm_catalog_cache")
+def warm_catalog_cache_task(pages: int = None, invalidate: bool = False):
+    """
+    Celery task that pre-populates the catalog response cache.
+
+    Args:
+        pages: Dish listing pages to warm (default: CACHE_WARM_PAGES)
+        invalidate: Retire existing catalog entries first (after bulk imports)
+    """
+    async def warm():
+        try:
+            return await warm_catalog_cache(pages=pages, invalidate=invalidate)
+        finally:
+            # The global cache service is bound to this task's event loop
+            await close_cache_service()
+
+    report = run_async(warm())
+    return {"status": "success", **report}
+
+
+async def schedule_cache_warm(cache: CacheService, invalidate: bool = False) -> None:
+    """
+    Enqueue a catalog warm-up, at most once per WARM_SCHEDULED_TTL unless
+    `invalidate` is set (bulk imports always need their own).
+    """
+    if not invalidate and not await cache.set_if_absent(WARM_SCHEDULED_KEY, WARM_SCHEDULED_TTL):
+        return
+    try:
+        warm_catalog_cache_task.apply_async(kwargs={"invalidate": invalidate})
+    except Exception as e:
+        logger.warning(f"Could not enqueue catalog cache warm-up: {str(e)}")
@@ -0,0 +1,123 @@
+"""
+Celery tasks for materialized per-user recommendations.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, union
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.models.recommendation import UserInteraction, UserPreference
+from app.models.user import User
+from app.services.cache_service import CacheService
+from app.services.recommendation_service import RecommendationService, RecommendationStore
+
+logger = logging.getLogger(__name__)
+
+
+def run_async(coro):
+    """
+    Run a coroutine from a Celery worker.
+
+    Each task gets its own event loop, so pooled DB connections are disposed
+    afterwards instead of being reused across loops.
+    """
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(runner())
+
+
+async def _refresh_users(user_ids) -> int:
+    """Recompute stored recommendations for the given users."""
+    # Short-lived instance: no L1 tier, but writes still invalidate API workers' L1
+    cache = CacheService(local_cache=False)
+    store = RecommendationStore(cache)
+    refreshed = 0
+    try:
+        async with AsyncSessionLocal() as session:
+            service = RecommendationService(session)
+            result = await session.execute(
+                select(User).where(User.id.in_(user_ids), User.is_deleted.is_(False))
+            )
+            for user in result.scalars().all():
+                await store.refresh(user, service)
+                refreshed += 1
+    finally:
+        await cache.close()
+    return refreshed
+
+
+async def _active_user_ids():
+    """Users with preferences or recent interactions."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.RECOMMENDATION_ACTIVE_DAYS)
+    stmt = union(
+        select(UserPreference.user_id),
+        select(UserInteraction.user_id).where(UserInteraction.interaction_timestamp >= cutoff),
+    )
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        return [row[0] for row in result.all()]
+
+
+@celery_app.task(name="refresh_user_recommendations", max_retries=3, default_retry_delay=60)
+def refresh_user_recommendations_task(user_id: str):
+    """
+    Celery task to recompute one user's stored recommendations.
+
+    Args:
+        user_id: User ID (string form of the UUID)
+    """
+    refreshed = run_async(_refresh_users([uuid.UUID(user_id)]))
+    return {"status": "success", "user_id": user_id, "refreshed": refreshed}
+
+
+@celery_app.task(name="refresh_all_recommendations")
+def refresh_all_recommendations_task():
+    """
+    Periodic Celery task that recomputes stored recommendations for active users,
+    so catalog changes (new, edited or deleted dishes) reach the store.
+    """
+    async def refresh_all():
+        user_ids = await _active_user_ids()
+        return await _refresh_users(user_ids) if user_ids else 0
+
+    refreshed = run_async(refresh_all())
+    logger.info(f"Refreshed stored recommendations for {refreshed} users")
+    return {"status": "success", "refreshed": refreshed}
+
+
+async def schedule_recommendation_refresh(
+    user_id: uuid.UUID,
+    cache: CacheService,
+    invalidate: bool = False,
+) -> None:
+    """
+    Schedule a refresh of a user's stored recommendations.
+
+    Args:
+        user_id: User whose inputs changed
+        cache: Cache service backing the store
+        invalidate: Drop the stored entry right away (preference changes) instead
+            of serving it until the refresh lands (interaction tracking)
+    """
+    store = RecommendationStore(cache)
+    if invalidate:
+        await store.invalidate(user_id)
+    if not await store.claim_refresh(user_id):
+        return
+    try:
+        refresh_user_recommendations_task.apply_async(
+            args=[str(user_id)],
+            countdown=settings.RECOMMENDATION_REFRESH_DELAY,
+        )
+    except Exception as e:
+        logger.warning(f"Could not enqueue recommendation refresh for {user_id}: {str(e)}")
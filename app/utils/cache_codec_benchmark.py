@@ -0,0 +1,105 @@
+"""
+Microbenchmark of cache payload codecs over DishOut list pages.
+
+Encodes and decodes pages of `DishOut` (with nested moods) with every
+available codec/compression combination and reports payload size and
+per-operation time:
+
+    python -m app.utils.cache_codec_benchmark
+    python -m app.utils.cache_codec_benchmark --page-sizes 20 100 500 --repeat 500
+"""
+import argparse
+import random
+import sys
+import timeit
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.schemas.dish import DishOut
+from app.schemas.mood import MoodOut
+from app.utils.cache_codecs import CODECS, COMPRESSIONS, PayloadCodec
+
+WORDS = "spicy smoky tangy crispy creamy grilled slow-cooked fresh herb garlic butter lemon".split()
+
+
+def make_page(size: int, rng: random.Random) -> dict:
+    """A dish list page shaped like what the dish endpoints cache."""
+    now = datetime.now(timezone.utc)
+    moods = [
+        MoodOut(
+            id=uuid.uuid4(),
+            name=f"Mood {i}",
+            description=" ".join(rng.choices(WORDS, k=8)),
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(12)
+    ]
+    dishes = [
+        DishOut(
+            id=uuid.uuid4(),
+            name=f"Dish {i}",
+            description=" ".join(rng.choices(WORDS, k=rng.randint(10, 40))),
+            restaurant_id=uuid.uuid4(),
+            cuisine_id=uuid.uuid4(),
+            price=round(rng.uniform(3, 40), 2),
+            rating=round(rng.uniform(1, 5), 1),
+            is_featured=rng.random() < 0.1,
+            featured_week=date.today() if rng.random() < 0.1 else None,
+            calories=rng.randint(150, 1200),
+            preparation_time_minutes=rng.randint(5, 60),
+            created_at=now - timedelta(days=rng.randint(0, 365)),
+            updated_at=now,
+            moods=rng.sample(moods, k=rng.randint(0, 4)),
+        )
+        for i in range(size)
+    ]
+    return {
+        "items": [dish.model_dump() for dish in dishes],
+        "total": size * 10,
+        "page": 1,
+        "page_size": size,
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark cache payload codecs.")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 100, 500], help="Dishes per page")
+    parser.add_argument("--repeat", type=int, default=200, help="Encode/decode iterations per measurement")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    print(f"codecs: {', '.join(CODECS)}; compression: {', '.join(COMPRESSIONS)}")
+
+    for size in args.page_sizes:
+        page = make_page(size, rng)
+        baseline = None
+        print(f"\n{size} dishes per page")
+        print(f"  {'format':<18}{'bytes':>10}{'ratio':>8}{'encode µs':>12}{'decode µs':>12}")
+        for codec_name in CODECS:
+            for compression_name in COMPRESSIONS:
+                codec = PayloadCodec(codec_name, compression_name, compression_threshold=0)
+                payload = codec.encode(page)
+                encode = timeit.timeit(
+                    lambda codec=codec, page=page: codec.encode(page), number=args.repeat
+                ) / args.repeat
+                decode = timeit.timeit(
+                    lambda codec=codec, payload=payload: codec.decode(payload), number=args.repeat
+                ) / args.repeat
+                baseline = baseline or len(payload)
+                print(
+                    f"  {codec_name + '+' + compression_name:<18}{len(payload):>10}"
+                    f"{len(payload) / baseline:>8.2f}{encode * 1e6:>12.1f}{decode * 1e6:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Serialization codecs and compression for cached payloads.
+
+Payloads written by `encode` start with a 3-byte header:
+
+    b"\x00" | codec id | compression id
+
+JSON text never starts with a NUL byte, so headerless payloads are read as
+plain JSON (what CacheService wrote before codecs existed). The plain "json"
+codec without compression also writes headerless payloads, so workers on
+either version can read each other's entries until the codec is switched.
+
+orjson, msgpack, zstandard and lz4 are pinned in requirements.txt but imported
+optionally; a codec or compression whose package is not installed falls back
+to json / no compression with a warning.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+HEADER_MAGIC = b"\x00"
+HEADER_SIZE = 3
+
+
+def _to_str(value: Any) -> str:
+    """Fallback for types the codecs do not handle natively (UUID, datetime, Decimal)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+@dataclass(frozen=True)
+class Codec:
+    id: int
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+@dataclass(frozen=True)
+class Compression:
+    id: int
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+CODECS: Dict[str, Codec] = {
+    "json": Codec(
+        1,
+        "json",
+        lambda value: json.dumps(value, default=str).encode("utf-8"),
+        lambda data: json.loads(data.decode("utf-8")),
+    ),
+}
+if orjson is not None:
+    CODECS["orjson"] = Codec(
+        2,
+        "orjson",
+        lambda value: orjson.dumps(value, default=_to_str, option=orjson.OPT_NON_STR_KEYS),
+        orjson.loads,
+    )
+if msgpack is not None:
+    CODECS["msgpack"] = Codec(
+        3,
+        "msgpack",
+        lambda value: msgpack.packb(value, default=_to_str, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False, strict_map_key=False),
+    )
+
+COMPRESSIONS: Dict[str, Compression] = {
+    "none": Compression(0, "none", lambda data: data, lambda data: data),
+}
+if zstandard is not None:
+    COMPRESSIONS["zstd"] = Compression(
+        1,
+        "zstd",
+        lambda data: zstandard.ZstdCompressor(level=3).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+if lz4_frame is not None:
+    COMPRESSIONS["lz4"] = Compression(2, "lz4", lz4_frame.compress, lz4_frame.decompress)
+
+CODECS_BY_ID = {codec.id: codec for codec in CODECS.values()}
+COMPRESSIONS_BY_ID = {compression.id: compression for compression in COMPRESSIONS.values()}
+
+
+class PayloadCodec:
+    """Encodes cache values with a codec, compressing payloads above a size threshold."""
+
+    def __init__(self, codec: str = "json", compression: str = "none", compression_threshold: int = 1024):
+        """
+        Args:
+            codec: "json", "orjson" or "msgpack"
+            compression: "none", "zstd" or "lz4"
+            compression_threshold: Only compress payloads at least this many bytes long
+        """
+        if codec not in CODECS:
+            logger.warning(f"Cache codec '{codec}' is not available; using json")
+            codec = "json"
+        if compression not in COMPRESSIONS:
+            logger.warning(f"Cache compression '{compression}' is not available; not compressing")
+            compression = "none"
+        self.codec = CODECS[codec]
+        self.compression = COMPRESSIONS[compression]
+        self.compression_threshold = compression_threshold
+
+    def encode(self, value: Any) -> bytes:
+        payload = self.codec.dumps(value)
+        compression = COMPRESSIONS["none"]
+        if self.compression.id and len(payload) >= self.compression_threshold:
+            compression = self.compression
+            payload = compression.compress(payload)
+        if self.codec.name == "json" and not compression.id:
+            return payload  # Headerless, readable by pre-codec workers
+        return HEADER_MAGIC + bytes((self.codec.id, compression.id)) + payload
+
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        """Decode any supported format, whatever this instance writes."""
+        if not data.startswith(HEADER_MAGIC):
+            return CODECS["json"].loads(data)
+        codec = CODECS_BY_ID.get(data[1])
+        compression = COMPRESSIONS_BY_ID.get(data[2])
+        if codec is None or compression is None:
+            raise ValueError(f"Unsupported cache payload format ({data[1]}, {data[2]})")
+        return codec.loads(compression.decompress(data[HEADER_SIZE:]))
+
+
+def get_payload_codec(
+    codec: Optional[str] = None,
+    compression: Optional[str] = None,
+    compression_threshold: Optional[int] = None,
+) -> PayloadCodec:
+    """PayloadCodec configured from settings, with optional overrides."""
+    return PayloadCodec(
+        codec or settings.CACHE_CODEC,
+        compression or settings.CACHE_COMPRESSION,
+        settings.CACHE_COMPRESSION_THRESHOLD if compression_threshold is None else compression_threshold,
+    )
@@ -0,0 +1,228 @@
+"""
+Pre-populate the catalog response cache (see app/utils/response_cache.py).
+
+After a deploy or a Redis flush every catalog entry is cold and the first
+wave of traffic lands on Postgres. Warming renders the hot responses ahead of
+it: featured and top-rated dishes, the cuisine, mood and FAQ lists, menu
+categories and the first pages of the dish listing. Endpoints are called
+directly with a synthetic request for the same path and query a client sends,
+so the entries land under the keys real requests look up.
+
+Runs as the `warm_catalog_cache` Celery task (enqueued on API startup and
+after fixture imports) or from the command line:
+
+    python -m app.utils.cache_warming
+    python -m app.utils.cache_warming --pages 10 --concurrency 8 --invalidate
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+from starlette.requests import Request
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.api.v1.endpoints import cuisines, dishes, faq, menu, moods
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.schemas.dish import DishFilterParams
+from app.schemas.pagination import PaginationParams
+from app.services.cache_service import CacheService, get_cache_service
+from app.utils.response_cache import REQUEST_PARAM, response_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Prefix the user routers are mounted under (main.py + app/api/v1/api.py)
+API_PREFIX = "/api/v1"
+
+# Namespaces bumped by --invalidate, for writes that bypassed the admin API
+CATALOG_NAMESPACES = (
+    "dish:list",
+    "dish:featured",
+    "dish:top-rated",
+    "restaurant:list",
+    "cuisine:list",
+    "mood:list",
+    "faq:list",
+)
+
+
+@dataclass
+class WarmTarget:
+    """One cached response: the endpoint, the request it answers and its arguments."""
+
+    endpoint: Callable[..., Awaitable[Any]]
+    namespaces: tuple
+    path: str
+    query: Dict[str, Any] = field(default_factory=dict)
+    session_param: str = "session"
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def request(self) -> Request:
+        return Request({
+            "type": "http",
+            "method": "GET",
+            "path": self.path,
+            "query_string": urlencode(self.query).encode("latin-1"),
+            "headers": [],
+        })
+
+
+def catalog_targets(pages: int) -> List[WarmTarget]:
+    """Hot catalog responses; the dish listing is warmed for its first `pages` pages."""
+    page_size = PaginationParams().limit
+    targets = [
+        WarmTarget(
+            dishes.list_dishes,
+            ("dish:list", "mood:list"),
+            f"{API_PREFIX}{dishes.router.prefix}/",
+            # The first page is usually requested without a query string
+            query={"limit": page_size, "offset": page * page_size} if page else {},
+            kwargs={"params": PaginationParams(offset=page * page_size), "filters": DishFilterParams()},
+        )
+        for page in range(pages)
+    ]
+    targets += [
+        WarmTarget(
+            dishes.featured_dishes,
+            ("dish:featured", "mood:list"),
+            f"{API_PREFIX}{dishes.router.prefix}/featured",
+            kwargs={"limit": 10},
+        ),
+        WarmTarget(
+            dishes.top_rated_dishes,
+            ("dish:top-rated", "mood:list"),
+            f"{API_PREFIX}{dishes.router.prefix}/top-rated",
+            kwargs={"limit": 10},
+        ),
+        WarmTarget(
+            cuisines.list_cuisines,
+            ("cuisine:list",),
+            f"{API_PREFIX}{cuisines.router.prefix}/",
+            kwargs={"params": PaginationParams()},
+        ),
+        WarmTarget(
+            moods.list_moods,
+            ("mood:list",),
+            f"{API_PREFIX}{moods.router.prefix}/",
+            kwargs={"params": PaginationParams()},
+        ),
+        WarmTarget(
+            menu.list_menu_categories,
+            ("restaurant:list", "dish:list"),
+            f"{API_PREFIX}{menu.router.prefix}/categories",
+        ),
+        WarmTarget(
+            faq.get_all_faqs,
+            ("faq:list",),
+            f"{API_PREFIX}/faqs/",
+            session_param="db",
+            kwargs={"skip": 0, "limit": 100, "category": None},
+        ),
+    ]
+    return targets
+
+
+async def _warm_target(target: WarmTarget, cache: CacheService, semaphore: asyncio.Semaphore) -> str:
+    """Render one target unless it is already cached; returns its outcome."""
+    async with semaphore:
+        request = target.request()
+        key = await response_cache_key(cache, target.namespaces, request)
+        if await cache.exists(key):
+            return "cached"
+        try:
+            async with AsyncSessionLocal() as session:
+                await target.endpoint(
+                    **target.kwargs,
+                    **{target.session_param: session, REQUEST_PARAM: request},
+                )
+        except Exception as e:
+            logger.warning(f"Cache warming failed for {target.path}: {str(e)}")
+            return "failed"
+        # Error responses are not cached, so a missing key means a failed render
+        return "warmed" if await cache.exists(key) else "failed"
+
+
+async def warm_catalog_cache(
+    pages: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    invalidate: bool = False,
+) -> Dict[str, Any]:
+    """
+    Render and cache the hot catalog responses.
+
+    Args:
+        pages: Dish listing pages to warm (default: CACHE_WARM_PAGES)
+        concurrency: Responses rendered at once, bounding DB load
+            (default: CACHE_WARM_CONCURRENCY)
+        invalidate: Retire existing catalog entries first; use after bulk
+            writes that did not go through the admin API
+
+    Returns:
+        Counts of warmed, already cached and failed keys, and the duration
+    """
+    started = time.monotonic()
+    if not settings.RESPONSE_CACHE_ENABLED:
+        logger.info("Response cache is disabled; nothing to warm")
+        return {"warmed": 0, "already_cached": 0, "failed": 0, "duration_seconds": 0.0}
+    cache = await get_cache_service()
+    if invalidate:
+        await cache.bump_namespaces(*CATALOG_NAMESPACES)
+        await cache.reset_id_filters()
+
+    targets = catalog_targets(settings.CACHE_WARM_PAGES if pages is None else pages)
+    semaphore = asyncio.Semaphore(concurrency or settings.CACHE_WARM_CONCURRENCY)
+    outcomes = await asyncio.gather(*(_warm_target(target, cache, semaphore) for target in targets))
+
+    report = {
+        "warmed": outcomes.count("warmed"),
+        "already_cached": outcomes.count("cached"),
+        "failed": outcomes.count("failed"),
+        "duration_seconds": round(time.monotonic() - started, 3),
+    }
+    logger.info(
+        f"Warmed {report['warmed']} catalog cache keys in {report['duration_seconds']}s "
+        f"({report['already_cached']} already cached, {report['failed']} failed)"
+    )
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pre-populate the catalog response cache.")
+    parser.add_argument("--pages", type=int, default=settings.CACHE_WARM_PAGES, help="Dish listing pages to warm")
+    parser.add_argument("--concurrency", type=int, default=settings.CACHE_WARM_CONCURRENCY, help="Responses rendered at once")
+    parser.add_argument("--invalidate", action="store_true", help="Retire existing catalog entries first")
+    return parser.parse_args()
+
+
+def main():
+    import app.models  # noqa: F401  (register every model before merging metadata)
+    from app.core.database import merge_metadata
+    from app.services.cache_service import close_cache_service
+
+    args = parse_args()
+    merge_metadata()
+
+    async def run():
+        try:
+            return await warm_catalog_cache(args.pages, args.concurrency, args.invalidate)
+        finally:
+            await close_cache_service()
+
+    report = asyncio.run(run())
+    print(
+        f"🔥 Warmed {report['warmed']} keys in {report['duration_seconds']}s "
+        f"({report['already_cached']} already cached, {report['failed']} failed)"
+    )
+    sys.exit(1 if report["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+HTTP response caching with ETag / If-None-Match for read-only catalog endpoints.
+
+`cached_response` wraps a GET endpoint: the rendered response body is stored in
+CacheService under the generations of the invalidation namespaces it depends on
+(so `invalidate_dish`, `invalidate_cuisine`, ... retire it), and served with a
+strong ETag and Cache-Control header. A request whose If-None-Match matches the
+cached ETag gets a 304 without the endpoint running, so no query is issued.
+
+Hot responses do not expire under load: they are refreshed in the background
+shortly before they expire (probabilistic early expiration) and served stale
+for a short while after. Since a background refresh can outlive the request,
+the endpoint is rendered with database sessions of its own rather than the
+request's, which FastAPI closes once the response is sent.
+
+The decorator sits below the route decorator, so router dependencies such as
+authentication still run before anything is served from cache:
+
+    @router.get("/")
+    @cached_response("cuisine:list")
+    async def list_cuisines(...): ...
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+from contextlib import AsyncExitStack
+from typing import Any, Dict, Optional, Sequence, get_type_hints
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.services.cache_service import CacheService, get_cache_service
+
+logger = logging.getLogger(__name__)
+
+# Injected into endpoints that do not already take the Request
+REQUEST_PARAM = "_response_cache_request"
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag of a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for it)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+async def response_cache_key(
+    cache: CacheService,
+    namespaces: Sequence[str],
+    request: Request,
+    vary: Sequence[str] = (),
+) -> str:
+    """
+    Cache key of a request: path, sorted query parameters and the `vary`
+    headers, under the current generation of every namespace.
+    """
+    generations = [str(await cache.namespace_generation(namespace)) for namespace in namespaces]
+    parts = [request.url.path, *sorted(request.query_params.multi_items())]
+    parts.extend((header, request.headers.get(header, "")) for header in vary)
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f"{namespaces[0]}:v{'.'.join(generations)}:response:{digest}"
+
+
+def _render(response: Any) -> Response:
+    """Endpoints may return a model instead of a Response; render it as FastAPI would."""
+    if isinstance(response, Response):
+        return response
+    return JSONResponse(content=jsonable_encoder(response))
+
+
+def _respond(entry: Dict[str, Any], request: Request, cache_control: str) -> Response:
+    headers = {"ETag": entry["etag"], "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), entry["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=entry["body"].encode("utf-8"),
+        media_type=entry["media_type"],
+        headers=headers,
+    )
+
+
+def cached_response(
+    *namespaces: str,
+    ttl: Optional[int] = None,
+    public: bool = False,
+    vary: Sequence[str] = (),
+    stale_ttl: Optional[int] = None,
+    early_expiration: Optional[float] = None,
+):
+    """
+    Cache a GET endpoint's 200 responses and answer conditional requests.
+
+    Args:
+        namespaces: Invalidation namespaces the response depends on
+            (e.g. "dish:list", "mood:list"); bumping any of them retires it
+        ttl: Seconds a response is kept in the cache (default RESPONSE_CACHE_TTL)
+        public: Allow shared caches (CDNs, proxies) to store the response;
+            otherwise it is marked private
+        vary: Request headers that change the response, added to the key
+        stale_ttl: Seconds an expired response is still served while it is
+            refreshed (default RESPONSE_CACHE_STALE_TTL)
+        early_expiration: Early expiration beta, see CacheService.get_or_set
+            (default RESPONSE_CACHE_EARLY_EXPIRATION)
+    """
+    if not namespaces:
+        raise ValueError("cached_response needs at least one invalidation namespace")
+
+    def decorator(func):
+        # FastAPI reads the wrapper's signature; resolve postponed annotations
+        # against the endpoint's module, since the wrapper lives in this one
+        hints = get_type_hints(func, include_extras=True)
+        signature = inspect.signature(func)
+        parameters = [
+            parameter.replace(annotation=hints.get(name, parameter.annotation))
+            for name, parameter in signature.parameters.items()
+        ]
+        request_param = next((p.name for p in parameters if p.annotation is Request), None)
+        session_params = [p.name for p in parameters if p.annotation is AsyncSession]
+        injected = request_param is None
+        if injected:
+            request_param = REQUEST_PARAM
+            parameters.append(
+                inspect.Parameter(request_param, inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+            )
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs.pop(request_param) if injected else kwargs[request_param]
+            if not settings.RESPONSE_CACHE_ENABLED:
+                return await func(*args, **kwargs)
+
+            cache_control = f"{'public' if public else 'private'}, max-age={settings.RESPONSE_CACHE_MAX_AGE}"
+            cache = await get_cache_service()
+            key = await response_cache_key(cache, namespaces, request, vary)
+            outcome: Dict[str, Any] = {}
+
+            async def render():
+                try:
+                    async with AsyncExitStack() as stack:
+                        sessions = {
+                            name: await stack.enter_async_context(AsyncSessionLocal())
+                            for name in session_params
+                        }
+                        response = _render(await func(*args, **{**kwargs, **sessions}))
+                except Exception as e:
+                    outcome["error"] = e
+                    return None
+                outcome["response"] = response
+                if response.status_code != status.HTTP_200_OK:
+                    return None  # Errors are not cached
+                return {
+                    "body": bytes(response.body).decode("utf-8"),
+                    "media_type": response.media_type,
+                    "etag": make_etag(response.body),
+                }
+
+            entry = await cache.get_or_set(
+                key,
+                render,
+                ttl=ttl or settings.RESPONSE_CACHE_TTL,
+                stale_ttl=settings.RESPONSE_CACHE_STALE_TTL if stale_ttl is None else stale_ttl,
+                early_expiration=(
+                    settings.RESPONSE_CACHE_EARLY_EXPIRATION if early_expiration is None else early_expiration
+                ),
+            )
+            if entry is not None:
+                return _respond(entry, request, cache_control)
+            if "error" in outcome:
+                raise outcome["error"]
+            if "response" in outcome:
+                return outcome["response"]
+            # Cache unavailable, or another caller's fetch was not cacheable
+            return await func(*args, **kwargs)
+
+        wrapper.__signature__ = signature.replace(
+            parameters=parameters,
+            return_annotation=hints.get("return", signature.return_annotation),
+        )
+        return wrapper
+
+    return decorator
@@ -0,0 +1,363 @@
+"""
+A compact in-memory prefix index for type-ahead suggestions.
+
+Every indexed entry (a dish, restaurant or cuisine) gets a small integer
+document number. The index keeps a sorted array of the distinct lower-cased
+words of all names, each with a postings array of the documents containing
+it, so a prefix lookup is a bisect into the word array followed by a scan of
+the words sharing the prefix. Per document only the entity id (16 bytes in a
+shared bytearray), the kind (one byte) and the display name are stored.
+
+Updates (upsert/remove) are applied in place and are cheap enough for admin
+writes; removed document numbers are reused.
+
+Memory budget, from `python -m app.utils.suggest_index --dishes 100000`
+(100k synthetic dishes, 5k restaurants and 40 cuisines; ~12.4k distinct
+words; CPython 3.11):
+
+    names     8.1 MiB   display names, the bulk of the index
+    postings  2.4 MiB   one uint32 per (word, document) pair
+    ids       1.9 MiB   packed 16-byte ids and 1-byte kinds
+    words     0.8 MiB   sorted distinct words
+    total    13.2 MiB   per worker; lookups p50 0.3 ms, p99 0.7 ms
+
+Memory grows linearly with entries (~130 bytes each), so 1M dishes stay
+around 130 MiB per worker.
+"""
+
+import argparse
+import bisect
+import heapq
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from array import array
+from typing import Dict, Generator, Iterable, List, Optional, Set, Tuple
+
+# Entry kinds, stored as one byte per document
+KINDS = ("dish", "restaurant", "cuisine")
+_KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+# Documents scored per lookup, and words whose postings are read; bound the
+# work for one- or two-letter prefixes
+MAX_CANDIDATES = 500
+MAX_PREFIX_WORDS = 100
+
+# Entries (and words) per step of build_steps: ~10 ms steps for the synthetic
+# 100k-dish catalog, the longest (sorting the word list) ~25 ms
+BUILD_STEP_SIZE = 1000
+
+_WORD_RE = re.compile(r"\w+")
+_ID_SIZE = 16
+
+
+def index_words(text: str) -> List[str]:
+    """Distinct lower-cased words of a name, in order of appearance."""
+    return list(dict.fromkeys(_WORD_RE.findall(text.lower())))
+
+
+class SuggestIndex:
+    """Prefix index over entity names, holding ids and names only."""
+
+    def __init__(self):
+        self._words: List[str] = []  # sorted
+        self._postings: List[array] = []  # document numbers per word, shortest name first
+        self._ids = bytearray()  # 16-byte entity id per document
+        self._kinds = array("B")
+        self._names: List[Optional[str]] = []  # None for removed documents
+        self._free: List[int] = []
+        self.ready = False
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, uuid.UUID, str]]) -> "SuggestIndex":
+        """Bulk-build an index from (kind, id, name) entries."""
+        steps = cls.build_steps(entries)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+
+    @classmethod
+    def build_steps(
+        cls,
+        entries: Iterable[Tuple[str, uuid.UUID, str]],
+        step_size: int = BUILD_STEP_SIZE,
+    ) -> Generator[None, None, "SuggestIndex"]:
+        """
+        `build` in steps: yields after every `step_size` entries and sorted
+        words, so an event loop can run between steps, and returns the index.
+        """
+        index = cls()
+        postings: Dict[str, array] = {}
+        for position, (kind, entity_id, name) in enumerate(entries, 1):
+            doc = index._new_doc(kind, entity_id, name)
+            for word in index_words(name):
+                postings.setdefault(word, array("I")).append(doc)
+            if position % step_size == 0:
+                yield
+        # Documents were numbered in order, so a stable sort on name length
+        # gives the (length, document) order that _add_posting maintains
+        lengths = [len(name) for name in index._names]
+        index._words = sorted(postings)
+        for position, word in enumerate(index._words, 1):
+            index._postings.append(array("I", sorted(postings[word], key=lengths.__getitem__)))
+            if position % step_size == 0:
+                yield
+        index.ready = True
+        return index
+
+    def __len__(self) -> int:
+        return len(self._names) - len(self._free)
+
+    def _new_doc(self, kind: str, entity_id: uuid.UUID, name: str) -> int:
+        if self._free:
+            doc = self._free.pop()
+            self._ids[doc * _ID_SIZE:(doc + 1) * _ID_SIZE] = entity_id.bytes
+            self._kinds[doc] = _KIND_CODES[kind]
+            self._names[doc] = name
+            return doc
+        self._ids += entity_id.bytes
+        self._kinds.append(_KIND_CODES[kind])
+        self._names.append(name)
+        return len(self._names) - 1
+
+    def _doc_order(self, doc: int) -> Tuple[int, int]:
+        return len(self._names[doc]), doc
+
+    def _find_doc(self, kind: str, entity_id: uuid.UUID) -> Optional[int]:
+        # A scan of the packed ids (~1.6 MB for 100k entries) instead of an
+        # id -> document dict, which would cost more than the index itself
+        needle = entity_id.bytes
+        start = self._ids.find(needle)
+        while start != -1:
+            doc, offset = divmod(start, _ID_SIZE)
+            if not offset and self._names[doc] is not None and self._kinds[doc] == _KIND_CODES[kind]:
+                return doc
+            start = self._ids.find(needle, start + 1)
+        return None
+
+    def _add_posting(self, word: str, doc: int) -> None:
+        position = bisect.bisect_left(self._words, word)
+        if position < len(self._words) and self._words[position] == word:
+            postings = self._postings[position]
+            postings.insert(bisect.bisect_left(postings, self._doc_order(doc), key=self._doc_order), doc)
+        else:
+            self._words.insert(position, word)
+            self._postings.insert(position, array("I", [doc]))
+
+    def _remove_posting(self, word: str, doc: int) -> None:
+        position = bisect.bisect_left(self._words, word)
+        if position == len(self._words) or self._words[position] != word:
+            return
+        postings = self._postings[position]
+        postings.remove(doc)
+        if not postings:
+            del self._words[position]
+            del self._postings[position]
+
+    def upsert(self, kind: str, entity_id: uuid.UUID, name: str) -> None:
+        """Add an entry, or re-index it under a new name."""
+        doc = self._find_doc(kind, entity_id)
+        if doc is not None:
+            if self._names[doc] == name:
+                return
+            self.remove(kind, entity_id)
+        doc = self._new_doc(kind, entity_id, name)
+        for word in index_words(name):
+            self._add_posting(word, doc)
+
+    def remove(self, kind: str, entity_id: uuid.UUID) -> None:
+        """Drop an entry; unknown entries are ignored."""
+        doc = self._find_doc(kind, entity_id)
+        if doc is None:
+            return
+        for word in index_words(self._names[doc]):
+            self._remove_posting(word, doc)
+        self._names[doc] = None
+        self._free.append(doc)
+
+    def _prefix_docs(self, prefix: str, limit: int, codes: Optional[Set[int]] = None) -> List[int]:
+        """
+        About `limit` documents with a word starting with `prefix`: the ones
+        with the shortest names from each matching word, only of the kinds in
+        `codes` if given (filtered before the cut, so a rare kind is not
+        crowded out by many entries of another sharing the word).
+        """
+        start = bisect.bisect_left(self._words, prefix)
+        end = bisect.bisect_left(self._words, prefix + "\U0010ffff", lo=start)
+        end = min(end, start + MAX_PREFIX_WORDS)
+        if start == end:
+            return []
+        per_word = max(limit // (end - start), 1)
+        docs: Dict[int, None] = {}
+        for postings in self._postings[start:end]:
+            if codes is None:
+                docs.update(dict.fromkeys(postings[:per_word]))
+                continue
+            taken = 0
+            for doc in postings:
+                if self._kinds[doc] in codes:
+                    docs[doc] = None
+                    taken += 1
+                    if taken == per_word:
+                        break
+        return list(docs)
+
+    def _word_postings(self, word: str) -> Optional[array]:
+        position = bisect.bisect_left(self._words, word)
+        if position < len(self._words) and self._words[position] == word:
+            return self._postings[position]
+        return None
+
+    def suggest(self, query: str, limit: int = 8, kinds: Optional[Iterable[str]] = None) -> List[Dict[str, str]]:
+        """
+        Entries matching the text typed so far: every word but the last must
+        be a word of the name, and the last one the start of a word.
+
+        Names that start with the whole query rank first, then shorter names.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum suggestions
+            kinds: Restrict to these kinds ("dish", "restaurant", "cuisine")
+
+        Returns:
+            {"id", "name", "type"} per suggestion, best first
+        """
+        words = _WORD_RE.findall(query.lower())
+        if not words:
+            return []
+        query = " ".join(words)
+        *complete, partial = words
+        codes = None if kinds is None else {_KIND_CODES[kind] for kind in kinds}
+
+        if complete:
+            # Walk the rarest word's postings (shortest names first) until
+            # enough names also hold the other words
+            postings = [self._word_postings(word) for word in set(complete)]
+            if any(p is None for p in postings):
+                return []
+            postings.sort(key=len)
+            others = [set(p) for p in postings[1:]]
+            candidates = []
+            for doc in postings[0]:
+                if codes is not None and self._kinds[doc] not in codes:
+                    continue
+                name = self._names[doc].lower()
+                if partial not in name or not all(doc in other for other in others):
+                    continue
+                if any(word.startswith(partial) for word in _WORD_RE.findall(name)):
+                    candidates.append(doc)
+                    if len(candidates) >= limit * 4:
+                        break
+        else:
+            candidates = self._prefix_docs(partial, MAX_CANDIDATES, codes)
+
+        ranked = []
+        for doc in candidates:
+            if codes is not None and self._kinds[doc] not in codes:
+                continue
+            name = self._names[doc].lower()
+            ranked.append(((not name.startswith(query), len(name), name), doc))
+
+        return [
+            {
+                "id": str(uuid.UUID(bytes=bytes(self._ids[doc * _ID_SIZE:(doc + 1) * _ID_SIZE]))),
+                "name": self._names[doc],
+                "type": KINDS[self._kinds[doc]],
+            }
+            for _, doc in heapq.nsmallest(limit, ranked)
+        ]
+
+    def memory_report(self) -> Dict[str, int]:
+        """Approximate bytes held per component (object overhead included)."""
+        names = sys.getsizeof(self._names) + sum(sys.getsizeof(name) for name in self._names if name)
+        words = sys.getsizeof(self._words) + sum(sys.getsizeof(word) for word in self._words)
+        postings = sys.getsizeof(self._postings) + sum(sys.getsizeof(p) for p in self._postings)
+        ids = sys.getsizeof(self._ids) + sys.getsizeof(self._kinds) + sys.getsizeof(self._free)
+        return {
+            "entries": len(self),
+            "words": len(self._words),
+            "names_bytes": names,
+            "words_bytes": words,
+            "postings_bytes": postings,
+            "ids_bytes": ids,
+            "total_bytes": names + words + postings + ids,
+        }
+
+
+_SYNTHETIC_WORDS = (
+    "chicken paneer butter masala tikka biryani dal makhani naan garlic aloo gobi palak "
+    "samosa chana kebab tandoori korma vindaloo rogan josh fish curry prawn mutton egg "
+    "fried rice noodles manchurian chilli spring roll momo soup salad pizza margherita "
+    "pepperoni pasta alfredo arrabiata lasagna burger cheese veg grilled sandwich club "
+    "wrap falafel hummus shawarma taco burrito nachos sushi ramen teriyaki katsu pad thai "
+    "green red yellow spicy sweet sour crispy smoky honey lemon mango coconut mint pudding "
+    "kulfi gulab jamun rasmalai brownie cheesecake tiramisu waffle pancake lassi coffee tea"
+).split()
+
+
+def _synthetic_entries(dishes: int, seed: int = 7) -> List[Tuple[str, uuid.UUID, str]]:
+    """Menu-like names: common food words, plus a rarer word (house names, regional dishes) in half of them."""
+    rng = random.Random(seed)
+    syllables = ["ka", "ri", "sha", "mo", "lu", "de", "pa", "ni", "zo", "ta", "ve", "gu", "bhi", "cho", "ran"]
+    rare_words = list({"".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(30_000)})
+
+    def name(words: int) -> str:
+        parts = [rng.choice(_SYNTHETIC_WORDS) for _ in range(words)]
+        if rng.random() < 0.5:
+            parts.insert(0, rng.choice(rare_words))
+        return " ".join(parts).title()
+
+    entries = [("cuisine", uuid.UUID(int=rng.getrandbits(128)), rng.choice(_SYNTHETIC_WORDS).title()) for _ in range(40)]
+    entries += [("restaurant", uuid.UUID(int=rng.getrandbits(128)), name(2)) for _ in range(dishes // 20)]
+    entries += [("dish", uuid.UUID(int=rng.getrandbits(128)), name(rng.randint(2, 4))) for _ in range(dishes)]
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory and latency report of a synthetic suggest index.")
+    parser.add_argument("--dishes", type=int, default=100_000, help="Synthetic dishes to index")
+    args = parser.parse_args()
+
+    entries = _synthetic_entries(args.dishes)
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = SuggestIndex.build(entries)
+    build_seconds = time.perf_counter() - started
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rng = random.Random(11)
+    # Prefixes of one to six letters and "word par" queries, taken from indexed names
+    names = [entry[2].lower().split() for entry in rng.sample(entries, 1000)]
+    queries = [words[0][:rng.randint(1, 6)] for words in names[:500]]
+    queries += [f"{words[0]} {words[1][:3]}" for words in names[500:]]
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        index.suggest(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+
+    report = index.memory_report()
+    mib = 1024 * 1024
+    print(f"Entries: {report['entries']} ({args.dishes} dishes), distinct words: {report['words']}")
+    print(f"Index size: {report['total_bytes'] / mib:.1f} MiB, built in {build_seconds:.2f}s")
+    for part in ("names", "words", "postings", "ids"):
+        print(f"  {part:<9} {report[f'{part}_bytes'] / mib:6.1f} MiB")
+    # Name strings are shared with `entries`, so tracemalloc does not see them
+    print(f"Allocated by the build, names excluded: {allocated / mib:.1f} MiB (tracemalloc)")
+    print(
+        f"Lookup latency over {len(latencies)} queries: p50 {statistics.median(latencies):.3f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)]:.3f} ms, max {latencies[-1]:.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
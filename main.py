@@ -1,8 +1,9 @@
+import asyncio
 from contextlib import asynccontextmanager
 import json
 
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
@@ -12,11 +13,16 @@ from app.api.v1 import api_router
 from app.core.config import settings
 from app.core.database import engine, merge_metadata
 from app.core.deps import validate_client_headers
+from app.core.metrics import render_metrics, set_l1_entries
 from app.core.response_handler import (
     BaseAPIException,
     handle_exception,
     error_response
 )
+from app.services.cache_service import close_cache_service, get_cache_service
+from app.services.id_filter_service import run_id_filter_refresher
+from app.services.suggest_service import run_suggest_index_refresher
+from app.tasks.cache_tasks import schedule_cache_warm
 # Import all models to ensure they're registered before merging metadata
 from app.models import *  # noqa: F401, F403
 
@@ -28,9 +34,21 @@ async def lifespan(app: FastAPI):
     # Merge Base.metadata into SQLModel.metadata for runtime foreign key resolution
     # This allows SQLModel models (like Review) to reference Base models (like Dish)
     merge_metadata()
+    if settings.CACHE_WARM_ON_STARTUP:
+        await schedule_cache_warm(await get_cache_service())
+    id_filter_refresher = None
+    if settings.ID_FILTER_ENABLED:
+        id_filter_refresher = asyncio.create_task(run_id_filter_refresher(await get_cache_service()))
+    suggest_index_refresher = None
+    if settings.SUGGEST_INDEX_ENABLED:
+        suggest_index_refresher = asyncio.create_task(run_suggest_index_refresher(await get_cache_service()))
     print("✅ FastAPI application started")
     yield
     # Shutdown
+    for refresher in (id_filter_refresher, suggest_index_refresher):
+        if refresher is not None:
+            refresher.cancel()
+    await close_cache_service()
     print("✅ FastAPI application shutdown")
 
 
@@ -268,6 +286,17 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics of this process (cache hit ratios, latencies, payload sizes)."""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    cache = await get_cache_service()
+    set_l1_entries(cache.get_stats()["l1_entries"])
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/api-info")
 async def api_info():
     """Get detailed API information"""
@@ -29,6 +29,9 @@ from app.models.food import Allergy, Cuisine, Dish, Mood, Restaurant
 from app.models.promotion import Promotion
 from app.models.user import ProfileStatus, User, UserRole
 from app.models.membership import BillingCycle, MembershipPlan, Subscription
+from app.services.cache_service import CacheService
+from app.tasks.cache_tasks import schedule_cache_warm
+from app.utils.cache_warming import CATALOG_NAMESPACES
 
 FIXTURES_ROOT = Path(__file__).parent / "fixtures"
 DISH_FIXTURES_DIR = FIXTURES_ROOT / "dishes"
@@ -914,6 +917,17 @@ async def seed_database():
             print("=" * 50)
             print("\n✅ Database seeding completed successfully!")
             
+            # Fixtures are written without going through the admin API, so
+            # retire cached catalog responses and id filters here (a warm-up
+            # task may never run without a worker), then re-warm them
+            cache = CacheService(local_cache=False)
+            try:
+                await cache.bump_namespaces(*CATALOG_NAMESPACES)
+                await cache.reset_id_filters()
+                await schedule_cache_warm(cache)
+            finally:
+                await cache.close()
+            
         except Exception as e:
             await db.rollback()
             print(f"\n❌ Error during seeding: {str(e)}")
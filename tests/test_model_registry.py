@@ -0,0 +1,27 @@
+"""
+Tests for the model registry's memory-mapped forest format.
+"""
+import numpy as np
+import pytest
+
+from app.ai.model_registry import FlatForest, ModelRegistry
+
+ensemble = pytest.importorskip("sklearn.ensemble")
+
+
+def test_published_forest_predicts_like_sklearn_from_mapped_arrays(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(500, 6))
+    y = (X[:, 0] + X[:, 1] ** 2 + rng.normal(scale=0.5, size=500) > 1).astype(int)
+    X[rng.random(X.shape) < 0.05] = np.nan
+    model = ensemble.RandomForestClassifier(n_estimators=20, max_depth=8, random_state=0).fit(X, y)
+
+    registry = ModelRegistry(str(tmp_path))
+    version = registry.publish(model)
+    served = registry.load(version)
+
+    assert isinstance(served, FlatForest)
+    assert isinstance(served.children_left, np.memmap)
+    np.testing.assert_allclose(served.predict_proba(X), model.predict_proba(X))
+    # The full model is still available for incremental training
+    assert isinstance(registry.load(version, mmap_mode=None), ensemble.RandomForestClassifier)
@@ -0,0 +1,96 @@
+"""
+Query-count regression test for /recommendations/dishes.
+
+The candidate query joins cuisine and restaurant names in SQL, so the number
+of statements per request must not grow with the size of the catalog.
+"""
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from app.ai.benchmark import (
+    QueryCounter,
+    SyntheticData,
+    generate_catalog,
+    generate_users_and_interactions,
+)
+from app.api.v1.endpoints import recommendations
+from app.core.database import get_db, merge_metadata
+from app.models.user import User
+from app.utils.auth import get_current_user
+
+CATALOG_SIZES = (50, 500)
+
+
+class MissingCache:
+    """Cache stand-in that never holds an entry, so every request scores live."""
+
+    async def get(self, key):
+        return None
+
+    async def set(self, key, value, ttl=None):
+        return True
+
+    async def set_if_absent(self, key, ttl):
+        return True
+
+    async def delete(self, key):
+        return True
+
+
+async def count_request_statements(n_dishes: int, monkeypatch) -> int:
+    """Seed `n_dishes` dishes and count the statements of one recommendations request."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_dir}/recommendations.db")
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+        rng = np.random.default_rng(7)
+        data = SyntheticData()
+        args = SimpleNamespace(users=3, interactions_per_user=20, days=30, holdout_days=0)
+        async with session_factory() as session:
+            await generate_catalog(session, data, n_dishes, rng, run_tag=str(n_dishes))
+            await generate_users_and_interactions(session, data, args, rng)
+            await session.commit()
+            user = (await session.execute(select(User).where(User.id == data.user_ids[0]))).scalar_one()
+
+        async def override_get_db():
+            async with session_factory() as session:
+                yield session
+
+        async def no_cache():
+            return MissingCache()
+
+        app = FastAPI()
+        app.include_router(recommendations.router)
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_current_user] = lambda: user
+        monkeypatch.setattr(recommendations, "get_cache_service", no_cache)
+
+        counter = QueryCounter(engine)
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/recommendations/dishes", params={"limit": 10})
+        finally:
+            await engine.dispose()
+
+        assert response.status_code == 200, response.text
+        assert response.json()["recommendations"]
+        return counter.count
+
+
+@pytest.mark.asyncio
+async def test_recommendation_statements_do_not_grow_with_catalog(monkeypatch):
+    merge_metadata()
+    counts = [await count_request_statements(n_dishes, monkeypatch) for n_dishes in CATALOG_SIZES]
+
+    assert counts[0] > 0
+    assert counts[0] == counts[1], f"statements per request grew with the catalog: {counts}"
@@ -0,0 +1,34 @@
+"""
+Tests for the type-ahead SuggestIndex.
+"""
+import uuid
+
+from app.utils.suggest_index import SuggestIndex
+
+
+def test_kind_filter_is_applied_before_the_candidate_cut():
+    entries = [("dish", uuid.uuid4(), f"Garden {i}") for i in range(2000)]
+    bistro_id = uuid.uuid4()
+    entries.append(("restaurant", bistro_id, "Garden Bistro"))
+    index = SuggestIndex.build(entries)
+
+    assert index.suggest("garden", 8, ["restaurant"]) == [
+        {"id": str(bistro_id), "name": "Garden Bistro", "type": "restaurant"}
+    ]
+    assert [item["type"] for item in index.suggest("garden", 8)] == ["dish"] * 8
+
+
+def test_build_steps_builds_the_same_index():
+    entries = [("dish", uuid.uuid4(), f"Paneer Tikka {i}") for i in range(50)]
+    steps = SuggestIndex.build_steps(entries, step_size=7)
+    yielded = 0
+    while True:
+        try:
+            next(steps)
+            yielded += 1
+        except StopIteration as done:
+            stepped = done.value
+            break
+
+    assert yielded > 1
+    assert stepped.suggest("tik", 5) == SuggestIndex.build(entries).suggest("tik", 5)